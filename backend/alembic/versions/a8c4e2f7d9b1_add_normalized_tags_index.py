@@ -0,0 +1,45 @@
+"""add normalized tags GIN index to jobs
+
+Revision ID: a8c4e2f7d9b1
+Revises: f3a6d8e1b4c2
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e2f7d9b1'
+down_revision: Union[str, Sequence[str], None] = 'f3a6d8e1b4c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite filters tags through json_each() and needs no schema change.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE OR REPLACE FUNCTION jobs_tags_lower(tags text[]) RETURNS text[] "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT ARRAY(SELECT lower(btrim(tag)) FROM unnest(tags) AS tag) $$"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_tags_lower "
+            "ON jobs USING gin (jobs_tags_lower(tags))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_tags_lower")
+    op.execute("DROP FUNCTION IF EXISTS jobs_tags_lower(text[])")
@@ -0,0 +1,51 @@
+"""add excerpt to jobs
+
+Revision ID: b5d1f9a3c7e8
+Revises: a8c4e2f7d9b1
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d1f9a3c7e8'
+down_revision: Union[str, Sequence[str], None] = 'a8c4e2f7d9b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('excerpt', sa.Text(), nullable=True))
+
+    # Backfill existing rows; new rows get text_cleaner.make_excerpt() at ingest.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(r"""
+            UPDATE jobs
+            SET excerpt = CASE
+                WHEN length(src.flat) <= 280 THEN src.flat
+                ELSE rtrim(regexp_replace(left(src.flat, 281), '\s+\S*$', ''), ' ,.;:-') || '…'
+            END
+            FROM (
+                SELECT id, btrim(regexp_replace(description, '\s+', ' ', 'g')) AS flat
+                FROM jobs
+                WHERE description IS NOT NULL
+            ) AS src
+            WHERE jobs.id = src.id
+        """)
+    else:
+        op.execute(
+            "UPDATE jobs SET excerpt = CASE "
+            "WHEN length(description) <= 280 THEN description "
+            "ELSE substr(description, 1, 280) || '…' END "
+            "WHERE description IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs', 'excerpt')
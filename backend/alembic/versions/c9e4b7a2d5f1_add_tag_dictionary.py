@@ -0,0 +1,160 @@
+"""add tag dictionary and job_tags
+
+Revision ID: c9e4b7a2d5f1
+Revises: b5d1f9a3c7e8
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e4b7a2d5f1'
+down_revision: Union[str, Sequence[str], None] = 'b5d1f9a3c7e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of tag_dictionary.TAG_ALIASES at the time of this migration.
+TAG_SYNONYMS = {
+    "js": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "k8s": "kubernetes",
+    "csharp": "c#",
+    "c sharp": "c#",
+    "cpp": "c++",
+    "dotnet": ".net",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+}
+
+
+def _jobs_is_partitioned() -> bool:
+    # Partitioned indexes can't be created or dropped CONCURRENTLY.
+    return bool(op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_class WHERE oid = 'jobs'::regclass AND relkind = 'p'"
+    )).scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # Tag filters go through job_tags now; the jobs_tags_lower() GIN index
+        # added in a8c4e2f7d9b1 only costs writes.
+        concurrently = "" if _jobs_is_partitioned() else "CONCURRENTLY "
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX {concurrently}IF EXISTS ix_jobs_tags_lower")
+        op.execute("DROP FUNCTION IF EXISTS jobs_tags_lower(text[])")
+
+    op.create_table('tags',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('label', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('tag_aliases',
+    sa.Column('alias', sa.String(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('alias')
+    )
+    op.create_index('ix_tag_aliases_tag_id', 'tag_aliases', ['tag_id'], unique=False)
+    op.create_table('job_tags',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'tag_id')
+    )
+    op.create_index('ix_job_tags_tag_id_job_id', 'job_tags', ['tag_id', 'job_id'], unique=False)
+    op.create_index('ix_job_tags_created_at_tag_id', 'job_tags', ['created_at', 'tag_id'], unique=False)
+
+    # Backfill from jobs.tags; new rows are linked at ingest. SQLite databases
+    # are backfilled with `python app/scripts/backfill_job_tags.py`.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    synonyms = ", ".join(
+        f"('{alias}', '{name}')" for alias, name in TAG_SYNONYMS.items()
+    )
+    op.execute(r"""
+        CREATE TEMP TABLE tag_spellings ON COMMIT DROP AS
+        SELECT DISTINCT ON (alias) alias, raw
+        FROM (
+            SELECT btrim(regexp_replace(lower(t.raw), '\s+', ' ', 'g')) AS alias,
+                   regexp_replace(btrim(t.raw), '\s+', ' ', 'g') AS raw
+            FROM jobs CROSS JOIN LATERAL unnest(jobs.tags) AS t(raw)
+        ) AS spellings
+        WHERE alias <> ''
+        ORDER BY alias, raw
+    """)
+    op.execute(f"""
+        CREATE TEMP TABLE tag_synonyms (alias, name) ON COMMIT DROP AS VALUES {synonyms}
+    """)
+    op.execute("""
+        INSERT INTO tags (name, label)
+        SELECT names.name, coalesce(canonical.raw, names.name)
+        FROM (
+            SELECT DISTINCT coalesce(syn.name, sp.alias) AS name
+            FROM tag_spellings sp LEFT JOIN tag_synonyms syn ON syn.alias = sp.alias
+        ) AS names
+        LEFT JOIN tag_spellings canonical ON canonical.alias = names.name
+    """)
+    op.execute("INSERT INTO tag_aliases (alias, tag_id) SELECT name, id FROM tags")
+    op.execute("""
+        INSERT INTO tag_aliases (alias, tag_id)
+        SELECT sp.alias, tags.id
+        FROM tag_spellings sp
+        JOIN tag_synonyms syn ON syn.alias = sp.alias
+        JOIN tags ON tags.name = syn.name
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute(r"""
+        INSERT INTO job_tags (job_id, tag_id, created_at)
+        SELECT DISTINCT j.id, a.tag_id, j.created_at
+        FROM jobs j
+        CROSS JOIN LATERAL unnest(j.tags) AS t(raw)
+        JOIN tag_aliases a ON a.alias = btrim(regexp_replace(lower(t.raw), '\s+', ' ', 'g'))
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_tags_created_at_tag_id', table_name='job_tags')
+    op.drop_index('ix_job_tags_tag_id_job_id', table_name='job_tags')
+    op.drop_table('job_tags')
+    op.drop_index('ix_tag_aliases_tag_id', table_name='tag_aliases')
+    op.drop_table('tag_aliases')
+    op.drop_table('tags')
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE OR REPLACE FUNCTION jobs_tags_lower(tags text[]) RETURNS text[] "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT ARRAY(SELECT lower(btrim(tag)) FROM unnest(tags) AS tag) $$"
+    )
+    concurrently = "" if _jobs_is_partitioned() else "CONCURRENTLY "
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX {concurrently}IF NOT EXISTS ix_jobs_tags_lower "
+            "ON jobs USING gin (jobs_tags_lower(tags))"
+        )
@@ -0,0 +1,45 @@
+"""add daily analytics rollups
+
+Revision ID: d2f7a9c4e6b8
+Revises: c9e4b7a2d5f1
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7a9c4e6b8'
+down_revision: Union[str, Sequence[str], None] = 'c9e4b7a2d5f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_daily_rollups',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('dimension', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('jobs', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'dimension', 'value')
+    )
+    op.create_index('ix_job_daily_rollups_dimension_day', 'job_daily_rollups', ['dimension', 'day'], unique=False)
+    op.create_table('job_daily_companies',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('company', sa.String(), nullable=False),
+    sa.Column('jobs', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'company')
+    )
+    # Country buckets are derived in Python; populate history with
+    # `python app/scripts/rebuild_rollups.py` after upgrading.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_daily_companies')
+    op.drop_index('ix_job_daily_rollups_dimension_day', table_name='job_daily_rollups')
+    op.drop_table('job_daily_rollups')
@@ -0,0 +1,53 @@
+"""add full-text search vector to jobs
+
+Revision ID: d4e8a1c7f2b3
+Revises: c1a2f5b9e3d1
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8a1c7f2b3'
+down_revision: Union[str, Sequence[str], None] = 'c1a2f5b9e3d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Full-text search is Postgres-only; SQLite keeps the ILIKE fallback.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE OR REPLACE FUNCTION jobs_tags_text(tags text[]) RETURNS text "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT coalesce(array_to_string(tags, ' '), '') $$"
+    )
+    # Adding a stored generated column rewrites the table once.
+    op.execute(
+        "ALTER TABLE jobs ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(company, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, jobs_tags_text(tags)), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'D')"
+        ") STORED"
+    )
+    op.create_index(
+        'ix_jobs_search_vector', 'jobs', ['search_vector'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index('ix_jobs_search_vector', table_name='jobs')
+    op.drop_column('jobs', 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS jobs_tags_text(text[])")
@@ -0,0 +1,45 @@
+"""add tag co-occurrence counts
+
+Revision ID: e5a3c8f1b7d2
+Revises: d2f7a9c4e6b8
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a3c8f1b7d2'
+down_revision: Union[str, Sequence[str], None] = 'd2f7a9c4e6b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('tag_cooccurrences',
+    sa.Column('tag_id', sa.Integer(), nullable=False),
+    sa.Column('other_tag_id', sa.Integer(), nullable=False),
+    sa.Column('jobs', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['other_tag_id'], ['tags.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('tag_id', 'other_tag_id')
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        # job_tags was backfilled by c9e4b7a2d5f1; elsewhere run
+        # `python app/scripts/backfill_job_tags.py` after upgrading.
+        op.execute("""
+            INSERT INTO tag_cooccurrences (tag_id, other_tag_id, jobs)
+            SELECT a.tag_id, b.tag_id, count(*)
+            FROM job_tags a
+            JOIN job_tags b ON b.job_id = a.job_id
+            GROUP BY a.tag_id, b.tag_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('tag_cooccurrences')
@@ -0,0 +1,72 @@
+"""add trigram and lower() indexes to jobs
+
+Revision ID: e7b2c9d4a1f6
+Revises: d4e8a1c7f2b3
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c9d4a1f6'
+down_revision: Union[str, Sequence[str], None] = 'd4e8a1c7f2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _pg_trgm_available(bind) -> bool:
+    return bool(bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    # Dedup lookup in save_jobs_to_db (lower(title) = ? AND lower(company) = ?).
+    lower_title_company = [sa.text('lower(title)'), sa.text('lower(company)')]
+
+    if bind.dialect.name != "postgresql":
+        op.create_index('ix_jobs_lower_title_company', 'jobs', lower_title_company, unique=False)
+        return
+
+    trigram = _pg_trgm_available(bind)
+    if trigram:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    else:
+        logger.warning("pg_trgm is not available on this server; skipping trigram index")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block and
+    # keeps the collector's inserts flowing while the indexes build.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_lower_title_company', 'jobs', lower_title_company, unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        if trigram:
+            # Serves lower(work_modality) LIKE '%...%' in get_jobs and SummaryService.
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_lower_work_modality_trgm "
+                "ON jobs USING gin (lower(work_modality) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        op.drop_index('ix_jobs_lower_title_company', table_name='jobs')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_lower_work_modality_trgm")
+        op.drop_index(
+            'ix_jobs_lower_title_company', table_name='jobs',
+            postgresql_concurrently=True, if_exists=True
+        )
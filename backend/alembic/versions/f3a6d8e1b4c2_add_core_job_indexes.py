@@ -0,0 +1,75 @@
+"""add core secondary indexes to jobs
+
+Revision ID: f3a6d8e1b4c2
+Revises: e7b2c9d4a1f6
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6d8e1b4c2'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c9d4a1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BTREE_INDEXES = [
+    ('ix_jobs_created_at', ['created_at']),
+    ('ix_jobs_source_created_at', ['source', 'created_at']),
+    ('ix_jobs_work_modality_created_at', ['work_modality', 'created_at']),
+    ('ix_jobs_url', ['url']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        for name, columns in BTREE_INDEXES:
+            op.create_index(name, 'jobs', columns, unique=False)
+        op.drop_index('ix_jobs_id', table_name='jobs')
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block and
+    # keeps the collector's inserts flowing while the indexes build.
+    with op.get_context().autocommit_block():
+        for name, columns in BTREE_INDEXES:
+            op.create_index(
+                name, 'jobs', columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True
+            )
+        op.create_index(
+            'ix_jobs_tags', 'jobs', ['tags'], unique=False,
+            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+        # Redundant with the primary key.
+        op.drop_index(
+            'ix_jobs_id', table_name='jobs',
+            postgresql_concurrently=True, if_exists=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        op.create_index('ix_jobs_id', 'jobs', ['id'], unique=False)
+        for name, _ in reversed(BTREE_INDEXES):
+            op.drop_index(name, table_name='jobs')
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_id', 'jobs', ['id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index(
+            'ix_jobs_tags', table_name='jobs',
+            postgresql_concurrently=True, if_exists=True
+        )
+        for name, _ in reversed(BTREE_INDEXES):
+            op.drop_index(
+                name, table_name='jobs',
+                postgresql_concurrently=True, if_exists=True
+            )
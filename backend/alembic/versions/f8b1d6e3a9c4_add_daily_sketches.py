@@ -0,0 +1,35 @@
+"""add daily analytics sketches
+
+Revision ID: f8b1d6e3a9c4
+Revises: e5a3c8f1b7d2
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8b1d6e3a9c4'
+down_revision: Union[str, Sequence[str], None] = 'e5a3c8f1b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_daily_sketches',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('sketch', sa.LargeBinary(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'kind')
+    )
+    # Sketches are built in Python; populate history with
+    # `python app/scripts/rebuild_rollups.py` after upgrading.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_daily_sketches')
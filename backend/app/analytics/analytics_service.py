@@ -0,0 +1,204 @@
+"""
+Analytics answered from the daily rollup tables (app/analytics/rollups.py),
+the daily sketches (app/analytics/daily_sketches.py) and the tag
+co-occurrence counts (app/analytics/cooccurrence.py).
+
+A 90-day or one-year window reads at most a few rows per day and value,
+never the jobs table.
+"""
+import asyncio
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.analytics.daily_sketches import load_sketch
+from app.analytics.related_skills import RELATED_SCORES, RelatedSkillsIndex
+from app.analytics.rollups import ROLLUP_DIMENSIONS, TOTAL_DIMENSION, TOTAL_VALUE
+from app.analytics.sketches import HyperLogLog, SpaceSaving
+from app.analytics.trend_analyzer import TrendAnalyzer
+from app.config import TRENDS_CACHE_TTL
+from app.models.rollup import JobDailyCompany, JobDailyRollup, JobDailySketch
+from app.models.tag import JobTag, Tag, TagCooccurrence
+from app.services.data_version import current_data_version
+from app.services.tag_dictionary import canonical_tag
+from app.services.versioned_cache import VersionedCache
+
+ANALYTICS_DIMENSIONS = (TOTAL_DIMENSION, *ROLLUP_DIMENSIONS)
+
+# Dimensions /analytics/trends can rank: skills (tags) and companies.
+TREND_DIMENSIONS = ("tag", "company")
+
+# Keyed by the trends() arguments; dropped whenever ingestion bumps the data version.
+trends_cache = VersionedCache(max_entries=128, ttl_seconds=TRENDS_CACHE_TTL)
+
+# Keyed by the estimates() arguments, like trends_cache.
+estimates_cache = VersionedCache(max_entries=128, ttl_seconds=TRENDS_CACHE_TTL)
+
+# The in-memory RelatedSkillsIndex, reloaded from tag_cooccurrences after ingestion.
+related_skills_cache = VersionedCache(max_entries=1, ttl_seconds=TRENDS_CACHE_TTL)
+
+
+def window_start(days: int, today: Optional[date] = None) -> date:
+    """First day of a `days`-long window ending today (inclusive)."""
+    return (today or date.today()) - timedelta(days=days - 1)
+
+
+def _check_dimension(dimension: str) -> None:
+    if dimension not in ANALYTICS_DIMENSIONS:
+        raise ValueError(f"Unknown dimension: {dimension}. Use: {', '.join(ANALYTICS_DIMENSIONS)}")
+
+
+class AnalyticsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def top_values(self, dimension: str, days: int, limit: int = 10) -> List[Dict]:
+        """Values of `dimension` with the most jobs over the window."""
+        _check_dimension(dimension)
+        total = func.sum(JobDailyRollup.jobs)
+        rows = await self.db.execute(
+            select(JobDailyRollup.value, total.label("jobs"))
+            .where(JobDailyRollup.dimension == dimension, JobDailyRollup.day >= window_start(days))
+            .group_by(JobDailyRollup.value)
+            .order_by(total.desc(), JobDailyRollup.value)
+            .limit(limit)
+        )
+        return [{"value": value, "jobs": jobs} for value, jobs in rows]
+
+    async def daily_series(self, dimension: str, days: int, values: Optional[List[str]] = None, limit: int = 10) -> Dict:
+        """
+        Jobs per day for each value of `dimension`: the given `values`, or
+        the `limit` biggest over the window. Days without jobs are omitted.
+        """
+        _check_dimension(dimension)
+        if dimension == TOTAL_DIMENSION:
+            values = [TOTAL_VALUE]
+        elif not values:
+            values = [row["value"] for row in await self.top_values(dimension, days, limit)]
+
+        since = window_start(days)
+        series = {value: {"value": value, "jobs": 0, "daily": []} for value in values}
+        if values:
+            rows = await self.db.execute(
+                select(JobDailyRollup.value, JobDailyRollup.day, JobDailyRollup.jobs)
+                .where(
+                    JobDailyRollup.dimension == dimension,
+                    JobDailyRollup.day >= since,
+                    JobDailyRollup.value.in_(values),
+                )
+                .order_by(JobDailyRollup.value, JobDailyRollup.day)
+            )
+            for value, day, jobs in rows:
+                series[value]["jobs"] += jobs
+                series[value]["daily"].append({"day": day, "jobs": jobs})
+        return {"dimension": dimension, "since": since, "days": days, "series": list(series.values())}
+
+    async def company_activity(self, days: int) -> Dict:
+        """Distinct hiring companies per day and over the whole window."""
+        since = window_start(days)
+        in_window = JobDailyCompany.day >= since
+        rows = await self.db.execute(
+            select(JobDailyCompany.day, func.count().label("companies"), func.sum(JobDailyCompany.jobs).label("jobs"))
+            .where(in_window)
+            .group_by(JobDailyCompany.day)
+            .order_by(JobDailyCompany.day)
+        )
+        daily = [{"day": day, "companies": companies, "jobs": jobs} for day, companies, jobs in rows]
+        distinct = await self.db.scalar(
+            select(func.count(func.distinct(JobDailyCompany.company))).where(in_window)
+        )
+        return {"since": since, "days": days, "distinct_companies": distinct or 0, "daily": daily}
+
+    async def estimates(self, days: int, limit: int = 10) -> Dict:
+        """
+        Distinct companies and locations and the top tags over the window,
+        merged from one sketch per day and kind. Distinct counts are within
+        `relative_error` (one standard error); each tag's `jobs` is an upper
+        bound that overcounts by at most its `error`. Cached until the next
+        ingestion.
+        """
+        cache_key = (days, limit)
+        cached = estimates_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = current_data_version()
+        since = window_start(days)
+        rows = (await self.db.execute(
+            select(JobDailySketch.kind, JobDailySketch.sketch).where(JobDailySketch.day >= since)
+        )).all()
+
+        def _merge() -> Dict:
+            sketches = defaultdict(list)
+            for kind, data in rows:
+                sketches[kind].append(load_sketch(kind, data))
+            companies = HyperLogLog.union(sketches["companies"])
+            tags = SpaceSaving.merge_all(sketches["tags"])
+            return {
+                "distinct_companies": companies.estimate(),
+                "distinct_locations": HyperLogLog.union(sketches["locations"]).estimate(),
+                "relative_error": round(companies.relative_error, 4),
+                "top_tags": [
+                    {"value": value, "jobs": jobs, "error": error} for value, jobs, error in tags.top(limit)
+                ],
+            }
+
+        # A year is ~1100 sketches to decode and merge; keep that off the event loop.
+        result = {"since": since, "days": days, **await asyncio.to_thread(_merge)}
+        estimates_cache.set(cache_key, result, version)
+        return result
+
+    async def trends(self, dimension: str = "tag", days: int = 90, limit: int = 10, min_jobs: int = 3) -> Dict:
+        """
+        Risers, fallers and spikes for skills or companies over the window
+        (see TrendAnalyzer.analyze), cached until the next ingestion.
+        """
+        if dimension not in TREND_DIMENSIONS:
+            raise ValueError(f"Unknown trend dimension: {dimension}. Use: {', '.join(TREND_DIMENSIONS)}")
+        cache_key = (dimension, days, limit, min_jobs)
+        cached = trends_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = current_data_version()
+        end = date.today()
+        start = window_start(days, end)
+        if dimension == "tag":
+            query = select(JobDailyRollup.value, JobDailyRollup.day, JobDailyRollup.jobs).where(
+                JobDailyRollup.dimension == "tag", JobDailyRollup.day >= start
+            )
+        else:
+            query = select(JobDailyCompany.company, JobDailyCompany.day, JobDailyCompany.jobs).where(
+                JobDailyCompany.day >= start
+            )
+        rows = (await self.db.execute(query)).all()
+
+        def _analyze() -> Dict:
+            analyzer = TrendAnalyzer.from_rows(rows, start, end)
+            return analyzer.analyze(limit=limit, min_jobs=min_jobs)
+
+        # Large matrices take tens of milliseconds; keep them off the event loop.
+        result = {"dimension": dimension, "days": days, **await asyncio.to_thread(_analyze)}
+        trends_cache.set(cache_key, result, version)
+        return result
+
+    async def related_skills(self, tag: str, limit: int = 10, score: str = "lift") -> Optional[Dict]:
+        """
+        Skills most often asked for together with `tag` (any alias), ranked by
+        lift/PMI or by shared jobs (see RelatedSkillsIndex.related). None when
+        the tag has never been seen.
+        """
+        if score not in RELATED_SCORES:
+            raise ValueError(f"Unknown score: {score}. Use: {', '.join(RELATED_SCORES)}")
+        index = related_skills_cache.get("index")
+        if index is None:
+            version = current_data_version()
+            rows = (await self.db.execute(
+                select(TagCooccurrence.tag_id, TagCooccurrence.other_tag_id, TagCooccurrence.jobs)
+            )).all()
+            tags = (await self.db.execute(select(Tag.id, Tag.name, Tag.label))).all()
+            total_jobs = await self.db.scalar(select(func.count(func.distinct(JobTag.job_id))))
+            index = await asyncio.to_thread(RelatedSkillsIndex.from_rows, rows, tags, total_jobs or 0)
+            related_skills_cache.set("index", index, version)
+        return index.related(canonical_tag(tag), limit, score)
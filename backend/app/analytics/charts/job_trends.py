@@ -0,0 +1,156 @@
+"""
+Chart data for the dashboard: every widget pre-bucketed server side, in one
+compact, columnar response.
+
+The dashboard used to fetch up to 200 sample jobs from /summary/daily and
+count them in the browser; these series come from the daily rollups
+(app/analytics/rollups.py), so they cover every job in the window and cost
+a few GROUP BYs over days x values regardless of how many jobs there are.
+"""
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.analytics.analytics_service import window_start
+from app.analytics.rollups import TOTAL_DIMENSION, UNKNOWN_VALUE
+from app.config import CHARTS_CACHE_TTL
+from app.models.rollup import JobDailyCompany, JobDailyRollup
+from app.services.data_version import current_data_version
+from app.services.versioned_cache import VersionedCache
+
+CHART_BUCKETS = ("day", "week")
+OTHER_LABEL = "other"
+
+# Widget -> (rollup dimension, values shown before the "other" bucket, what is counted).
+# A job lists several skills, so the skills series counts tag occurrences: its
+# "other" bucket is tags outside the top N, not jobs, and can exceed the job total.
+ROLLUP_WIDGETS = {
+    "modality": ("work_modality", 5, "jobs"),
+    "locations": ("country", 8, "jobs"),
+    "skills": ("tag", 20, "tags"),
+}
+# The companies widget reads job_daily_companies.
+TOP_COMPANIES = 10
+
+# Keyed by the dashboard() arguments; dropped whenever ingestion bumps the data version.
+charts_cache = VersionedCache(max_entries=64, ttl_seconds=CHARTS_CACHE_TTL)
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """First day of the bucket holding `day`; weeks start on Monday."""
+    return day - timedelta(days=day.weekday()) if bucket == "week" else day
+
+
+def _with_other(top: List[Tuple[str, int]], total: int, unit: str = "jobs") -> Dict[str, list]:
+    """Columnar {labels, <unit>} of the top values plus an "other" bucket for the rest."""
+    labels = [value for value, _ in top]
+    counts = [count for _, count in top]
+    rest = total - sum(counts)
+    if rest > 0:
+        labels.append(OTHER_LABEL)
+        counts.append(rest)
+    return {"labels": labels, unit: counts}
+
+
+class JobTrendsChartService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def dashboard(self, days: int = 30, bucket: str = "day") -> Dict:
+        """
+        Totals, the jobs-per-`bucket` trend and top-N breakdowns (work
+        modality, location country, company, skill) over the window, cached
+        until the next ingestion. Skills are counted in tag occurrences
+        ("tags"), every other breakdown in jobs.
+        """
+        if bucket not in CHART_BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}. Use: {', '.join(CHART_BUCKETS)}")
+        cache_key = (days, bucket)
+        cached = charts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        version = current_data_version()
+        today = date.today()
+        since = window_start(days, today)
+        in_window = JobDailyRollup.day >= since
+
+        daily = dict((await self.db.execute(
+            select(JobDailyRollup.day, JobDailyRollup.jobs)
+            .where(JobDailyRollup.dimension == TOTAL_DIMENSION, in_window)
+        )).all())
+        totals = dict((await self.db.execute(
+            select(JobDailyRollup.dimension, func.sum(JobDailyRollup.jobs))
+            .where(in_window)
+            .group_by(JobDailyRollup.dimension)
+        )).all())
+
+        widgets = {
+            widget: _with_other(await self._top_values(dimension, since, top_n), totals.get(dimension, 0), unit)
+            for widget, (dimension, top_n, unit) in ROLLUP_WIDGETS.items()
+        }
+        company_jobs = func.sum(JobDailyCompany.jobs)
+        top_companies = (await self.db.execute(
+            select(JobDailyCompany.company, company_jobs)
+            .where(JobDailyCompany.day >= since)
+            .group_by(JobDailyCompany.company)
+            .order_by(company_jobs.desc(), JobDailyCompany.company)
+            .limit(TOP_COMPANIES)
+        )).all()
+        companies_total, distinct_companies = (await self.db.execute(
+            select(company_jobs, func.count(func.distinct(JobDailyCompany.company)))
+            .where(JobDailyCompany.day >= since)
+        )).one()
+        widgets["companies"] = _with_other([tuple(row) for row in top_companies], companies_total or 0)
+
+        total_jobs = totals.get(TOTAL_DIMENSION, 0)
+        remote = await self.db.scalar(
+            select(func.sum(JobDailyRollup.jobs))
+            .where(JobDailyRollup.dimension == "work_modality",
+                   func.lower(JobDailyRollup.value).contains("remote"), in_window)
+        )
+        unknown_location = await self.db.scalar(
+            select(func.sum(JobDailyRollup.jobs))
+            .where(JobDailyRollup.dimension == "country", JobDailyRollup.value == UNKNOWN_VALUE, in_window)
+        )
+
+        result = {
+            "days": days,
+            "since": since,
+            "bucket": bucket,
+            "totals": {
+                "jobs": total_jobs,
+                "remote": remote or 0,
+                "with_location": total_jobs - (unknown_location or 0),
+                "companies": distinct_companies or 0,
+            },
+            "trend": self._trend(daily, since, today, bucket),
+            "modality": widgets["modality"],
+            "locations": widgets["locations"],
+            "companies": widgets["companies"],
+            "skills": widgets["skills"],
+        }
+        charts_cache.set(cache_key, result, version)
+        return result
+
+    async def _top_values(self, dimension: str, since: date, limit: int) -> List[Tuple[str, int]]:
+        total = func.sum(JobDailyRollup.jobs)
+        rows = await self.db.execute(
+            select(JobDailyRollup.value, total)
+            .where(JobDailyRollup.dimension == dimension, JobDailyRollup.day >= since)
+            .group_by(JobDailyRollup.value)
+            .order_by(total.desc(), JobDailyRollup.value)
+            .limit(limit)
+        )
+        return [tuple(row) for row in rows]
+
+    @staticmethod
+    def _trend(daily: Dict[date, int], since: date, today: date, bucket: str) -> Dict[str, list]:
+        """Jobs per bucket from `since` through `today`, including empty buckets."""
+        periods: Dict[date, int] = {}
+        day = since
+        while day <= today:
+            start = bucket_start(day, bucket)
+            periods[start] = periods.get(start, 0) + daily.get(day, 0)
+            day += timedelta(days=1)
+        return {"periods": list(periods), "jobs": list(periods.values())}
@@ -0,0 +1,61 @@
+"""
+Per-transaction batching for tables derived from jobs (rollups, sketches).
+
+Their after_flush hooks only collect what changed; CommitBatch writes it
+once, in before_commit, so a transaction that flushes many times (a
+savepoint per ingested job, say) touches each day's row once and holds its
+lock only for the commit itself. Changes collected inside a savepoint that
+is rolled back are dropped with it; a rolled-back or closed transaction
+drops everything it collected.
+"""
+from typing import Callable, Iterable, List
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, SessionTransaction
+
+
+def _within(transaction: SessionTransaction, ancestor: SessionTransaction) -> bool:
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+class CommitBatch:
+    def __init__(self, name: str, apply: Callable[[Connection, List], None]):
+        self.key = f"commit_batch:{name}"
+        self.apply = apply
+        event.listen(Session, "before_commit", self._before_commit)
+        event.listen(Session, "after_soft_rollback", self._after_soft_rollback)
+        event.listen(Session, "after_transaction_end", self._after_transaction_end)
+
+    def add(self, session: Session, items: Iterable) -> None:
+        """Collect `items` (from an after_flush hook) for this transaction's commit."""
+        items = list(items)
+        if not items:
+            return
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        session.info.setdefault(self.key, []).extend((transaction, item) for item in items)
+
+    def _before_commit(self, session: Session) -> None:
+        # Releasing a savepoint also fires before_commit; wait for the real commit.
+        if session.in_nested_transaction():
+            return
+        # commit() only flushes after before_commit; flush now so its changes are collected too.
+        session.flush()
+        pending = session.info.pop(self.key, None)
+        if pending:
+            self.apply(session.connection(), [item for _, item in pending])
+
+    def _after_soft_rollback(self, session: Session, previous_transaction: SessionTransaction) -> None:
+        pending = session.info.get(self.key)
+        if pending:
+            pending[:] = [
+                (transaction, item) for transaction, item in pending
+                if not _within(transaction, previous_transaction)
+            ]
+
+    def _after_transaction_end(self, session: Session, transaction: SessionTransaction) -> None:
+        if transaction.parent is None:
+            session.info.pop(self.key, None)
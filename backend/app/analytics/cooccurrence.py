@@ -0,0 +1,95 @@
+"""
+Tag co-occurrence counts (tag_cooccurrences): for every pair of tags, how
+many jobs carry both, and on the diagonal how many carry each tag.
+
+The counts move together with job_tags: tag_dictionary's after_flush sync
+passes the job_tags rows it inserts and deletes to apply_job_tag_changes(),
+and partition archival subtracts a month with remove_window(). Rebuilding
+from job_tags (rebuild_cooccurrence) is only needed after the migration or
+for rows linked by backfill_job_tags().
+"""
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Iterable, Tuple
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import aliased
+from app.models.tag import JobTag, TagCooccurrence
+
+
+def pair_deltas(job_tags: Iterable[Tuple[int, int]], sign: int, deltas: Counter) -> Counter:
+    """Add `sign` for every ordered tag pair (diagonal included) of each job in (job id, tag id) rows."""
+    tags_by_job = defaultdict(set)
+    for job_id, tag_id in job_tags:
+        tags_by_job[job_id].add(tag_id)
+    for tag_ids in tags_by_job.values():
+        for tag_id in tag_ids:
+            for other_tag_id in tag_ids:
+                deltas[(tag_id, other_tag_id)] += sign
+    return deltas
+
+
+def apply_pair_deltas(conn: Connection, deltas: Counter) -> None:
+    """Add per-pair job count deltas; pairs that drop to zero are removed."""
+    rows = [
+        {"tag_id": tag_id, "other_tag_id": other_tag_id, "jobs": delta}
+        for (tag_id, other_tag_id), delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+    dialect_insert = postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert
+    statement = dialect_insert(TagCooccurrence)
+    statement = statement.on_conflict_do_update(
+        index_elements=["tag_id", "other_tag_id"],
+        set_={"jobs": TagCooccurrence.jobs + statement.excluded.jobs},
+    )
+    conn.execute(statement, rows)
+
+    decremented = {tag_id for (tag_id, _), delta in deltas.items() if delta < 0}
+    if decremented:
+        conn.execute(delete(TagCooccurrence).where(
+            TagCooccurrence.tag_id.in_(decremented), TagCooccurrence.jobs <= 0
+        ))
+
+
+def apply_job_tag_changes(conn: Connection, added: Iterable[Tuple[int, int]],
+                          removed: Iterable[Tuple[int, int]]) -> None:
+    """Keep the counts in step with job_tags rows (job id, tag id) inserted and deleted in this flush."""
+    deltas = pair_deltas(added, 1, Counter())
+    apply_pair_deltas(conn, pair_deltas(removed, -1, deltas))
+
+
+def _pair_counts_query():
+    other = aliased(JobTag)
+    return (
+        select(JobTag.tag_id, other.tag_id, func.count())
+        .join(other, other.job_id == JobTag.job_id)
+        .group_by(JobTag.tag_id, other.tag_id)
+    )
+
+
+def rebuild_cooccurrence(conn: Connection) -> int:
+    """Recompute every pair from job_tags with one self-join. Returns the number of pairs stored."""
+    conn.execute(delete(TagCooccurrence))
+    conn.execute(insert(TagCooccurrence).from_select(
+        ["tag_id", "other_tag_id", "jobs"], _pair_counts_query()
+    ))
+    return conn.execute(select(func.count()).select_from(TagCooccurrence)).scalar()
+
+
+def remove_window(conn: Connection, lower: datetime, upper: datetime) -> None:
+    """Subtract the jobs linked in [lower, upper) before their job_tags rows are deleted (Postgres)."""
+    conn.execute(text("""
+        UPDATE tag_cooccurrences c SET jobs = c.jobs - d.jobs
+        FROM (
+            SELECT a.tag_id, b.tag_id AS other_tag_id, count(*) AS jobs
+            FROM job_tags a
+            JOIN job_tags b ON b.job_id = a.job_id
+            WHERE a.created_at >= :lower AND a.created_at < :upper
+            GROUP BY a.tag_id, b.tag_id
+        ) d
+        WHERE c.tag_id = d.tag_id AND c.other_tag_id = d.other_tag_id
+    """), {"lower": lower, "upper": upper})
+    conn.execute(text("DELETE FROM tag_cooccurrences WHERE jobs <= 0"))
@@ -0,0 +1,152 @@
+"""
+Per-day sketches of the jobs table (job_daily_sketches): HyperLogLog of
+distinct companies and locations, SpaceSaving heavy hitters of tags.
+
+Exact distinct counts over 6-12 months need every (company, day) row of the
+window; the sketches answer any range by merging one fixed-size sketch per
+day and kind, within the error bounds in app/analytics/sketches.py.
+
+Every transaction that inserts Jobs adds them to their days' sketches when
+it commits (the hooks at the bottom: collected per flush, written once per
+commit). Sketches cannot subtract, so edits and deletes are not reflected
+until rebuild_sketches() recomputes those days.
+"""
+from collections import Counter, defaultdict
+from datetime import date, datetime, time
+from typing import Dict, Iterable, Optional
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.analytics.commit_batch import CommitBatch
+# Module, not name: app.models imports this module while rollups is still importing app.models.
+from app.analytics import rollups
+from app.analytics.sketches import HyperLogLog, SpaceSaving
+from app.models.job import Job
+from app.models.rollup import JobDailySketch
+from app.services.job_projection import format_tags
+from app.services.tag_dictionary import canonical_tag
+
+# Sketch kind -> sketch class.
+SKETCH_KINDS = {"companies": HyperLogLog, "locations": HyperLogLog, "tags": SpaceSaving}
+
+# Job columns the sketches are built from, in _DaySketches.add_job() order.
+SKETCH_FIELDS = ("created_at", "company", "location", "tags")
+
+
+def sketch_location(location: Optional[str]) -> Optional[str]:
+    """Distinct-location key: whitespace-collapsed and lowercased; None when unknown."""
+    cleaned = " ".join((location or "").split()).lower()
+    return None if cleaned in rollups.UNKNOWN_LOCATIONS else cleaned
+
+
+def load_sketch(kind: str, data: bytes):
+    return SKETCH_KINDS[kind].from_bytes(data)
+
+
+class _DaySketches:
+    """Values collected per day and kind before they are added to the sketches."""
+
+    def __init__(self):
+        self.values = defaultdict(lambda: {kind: [] for kind in SKETCH_KINDS})
+
+    def add_job(self, created_at: datetime, company, location, tags) -> None:
+        values = self.values[created_at.date()]
+        company = (company or "").strip()
+        if company:
+            values["companies"].append(company)
+        location = sketch_location(location)
+        if location:
+            values["locations"].append(location)
+        values["tags"].extend({canonical_tag(tag) for tag in format_tags(tags)} - {""})
+
+    def apply(self, sketches: Dict[tuple, object], before: Optional[date] = None) -> Dict[tuple, object]:
+        """
+        Add the collected values to {(day, kind): sketch}, creating missing
+        sketches, and forget them. Only days earlier than `before` when given.
+        Returns the sketches that changed.
+        """
+        changed = {}
+        days = [day for day in self.values if before is None or day < before]
+        for day in days:
+            values = self.values.pop(day)
+            for kind, items in values.items():
+                if not items:
+                    continue
+                key = (day, kind)
+                if kind == "tags":
+                    fresh = SpaceSaving.from_counts(Counter(items))
+                    changed[key] = fresh if key not in sketches else SpaceSaving.merge_all([sketches[key], fresh])
+                else:
+                    changed[key] = sketches.get(key, HyperLogLog()).add(items)
+        return changed
+
+
+def _store(conn: Connection, sketches: Dict[tuple, object]) -> None:
+    rows = [{"day": day, "kind": kind, "sketch": sketch.to_bytes()} for (day, kind), sketch in sketches.items()]
+    if not rows:
+        return
+    dialect_insert = postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert
+    statement = dialect_insert(JobDailySketch)
+    statement = statement.on_conflict_do_update(
+        index_elements=["day", "kind"], set_={"sketch": statement.excluded.sketch},
+    )
+    conn.execute(statement, rows)
+
+
+def add_jobs_to_sketches(conn: Connection, jobs: Iterable[tuple]) -> None:
+    """Add (created_at, company, location, tags) jobs to their days' sketches."""
+    collected = _DaySketches()
+    for job in jobs:
+        collected.add_job(*job)
+    if not collected.values:
+        return
+    query = select(JobDailySketch.day, JobDailySketch.kind, JobDailySketch.sketch).where(
+        JobDailySketch.day.in_(collected.values)
+    )
+    if conn.dialect.name == "postgresql":
+        # Read-modify-write: concurrent ingestions must not overwrite each other's additions.
+        query = query.with_for_update()
+    existing = {(day, kind): load_sketch(kind, data) for day, kind, data in conn.execute(query)}
+    _store(conn, collected.apply(existing))
+
+
+def rebuild_sketches(conn: Connection, since: Optional[date] = None, batch_size: int = 5000) -> int:
+    """
+    Recompute the sketches from jobs for days >= `since` (all days when None),
+    replacing those days. Returns the number of jobs read.
+    """
+    stale = delete(JobDailySketch)
+    query = select(*(getattr(Job, field) for field in SKETCH_FIELDS)).order_by(Job.created_at)
+    if since is not None:
+        stale = stale.where(JobDailySketch.day >= since)
+        query = query.where(Job.created_at >= datetime.combine(since, time.min))
+    conn.execute(stale)
+
+    collected = _DaySketches()
+    read = 0
+    result = conn.execute(query, execution_options={"stream_results": True, "yield_per": batch_size})
+    for batch in result.partitions():
+        for job in batch:
+            collected.add_job(*job)
+        read += len(batch)
+        # Jobs arrive in day order, so only the last day of the batch can still grow.
+        _store(conn, collected.apply({}, before=batch[-1][0].date()))
+    _store(conn, collected.apply({}))
+    return read
+
+
+# Inserted jobs, added to the sketches once per commit.
+_pending_sketch_jobs = CommitBatch("sketches", add_jobs_to_sketches)
+
+
+def _collect_sketch_jobs(session: Session, flush_context) -> None:
+    """after_flush: remember inserted Jobs for their days' sketches."""
+    _pending_sketch_jobs.add(session, [
+        tuple(getattr(obj, field) for field in SKETCH_FIELDS)
+        for obj in session.new if isinstance(obj, Job)
+    ])
+
+
+event.listen(Session, "after_flush", _collect_sketch_jobs)
@@ -0,0 +1,109 @@
+"""
+Related skills from the tag co-occurrence counts, held in memory as a sparse
+tag x tag matrix in CSR form (indptr / indices / data NumPy arrays).
+
+Scores are computed for every stored pair when the index is built, and each
+row is kept pre-sorted by lift and by shared jobs, so related() reads the
+first `limit` entries of one row: constant time in the vocabulary and in the
+number of pairs.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+# Scores related() can rank by; "pmi" is log2(lift), so it shares lift's order.
+RELATED_SCORES = ("lift", "pmi", "jobs")
+
+# Pairs seen on fewer jobs are left out: lift between two rare tags is noise.
+MIN_PAIR_JOBS = 3
+
+
+class RelatedSkillsIndex:
+    """
+    Row `i` of the matrix holds the tags that co-occur with `names[i]`:
+    `indices[indptr[i]:indptr[i + 1]]` (tag positions) and `pair_jobs` (jobs
+    with both). `tag_jobs[i]` is the number of jobs with the tag and
+    `total_jobs` the number of tagged jobs.
+    """
+
+    def __init__(self, names: List[str], labels: List[str], tag_jobs: np.ndarray, total_jobs: int,
+                 indptr: np.ndarray, indices: np.ndarray, pair_jobs: np.ndarray):
+        self.names = names
+        self.labels = labels
+        self.positions = {name: i for i, name in enumerate(names)}
+        self.tag_jobs = tag_jobs
+        self.total_jobs = total_jobs
+        self.indptr = indptr
+        self.indices = indices
+        self.pair_jobs = pair_jobs
+
+        rows = np.repeat(np.arange(len(names)), np.diff(indptr))
+        self.lift = np.zeros(len(indices))
+        if len(indices):
+            self.lift = pair_jobs * float(total_jobs) / (tag_jobs[rows] * tag_jobs[indices])
+        # Per-score permutations that sort each row best first; ties go to the lower position.
+        self.orders = {
+            "lift": np.lexsort((indices, -pair_jobs, -self.lift, rows)),
+            "jobs": np.lexsort((indices, -self.lift, -pair_jobs, rows)),
+        }
+        self.orders["pmi"] = self.orders["lift"]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, int, int]], tags: Iterable[Tuple[int, str, str]],
+                  total_jobs: int, min_jobs: int = MIN_PAIR_JOBS) -> "RelatedSkillsIndex":
+        """
+        Build from tag_cooccurrences (tag id, other tag id, jobs) rows and
+        (tag id, name, label) rows of the tags they reference.
+        """
+        pairs = np.array(rows if isinstance(rows, list) else list(rows), dtype=np.int64).reshape(-1, 3)
+        ids = np.unique(pairs[:, :2])
+        names, labels = {}, {}
+        for tag_id, name, label in tags:
+            names[tag_id], labels[tag_id] = name, label
+        ids = ids[np.fromiter((tag_id in names for tag_id in ids.tolist()), dtype=bool, count=len(ids))]
+        known = np.isin(pairs[:, 0], ids) & np.isin(pairs[:, 1], ids)
+        rows_at = np.searchsorted(ids, pairs[known, 0])
+        cols_at = np.searchsorted(ids, pairs[known, 1])
+        jobs = pairs[known, 2]
+
+        diagonal = rows_at == cols_at
+        tag_jobs = np.zeros(len(ids), dtype=np.int64)
+        tag_jobs[rows_at[diagonal]] = jobs[diagonal]
+
+        kept = ~diagonal & (jobs >= min_jobs)
+        order = np.argsort(rows_at[kept], kind="stable")
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows_at[kept], minlength=len(ids)))])
+        return cls(
+            [names[tag_id] for tag_id in ids.tolist()],
+            [labels[tag_id] for tag_id in ids.tolist()],
+            tag_jobs, total_jobs, indptr, cols_at[kept][order], jobs[kept][order],
+        )
+
+    def related(self, name: str, limit: int = 10, score: str = "lift") -> Optional[Dict]:
+        """The `limit` skills most associated with canonical tag `name`, or None for an unknown tag."""
+        if score not in RELATED_SCORES:
+            raise ValueError(f"Unknown score: {score}. Use: {', '.join(RELATED_SCORES)}")
+        row = self.positions.get(name)
+        if row is None:
+            return None
+        start, end = self.indptr[row], self.indptr[row + 1]
+        tag_jobs = int(self.tag_jobs[row])
+        related = []
+        for entry in self.orders[score][start:min(end, start + limit)].tolist():
+            other, jobs, lift = int(self.indices[entry]), int(self.pair_jobs[entry]), float(self.lift[entry])
+            related.append({
+                "skill": self.names[other],
+                "label": self.labels[other],
+                "jobs": jobs,
+                # Share of this skill's jobs that also ask for the other one.
+                "confidence": round(jobs / tag_jobs, 4),
+                "lift": round(lift, 4),
+                "pmi": round(float(np.log2(lift)), 4),
+            })
+        return {
+            "skill": name,
+            "label": self.labels[row],
+            "jobs": tag_jobs,
+            "total_jobs": self.total_jobs,
+            "score": score,
+            "related": related,
+        }
@@ -0,0 +1,198 @@
+"""
+Daily rollups of the jobs table: jobs per day per source, work modality,
+country and tag (job_daily_rollups), and jobs per day per company
+(job_daily_companies, one row per distinct company and day).
+
+Every transaction that inserts, changes or deletes Jobs adds their +1/-1
+deltas to the rollups when it commits (the hooks at the bottom: collected
+per flush, written once per commit), so ingestion keeps them current
+without rescanning jobs. rebuild_rollups() recomputes history, e.g.
+for rows written before the rollups existed or by raw SQL.
+"""
+from collections import Counter
+from datetime import date, datetime, time
+from typing import Iterable, Optional
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, attributes
+from app.analytics.commit_batch import CommitBatch
+from app.models.job import Job
+from app.models.rollup import JobDailyCompany, JobDailyRollup
+from app.services.job_projection import format_tags
+from app.services.tag_dictionary import canonical_tag
+
+TOTAL_DIMENSION = "total"
+TOTAL_VALUE = "all"
+ROLLUP_DIMENSIONS = ("source", "work_modality", "country", "tag")
+UNKNOWN_VALUE = "unknown"
+
+# Job columns the rollups are derived from, in job_rollup_keys() order.
+ROLLUP_FIELDS = ("created_at", "source", "work_modality", "location", "company", "tags")
+
+REMOTE_LOCATIONS = {"remote", "anywhere", "worldwide", "global"}
+UNKNOWN_LOCATIONS = {"", "unknown", "n/a", "na", "none"}
+
+# Lowercased country spellings seen in provider locations -> display name.
+COUNTRY_ALIASES = {
+    "uk": "United Kingdom",
+    "gb": "United Kingdom",
+    "great britain": "United Kingdom",
+    "england": "United Kingdom",
+    "scotland": "United Kingdom",
+    "wales": "United Kingdom",
+    "northern ireland": "United Kingdom",
+    "united kingdom": "United Kingdom",
+    "us": "United States",
+    "usa": "United States",
+    "u.s.": "United States",
+    "united states": "United States",
+    "united states of america": "United States",
+    "br": "Brazil",
+    "brasil": "Brazil",
+    "de": "Germany",
+    "deutschland": "Germany",
+    "ca": "Canada",
+}
+
+
+def location_country(location: Optional[str]) -> str:
+    """
+    Country bucket for a free-text location: the last comma-separated part
+    ("Austin, TX, US" -> "United States"), "Remote" for location-less
+    listings and "unknown" when there is nothing to go on.
+    """
+    cleaned = " ".join((location or "").split())
+    if cleaned.lower() in UNKNOWN_LOCATIONS:
+        return UNKNOWN_VALUE
+    if cleaned.lower() in REMOTE_LOCATIONS:
+        return "Remote"
+    country = cleaned.rsplit(",", 1)[-1].strip()
+    return COUNTRY_ALIASES.get(country.lower(), country) or UNKNOWN_VALUE
+
+
+def job_rollup_keys(created_at: datetime, source, work_modality, location, company, tags):
+    """(rollup keys, company key or None) one job contributes to."""
+    day = created_at.date()
+    keys = [
+        (day, TOTAL_DIMENSION, TOTAL_VALUE),
+        (day, "source", (source or "").strip() or UNKNOWN_VALUE),
+        (day, "work_modality", (work_modality or "").strip() or UNKNOWN_VALUE),
+        (day, "country", location_country(location)),
+    ]
+    keys.extend((day, "tag", name) for name in sorted({canonical_tag(tag) for tag in format_tags(tags)} - {""}))
+    company = (company or "").strip()
+    return keys, ((day, company) if company else None)
+
+
+def _count_jobs(jobs: Iterable[tuple], sign: int, rollups: Counter, companies: Counter) -> None:
+    for job in jobs:
+        keys, company_key = job_rollup_keys(*job)
+        for key in keys:
+            rollups[key] += sign
+        if company_key:
+            companies[company_key] += sign
+
+
+def _upsert_increments(conn: Connection, model, key_columns, rows) -> None:
+    dialect_insert = postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert
+    statement = dialect_insert(model)
+    statement = statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={"jobs": model.jobs + statement.excluded.jobs},
+    )
+    conn.execute(statement, rows)
+
+
+def apply_rollup_deltas(conn: Connection, rollups: Counter, companies: Counter) -> None:
+    """Add per-key job count deltas to the rollup tables; rows that drop to zero are removed."""
+    rollup_rows = [
+        {"day": day, "dimension": dimension, "value": value, "jobs": delta}
+        for (day, dimension, value), delta in rollups.items() if delta
+    ]
+    company_rows = [
+        {"day": day, "company": company, "jobs": delta}
+        for (day, company), delta in companies.items() if delta
+    ]
+    if rollup_rows:
+        _upsert_increments(conn, JobDailyRollup, ["day", "dimension", "value"], rollup_rows)
+    if company_rows:
+        _upsert_increments(conn, JobDailyCompany, ["day", "company"], company_rows)
+
+    decremented_days = {key[0] for key, delta in rollups.items() if delta < 0}
+    if decremented_days:
+        for model in (JobDailyRollup, JobDailyCompany):
+            conn.execute(delete(model).where(model.day.in_(decremented_days), model.jobs <= 0))
+
+
+def rebuild_rollups(conn: Connection, since: Optional[date] = None, batch_size: int = 5000) -> int:
+    """
+    Recompute the rollups from jobs for days >= `since` (all days when None).
+    Rollup rows for those days are replaced, so months already archived out
+    of jobs should be excluded with `since`. Returns the number of jobs read.
+    """
+    query = select(*(getattr(Job, field) for field in ROLLUP_FIELDS))
+    if since is not None:
+        query = query.where(Job.created_at >= datetime.combine(since, time.min))
+
+    rollups, companies = Counter(), Counter()
+    read = 0
+    result = conn.execute(query, execution_options={"stream_results": True, "yield_per": batch_size})
+    for batch in result.partitions():
+        _count_jobs(batch, 1, rollups, companies)
+        read += len(batch)
+
+    for model in (JobDailyRollup, JobDailyCompany):
+        stale = delete(model)
+        if since is not None:
+            stale = stale.where(model.day >= since)
+        conn.execute(stale)
+    apply_rollup_deltas(conn, rollups, companies)
+    return read
+
+
+def _previous_values(obj: Job) -> tuple:
+    """ROLLUP_FIELDS of `obj` as they were before this flush."""
+    values = []
+    for field in ROLLUP_FIELDS:
+        history = attributes.get_history(obj, field)
+        if history.deleted:
+            values.append(history.deleted[0])
+        elif history.unchanged:
+            values.append(history.unchanged[0])
+        else:
+            values.append(getattr(obj, field))
+    return tuple(values)
+
+
+def _current_values(obj: Job) -> tuple:
+    return tuple(getattr(obj, field) for field in ROLLUP_FIELDS)
+
+
+def _apply_job_changes(conn: Connection, changes: Iterable[tuple]) -> None:
+    """(sign, ROLLUP_FIELDS values) pairs -> one apply_rollup_deltas() call."""
+    rollups, companies = Counter(), Counter()
+    for sign, job in changes:
+        _count_jobs([job], sign, rollups, companies)
+    apply_rollup_deltas(conn, rollups, companies)
+
+
+# +1/-1 job changes, applied to the rollups once per commit.
+_pending_rollup_changes = CommitBatch("rollups", _apply_job_changes)
+
+
+def _collect_rollup_changes(session: Session, flush_context) -> None:
+    """after_flush: remember inserted, changed and deleted Jobs (values as of this flush)."""
+    changes = [(1, _current_values(obj)) for obj in session.new if isinstance(obj, Job)]
+    changes.extend((-1, _previous_values(obj)) for obj in session.deleted if isinstance(obj, Job))
+    for obj in session.dirty:
+        if isinstance(obj, Job) and any(
+            attributes.get_history(obj, field).has_changes() for field in ROLLUP_FIELDS
+        ):
+            changes.append((-1, _previous_values(obj)))
+            changes.append((1, _current_values(obj)))
+    _pending_rollup_changes.add(session, changes)
+
+
+event.listen(Session, "after_flush", _collect_rollup_changes)
@@ -0,0 +1,149 @@
+"""
+Mergeable probabilistic sketches for long-window analytics.
+
+HyperLogLog estimates distinct counts (companies, locations) in a fixed 4 KB
+with ~1.6% standard error; SpaceSaving keeps the heaviest items (tags) with
+per-item error bounds in at most `capacity` counters. Both merge losslessly
+with respect to their guarantees, so a sketch per day answers any date
+range: union the days in the range.
+"""
+import hashlib
+import math
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import orjson
+
+HLL_PRECISION = 12
+SPACE_SAVING_CAPACITY = 512
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash; Python's hash() is salted per process."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    2**precision 6-bit registers (stored one per byte). Each value sets its
+    register to the max of the leading-zero run of its hash; merging two
+    sketches is an element-wise max.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION, registers: Optional[np.ndarray] = None):
+        self.precision = precision
+        size = 1 << precision
+        self.registers = np.zeros(size, dtype=np.uint8) if registers is None else registers
+        if len(self.registers) != size:
+            raise ValueError(f"expected {size} registers, got {len(self.registers)}")
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of estimate() relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, values: Iterable[str]) -> "HyperLogLog":
+        suffix_bits = 64 - self.precision
+        suffix_mask = (1 << suffix_bits) - 1
+        indexes, ranks = [], []
+        for value in values:
+            hashed = _hash64(value)
+            indexes.append(hashed >> suffix_bits)
+            ranks.append(suffix_bits - (hashed & suffix_mask).bit_length() + 1)
+        if indexes:
+            np.maximum.at(self.registers, np.array(indexes), np.array(ranks, dtype=np.uint8))
+        return self
+
+    @classmethod
+    def union(cls, sketches: Iterable["HyperLogLog"], precision: int = HLL_PRECISION) -> "HyperLogLog":
+        registers = [sketch.registers for sketch in sketches]
+        if not registers:
+            return cls(precision)
+        return cls(precision, np.maximum.reduce(registers))
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def to_bytes(self) -> bytes:
+        return self.registers.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, precision: int = HLL_PRECISION) -> "HyperLogLog":
+        return cls(precision, np.frombuffer(data, dtype=np.uint8).copy())
+
+
+class SpaceSaving:
+    """
+    Heavy hitters in at most `capacity` counters, as mergeable summaries.
+
+    `counters` maps item -> (count, error): `count` never underestimates the
+    true count and `count - error` never overestimates it. Items without a
+    counter occurred at most `floor` times.
+    """
+
+    def __init__(self, capacity: int = SPACE_SAVING_CAPACITY,
+                 counters: Optional[Dict[str, Tuple[int, int]]] = None, floor: int = 0):
+        self.capacity = capacity
+        self.counters = counters or {}
+        self.floor = floor
+
+    @classmethod
+    def from_counts(cls, counts: Counter, capacity: int = SPACE_SAVING_CAPACITY) -> "SpaceSaving":
+        """Summary of exact counts: the `capacity` largest are kept, the rest are bounded by `floor`."""
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        floor = ranked[capacity][1] if len(ranked) > capacity else 0
+        return cls(capacity, {item: (count, 0) for item, count in ranked[:capacity]}, floor)
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable["SpaceSaving"], capacity: int = SPACE_SAVING_CAPACITY) -> "SpaceSaving":
+        """
+        Merge any number of summaries in one pass. An item missing from a
+        summary is counted at that summary's floor, as both count and error.
+        """
+        floor_total = 0
+        counts, errors = Counter(), Counter()
+        for sketch in sketches:
+            floor_total += sketch.floor
+            for item, (count, error) in sketch.counters.items():
+                counts[item] += count - sketch.floor
+                errors[item] += error - sketch.floor
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        floor = floor_total
+        if len(ranked) > capacity:
+            floor = floor_total + ranked[capacity][1]
+        return cls(capacity, {
+            item: (floor_total + count, floor_total + errors[item]) for item, count in ranked[:capacity]
+        }, floor)
+
+    def add(self, items: Iterable[str]) -> "SpaceSaving":
+        merged = SpaceSaving.merge_all([self, SpaceSaving.from_counts(Counter(items), self.capacity)], self.capacity)
+        self.counters, self.floor = merged.counters, merged.floor
+        return self
+
+    def top(self, limit: int) -> List[Tuple[str, int, int]]:
+        """(item, count, error) for the `limit` largest counts, ties by item."""
+        ranked = sorted(self.counters.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(item, count, error) for item, (count, error) in ranked[:limit]]
+
+    def to_bytes(self) -> bytes:
+        return orjson.dumps({
+            "capacity": self.capacity,
+            "floor": self.floor,
+            "counters": [[item, count, error] for item, (count, error) in self.counters.items()],
+        })
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpaceSaving":
+        decoded = orjson.loads(data)
+        return cls(
+            decoded["capacity"],
+            {item: (count, error) for item, count, error in decoded["counters"]},
+            decoded["floor"],
+        )
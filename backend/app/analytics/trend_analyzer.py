@@ -0,0 +1,150 @@
+"""
+Demand trends for skills (tags) and companies, computed on a value x day
+matrix of job counts loaded from the daily rollups.
+
+Every statistic is a whole-matrix NumPy operation (cumulative sums, axis
+reductions, partial sorts), so 10k tags over a year cost about the same
+number of Python steps as ten; only from_rows() touches each row.
+"""
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+
+WEEK = 7
+
+
+class TrendAnalyzer:
+    """
+    `counts[i, d]` is the number of jobs for `values[i]` on `start + d` days.
+    The last column is the most recent day.
+    """
+
+    def __init__(self, values: Sequence[str], start: date, counts: np.ndarray):
+        self.values = list(values)
+        self.start = start
+        self.counts = np.asarray(counts, dtype=np.float64)
+        if self.counts.shape[0] != len(self.values):
+            raise ValueError("counts needs one row per value")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, date, int]], start: date, end: date) -> "TrendAnalyzer":
+        """Build the matrix from (value, day, jobs) rows; missing days are zero."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        n_days = (end - start).days + 1
+        if not rows:
+            return cls([], start, np.zeros((0, n_days)))
+
+        # One pass per column; values and days are interned through dicts
+        # (a year has at most 366 distinct days).
+        positions = {}
+        value_index = np.fromiter(
+            (positions.setdefault(row[0], len(positions)) for row in rows), dtype=np.int64, count=len(rows)
+        )
+        offsets = {}
+        first = start.toordinal()
+        day_index = np.fromiter(
+            (offsets[row[1]] if row[1] in offsets else offsets.setdefault(row[1], row[1].toordinal() - first)
+             for row in rows),
+            dtype=np.int64, count=len(rows),
+        )
+        jobs = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+        in_range = (day_index >= 0) & (day_index < n_days)
+
+        cells = np.bincount(
+            value_index[in_range] * n_days + day_index[in_range],
+            weights=jobs[in_range],
+            minlength=len(positions) * n_days,
+        )
+        # Rows in value order, so ties rank the same way on every call.
+        names = list(positions)
+        order = sorted(range(len(names)), key=names.__getitem__)
+        counts = cells.reshape(len(names), n_days)[order]
+        return cls([names[i] for i in order], start, counts)
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=self.counts.shape[1] - 1)
+
+    def moving_average(self, window: int = WEEK) -> np.ndarray:
+        """Trailing `window`-day mean per value; column d covers days d-window+1..d (shape n x days-window+1)."""
+        window = max(1, min(window, self.counts.shape[1]))
+        cumulative = np.cumsum(self.counts, axis=1)
+        cumulative = np.concatenate([np.zeros((self.counts.shape[0], 1)), cumulative], axis=1)
+        return (cumulative[:, window:] - cumulative[:, :-window]) / window
+
+    def weekly_totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(jobs in the last 7 days, jobs in the 7 days before) per value."""
+        this_week = self.counts[:, -WEEK:].sum(axis=1)
+        last_week = self.counts[:, -2 * WEEK:-WEEK].sum(axis=1)
+        return this_week, last_week
+
+    def week_over_week(self) -> np.ndarray:
+        """Relative change of this week over last week; NaN where last week had no jobs."""
+        this_week, last_week = self.weekly_totals()
+        growth = np.full(this_week.shape, np.nan)
+        np.divide(this_week - last_week, last_week, out=growth, where=last_week > 0)
+        return growth
+
+    def z_scores(self, baseline_days: Optional[int] = None) -> np.ndarray:
+        """
+        How unusual the latest day is per value: (today - mean) / std over the
+        preceding `baseline_days` (the whole window by default). 0 where the
+        baseline never varied.
+        """
+        baseline = self.counts[:, :-1] if baseline_days is None else self.counts[:, -baseline_days - 1:-1]
+        if baseline.shape[1] == 0:
+            return np.zeros(self.counts.shape[0])
+        mean = baseline.mean(axis=1)
+        std = baseline.std(axis=1)
+        scores = np.zeros(self.counts.shape[0])
+        np.divide(self.counts[:, -1] - mean, std, out=scores, where=std > 0)
+        return scores
+
+    def _top(self, scores: np.ndarray, mask: np.ndarray, limit: int) -> np.ndarray:
+        """Indices of the `limit` highest `scores` among `mask`, best first; ties go to the earlier value."""
+        candidates = np.flatnonzero(mask)
+        if candidates.size > limit:
+            # Partial selection: everything above the limit-th score, then ties in index order.
+            negated = -scores[candidates]
+            cutoff = np.partition(negated, limit - 1)[limit - 1]
+            above = negated < cutoff
+            tied = negated == cutoff
+            candidates = candidates[above | (tied & (np.cumsum(tied) <= limit - np.count_nonzero(above)))]
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def analyze(self, limit: int = 10, min_jobs: int = 3, window: int = WEEK,
+                z_threshold: float = 3.0) -> Dict:
+        """
+        Top risers and fallers by week-over-week change in jobs, and values
+        whose latest day spiked at least `z_threshold` standard deviations
+        above the rest of the window.
+        Values with fewer than `min_jobs` in both weeks are left out as noise.
+        """
+        this_week, last_week = self.weekly_totals()
+        change = this_week - last_week
+        growth = self.week_over_week()
+        scores = self.z_scores()
+        average = self.moving_average(window)[:, -1] if self.values else np.zeros(0)
+        supported = np.maximum(this_week, last_week) >= min_jobs
+
+        def _entries(indices) -> List[Dict]:
+            return [
+                {
+                    "value": self.values[i],
+                    "this_week": int(this_week[i]),
+                    "last_week": int(last_week[i]),
+                    "change": int(change[i]),
+                    "growth": None if np.isnan(growth[i]) else round(float(growth[i]), 4),
+                    "moving_average": round(float(average[i]), 2),
+                    "z_score": round(float(scores[i]), 2),
+                }
+                for i in indices
+            ]
+
+        return {
+            "as_of": self.end,
+            "values": len(self.values),
+            "risers": _entries(self._top(change, supported & (change > 0), limit)),
+            "fallers": _entries(self._top(-change, supported & (change < 0), limit)),
+            "spikes": _entries(self._top(scores, (scores >= z_threshold) & (self.counts[:, -1] >= min_jobs), limit)),
+        }
@@ -24,6 +24,49 @@ if "neon.tech" in DATABASE_URL:
     else:
         DATABASE_URL += "?sslmode=require&connect_timeout=10&application_name=orionjobs"
 
+# Optional read replica for GET endpoints; reads fall back to the primary when
+# the replica is unreachable or lags more than READ_REPLICA_MAX_LAG_SECONDS.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL") or None
+READ_REPLICA_MAX_LAG_SECONDS = float(os.getenv("READ_REPLICA_MAX_LAG_SECONDS", "30"))
+READ_REPLICA_CHECK_INTERVAL = float(os.getenv("READ_REPLICA_CHECK_INTERVAL", "5"))
+
+# Connection pool sizing per process role. "api" serves requests from FastAPI's
+# 40-thread pool (pool_size + max_overflow covers it); "scheduler" runs one
+# collection job at a time. The API process also runs the in-process scheduler,
+# which gets its own small "scheduler" pool so it can't starve request handlers.
+PROCESS_ROLE = os.getenv("PROCESS_ROLE", "api").lower()
+_POOL_DEFAULTS = {
+    "api": {"pool_size": 10, "max_overflow": 30},
+    "scheduler": {"pool_size": 2, "max_overflow": 2},
+}
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+
+def pool_settings(role: str) -> dict:
+    """Pool kwargs for `role`; DB_POOL_<ROLE>_SIZE / DB_POOL_<ROLE>_MAX_OVERFLOW override the defaults."""
+    defaults = _POOL_DEFAULTS.get(role, _POOL_DEFAULTS["api"])
+    prefix = f"DB_POOL_{role.upper()}"
+    return {
+        "pool_size": int(os.getenv(f"{prefix}_SIZE", defaults["pool_size"])),
+        "max_overflow": int(os.getenv(f"{prefix}_MAX_OVERFLOW", defaults["max_overflow"])),
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+
+# Monthly partitions on jobs.created_at (Postgres, after `python app/scripts/partition_jobs.py convert`).
+# The daily maintenance job pre-creates JOBS_PARTITION_PREMAKE_MONTHS future partitions and
+# detaches partitions older than JOBS_RETENTION_MONTHS full months (0 disables retention)
+# into the jobs_archive table ("table") or gzipped CSV files in JOBS_ARCHIVE_DIR ("files").
+JOBS_PARTITION_PREMAKE_MONTHS = int(os.getenv("JOBS_PARTITION_PREMAKE_MONTHS", "2"))
+JOBS_RETENTION_MONTHS = int(os.getenv("JOBS_RETENTION_MONTHS", "12"))
+JOBS_ARCHIVE_MODE = os.getenv("JOBS_ARCHIVE_MODE", "table").lower()
+JOBS_ARCHIVE_DIR = os.getenv("JOBS_ARCHIVE_DIR", os.path.join(os.path.dirname(__file__), "..", "archive"))
+
+# Shared secret for /internal/* endpoints (X-Internal-Token); unset leaves them open in
+# development and disabled (403) everywhere else.
+INTERNAL_STATS_TOKEN = os.getenv("INTERNAL_STATS_TOKEN") or None
+
 # API keys for job services
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY")
@@ -99,6 +142,23 @@ logging.basicConfig(
 
 # Cache settings
 CACHE_TTL = int(os.getenv("CACHE_TTL", "86400"))  # 24 hours default
+# Backstop TTL for cached facet counts; ingestion in this process invalidates them sooner.
+FACETS_CACHE_TTL = int(os.getenv("FACETS_CACHE_TTL", "300"))
+# Same backstop for /analytics/trends results.
+TRENDS_CACHE_TTL = int(os.getenv("TRENDS_CACHE_TTL", "3600"))
+# And for the dashboard chart data (/analytics/charts/dashboard).
+CHARTS_CACHE_TTL = int(os.getenv("CHARTS_CACHE_TTL", "3600"))
+# Serialized, pre-compressed responses of /summary/daily, /summary/recent and the first /jobs pages.
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "900"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+RESPONSE_CACHE_MAX_PAGE = int(os.getenv("RESPONSE_CACHE_MAX_PAGE", "3"))
+# Re-request these after every scheduled collection so the first visitor gets a cached response.
+RESPONSE_CACHE_WARM = os.getenv("RESPONSE_CACHE_WARM", "true").lower() == "true"
+RESPONSE_CACHE_WARM_PATHS = [path.strip() for path in os.getenv(
+    "RESPONSE_CACHE_WARM_PATHS",
+    "/api/v1/summary/daily,/api/v1/summary/recent,"
+    "/api/v1/jobs?view=compact&page_size=12&page=1,/api/v1/jobs?view=compact&page_size=12&page=2",
+).split(",") if path.strip()]
 
 # Azure specific configurations
 AZURE_INSIGHTS_CONNECTION_STRING = os.getenv("AZURE_INSIGHTS_CONNECTION_STRING")
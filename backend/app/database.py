@@ -1,16 +1,57 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import logging
+import time
+from typing import Dict, Optional
+from fastapi import Depends
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.base import Base
-from app.config import DATABASE_URL
-
-engine = create_engine(
+from app.config import (
+    DATABASE_READ_URL,
     DATABASE_URL,
-    pool_size = 5,
-    max_overflow=10,
-    pool_pre_ping=True,
-    pool_recycle=1800,
-    echo=False
+    PROCESS_ROLE,
+    READ_REPLICA_CHECK_INTERVAL,
+    READ_REPLICA_MAX_LAG_SECONDS,
+    pool_settings,
 )
+from app.pool_metrics import REGISTRY, PoolMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def create_instrumented_engine(database_url, name: str, role: str = PROCESS_ROLE, **kwargs):
+    """Sync engine sized for `role` (kwargs override), with its pool metrics registered under `name`."""
+    metrics = PoolMetrics(name)
+    engine = create_engine(
+        database_url,
+        poolclass=metrics.pool_class(QueuePool),
+        pool_pre_ping=True,
+        echo=False,
+        **{**pool_settings(role), **kwargs}
+    )
+    metrics.attach(engine)
+    return engine
+
+
+def create_instrumented_async_engine(database_url: str, name: str, role: str = PROCESS_ROLE):
+    """Async counterpart of create_instrumented_engine(); takes a sync URL and maps its driver."""
+    metrics = PoolMetrics(name)
+    url, connect_args = to_async_url(database_url)
+    engine = create_async_engine(
+        url,
+        connect_args=connect_args,
+        poolclass=metrics.pool_class(AsyncAdaptedQueuePool),
+        pool_pre_ping=True,
+        echo=False,
+        **pool_settings(role)
+    )
+    metrics.attach(engine.sync_engine)
+    return engine
+
+
+engine = create_instrumented_engine(DATABASE_URL, "primary")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -19,7 +60,185 @@ def get_db():
         yield db
     finally:
         db.close()
-        
+
+# Sessions for scheduled jobs. The API process runs APScheduler in-process, so its
+# jobs get a separate "scheduler"-sized pool instead of competing with requests;
+# a standalone scheduler process (PROCESS_ROLE=scheduler) just uses `engine`.
+if PROCESS_ROLE == "api":
+    scheduler_engine = create_instrumented_engine(DATABASE_URL, "scheduler", role="scheduler")
+else:
+    scheduler_engine = engine
+SchedulerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=scheduler_engine)
+
+
+def to_async_url(database_url: str):
+    """
+    Map a sync DATABASE_URL onto its asyncio driver (asyncpg / aiosqlite).
+    libpq-only query options are translated into asyncpg connect args.
+    Returns (url, connect_args).
+    """
+    url = make_url(database_url)
+    connect_args = {}
+
+    if url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        if "sslmode" in query:
+            connect_args["ssl"] = query.pop("sslmode")
+        if "connect_timeout" in query:
+            connect_args["timeout"] = float(query.pop("connect_timeout"))
+        if "application_name" in query:
+            connect_args["server_settings"] = {"application_name": query.pop("application_name")}
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url, connect_args
+
+
+# Async engine for `async def` routes, so DB calls don't block the event loop.
+async_engine = create_instrumented_async_engine(DATABASE_URL, "primary_async")
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Replica lag in seconds: 0 on a primary or a caught-up replica, otherwise the
+# age of the last replayed transaction.
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaMonitor:
+    """
+    Decides whether reads may go to the replica. Lag is re-measured at most every
+    `check_interval` seconds; a lagging or unreachable replica sends reads to the
+    primary until the next successful check.
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.lag_seconds: Optional[float] = None
+        self.healthy = False
+        self.last_error: Optional[str] = None
+        self.checked_at = None
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    def _is_stale(self) -> bool:
+        return self.checked_at is None or time.monotonic() - self.checked_at >= self.check_interval
+
+    def _record(self, lag_seconds: Optional[float], error: Optional[Exception] = None) -> None:
+        self.checked_at = time.monotonic()
+        self.lag_seconds = lag_seconds
+        self.last_error = str(error) if error else None
+        self.healthy = error is None and lag_seconds is not None and lag_seconds <= self.max_lag_seconds
+        if error:
+            logger.warning(f"Read replica unavailable, using primary: {error}")
+        elif not self.healthy:
+            logger.warning(f"Read replica lag {lag_seconds:.1f}s > {self.max_lag_seconds}s, using primary")
+
+    def _decide(self) -> bool:
+        if self.healthy:
+            self.replica_reads += 1
+        else:
+            self.primary_fallbacks += 1
+        return self.healthy
+
+    def use_replica(self, read_engine) -> bool:
+        if self._is_stale():
+            try:
+                with read_engine.connect() as conn:
+                    lag = conn.execute(REPLICA_LAG_SQL).scalar() if conn.dialect.name == "postgresql" else 0
+                self._record(float(lag))
+            except Exception as e:
+                self._record(None, e)
+        return self._decide()
+
+    async def use_replica_async(self, read_engine) -> bool:
+        if self._is_stale():
+            try:
+                async with read_engine.connect() as conn:
+                    lag = (await conn.execute(REPLICA_LAG_SQL)).scalar() if conn.dialect.name == "postgresql" else 0
+                self._record(float(lag))
+            except Exception as e:
+                self._record(None, e)
+        return self._decide()
+
+    def snapshot(self) -> Dict:
+        return {
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "last_error": self.last_error,
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+        }
+
+
+# Optional read replica (DATABASE_READ_URL) for GET endpoints.
+read_engine = None
+ReadSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+if DATABASE_READ_URL:
+    read_engine = create_instrumented_engine(DATABASE_READ_URL, "replica")
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    async_read_engine = create_instrumented_async_engine(DATABASE_READ_URL, "replica_async")
+    AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+replica_monitor = ReplicaMonitor(READ_REPLICA_MAX_LAG_SECONDS, READ_REPLICA_CHECK_INTERVAL)
+
+
+def get_read_db(db: Session = Depends(get_db)):
+    """
+    Session for read-only routes: the replica when configured and caught up,
+    otherwise the primary session from get_db (which never connects if unused).
+    """
+    if read_engine is not None and replica_monitor.use_replica(read_engine):
+        read_db = ReadSessionLocal()
+        try:
+            yield read_db
+        finally:
+            read_db.close()
+    else:
+        yield db
+
+
+async def get_async_read_db(db: AsyncSession = Depends(get_async_db)):
+    """Async counterpart of get_read_db()."""
+    if async_read_engine is not None and await replica_monitor.use_replica_async(async_read_engine):
+        async with AsyncReadSessionLocal() as read_db:
+            yield read_db
+    else:
+        yield db
+
+
+def database_pool_metrics() -> Dict:
+    """Gauges, checkout-wait and connection-lifetime histograms for every engine this process opened."""
+    metrics = {"process_role": PROCESS_ROLE, "pool_settings": {}, "pools": {}}
+    for role in dict.fromkeys((PROCESS_ROLE, "scheduler")):
+        metrics["pool_settings"][role] = pool_settings(role)
+    for name, pool_metrics in REGISTRY.items():
+        if pool_metrics.engine is not None:
+            metrics["pools"][name] = pool_metrics.snapshot()
+    if read_engine is not None:
+        metrics["replica_monitor"] = replica_monitor.snapshot()
+    return metrics
+
+
+def is_postgresql(db) -> bool:
+    """True when the session (or engine/connection) is bound to Postgres."""
+    bind = db.get_bind() if hasattr(db, "get_bind") else db
+    return bind.dialect.name == "postgresql"
+
 from app.models import Job
 # print("Creating table...")
 # print (f"Registered tables: {list(Base.metadata.tables.keys())}") #Debug
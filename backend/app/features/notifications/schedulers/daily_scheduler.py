@@ -1,7 +1,7 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from app.features.notifications.email_service import EmailService
 from app.features.notifications.summary_generator import SummaryGenerator
-from app.database import SessionLocal
+from app.database import SchedulerSessionLocal
 from app.models.job import Job
 from datetime import datetime, timedelta
 import logging
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 def send_daily_summaries():
     """Send daily job summaries via email."""
     logger.info("📧 Starting daily email summary job...")
-    db = SessionLocal()
+    db = SchedulerSessionLocal()
     
     try:
         # Get jobs from last 7 DAYS (for testing) - change to 1 day in production
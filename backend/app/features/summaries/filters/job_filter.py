@@ -0,0 +1,48 @@
+from typing import List, Optional
+from sqlalchemy import and_, func, select
+from app.models.job import Job
+from app.models.tag import JobTag, TagAlias
+from app.services.tag_dictionary import canonical_tag
+
+TAG_MATCH_ANY = "any"
+TAG_MATCH_ALL = "all"
+TAG_MATCH_MODES = (TAG_MATCH_ANY, TAG_MATCH_ALL)
+
+
+def normalize_tags(tags: Optional[List[str]]) -> List[str]:
+    """Lowercase, trim and de-duplicate requested tags, keeping their order."""
+    if not tags:
+        return []
+    seen = []
+    for tag in tags:
+        clean = (tag or "").strip().lower()
+        if clean and clean not in seen:
+            seen.append(clean)
+    return seen
+
+
+def tag_filter(tags: List[str], match: str = TAG_MATCH_ANY):
+    """
+    Whole-tag filter through the tag dictionary: "java" never matches
+    "javascript", and "JS" matches jobs tagged "JavaScript". Requested tags
+    resolve to tag ids via tag_aliases; jobs are matched on job_tags
+    (ix_job_tags_tag_id_job_id), the same SQL on Postgres and SQLite.
+    """
+    if match not in TAG_MATCH_MODES:
+        raise ValueError(f"Invalid tag match mode: {match}")
+
+    names = list(dict.fromkeys(canonical_tag(tag) for tag in tags))
+    known = TagAlias.alias.in_(names)
+    wanted = select(TagAlias.tag_id).where(known)
+    if match == TAG_MATCH_ALL:
+        wanted_count = select(func.count(func.distinct(TagAlias.tag_id))).where(known).scalar_subquery()
+        matching = (
+            select(JobTag.job_id)
+            .where(JobTag.tag_id.in_(wanted))
+            .group_by(JobTag.job_id)
+            .having(func.count(JobTag.tag_id) == wanted_count)
+        )
+        # Unknown tags can't be matched, so "all" must fail outright.
+        all_known = select(func.count()).select_from(TagAlias).where(known).scalar_subquery() == len(names)
+        return and_(all_known, Job.id.in_(matching))
+    return Job.id.in_(select(JobTag.job_id).where(JobTag.tag_id.in_(wanted)))
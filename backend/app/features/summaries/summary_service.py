@@ -1,112 +1,100 @@
 from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, String
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from app.models.job import Job
+from app.models.tag import JobTag, Tag
+from app.services.job_projection import job_columns, job_row_encoder
+from app.features.summaries.filters.job_filter import TAG_MATCH_ANY, normalize_tags, tag_filter
 from datetime import datetime, timedelta
-from collections import Counter
+import asyncio
 import logging
 import json
 
 logging.basicConfig(level=logging.INFO)
 
+# Columns the summary actually renders; description is never fetched.
+SUMMARY_JOB_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "work_modality",
+    "url",
+    "tags",
+    "created_at",
+)
+
+# Entries in top_companies / top_skills.
+SUMMARY_TOP_N = 10
+
+# A summary whose requested window has no matching jobs widens to this many days.
+SUMMARY_FALLBACK_DAYS = 7
+
+# Windows end at window_anchor(): now, floored to this many minutes. A summary
+# is then fixed by its filters, the data version and the anchor, which the
+# router makes part of the cache key.
+SUMMARY_WINDOW_STEP_MINUTES = 5
+
+
+def window_anchor(now: Optional[datetime] = None) -> datetime:
+    """`now` (default: the current time) floored to SUMMARY_WINDOW_STEP_MINUTES."""
+    now = (now or datetime.now()).replace(second=0, microsecond=0)
+    return now - timedelta(minutes=now.minute % SUMMARY_WINDOW_STEP_MINUTES)
+
+
 class SummaryService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_daily_summary(
+    async def get_daily_summary(
         self, 
         location: Optional[str] = None,
         tags: Optional[List[str]] = None,
         period_days: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        tag_match: str = TAG_MATCH_ANY,
+        anchor: Optional[datetime] = None
     ) -> Dict:
-        """Get daily job summary with filters."""
+        """Get daily job summary with filters.
+
+        tag_match="any" keeps jobs with at least one of the tags,
+        "all" only jobs carrying every tag. When nothing matches in the last
+        `period_days`, the window widens to SUMMARY_FALLBACK_DAYS; `window`
+        in the summary reports the one used. Windows are measured back from
+        `anchor` (default: window_anchor()).
+        """
         
         try:
-            logging.info(f"Filters applied: location={location}, tags={tags}, period_days={period_days}, limit={limit}")            
+            logging.info(f"Filters applied: location={location}, tags={tags}, tag_match={tag_match}, period_days={period_days}, limit={limit}")            
             
-            # Date filter
-            since_date = datetime.now() - timedelta(days=period_days)
-            query = self.db.query(Job).filter(Job.created_at >= since_date)
-            
-            # Apply location filter using work_modality
-            if location and location.strip():
-                query = query.filter(
-                    func.lower(Job.work_modality).like(f"%{location.lower()}%")
-                )
-            
-            # Apply tags filter 
-            if tags and len(tags) > 0:
-                clean_tags = [tag.strip().lower() for tag in tags if tag.strip()]
-                if clean_tags: 
-                    tag_conditions = []
-                    for tag in clean_tags:
-                        tag_conditions.append(func.lower(func.cast(Job.tags, String)).like(f"%{tag}%"))
-                    query = query.filter(or_(*tag_conditions))
-            
-            jobs = query.order_by(Job.created_at.desc()).limit(limit).all()
-            
-            logging.info(f"Jobs found after query: {len(jobs)}")
-
-            # Fallback
-            if not jobs:
-                logging.info("No jobs found. Expanding search period to 7 days.")
-                since_date = datetime.now() - timedelta(days=7)
-                query = self.db.query(Job).filter(Job.created_at >= since_date)
-                
-                if location and location.strip():
-                    query = query.filter(
-                        func.lower(Job.work_modality).like(f"%{location.lower()}%")
-                    )
-                
-                if tags and len(tags) > 0:
-                    clean_tags = [tag.strip().lower() for tag in tags if tag.strip()]
-                    if clean_tags:
-                        tag_conditions = []
-                        for tag in clean_tags:
-                            tag_conditions.append(func.lower(func.cast(Job.tags, String)).like(f"%{tag}%"))
-                        query = query.filter(or_(*tag_conditions))
-                
-                jobs = query.order_by(Job.created_at.desc()).limit(limit).all()            
-
-            # Generate analytics
-            total_jobs = len(jobs)
-            companies = list(set([job.company for job in jobs if job.company]))
-            work_modalities = list(set([job.work_modality for job in jobs if job.work_modality]))
-            
-            # Process tags correctly
-            all_tags = []
-            for job in jobs:
-                parsed_tags = self._parse_job_tags(job.tags)
-                all_tags.extend(parsed_tags)
-            
-            top_tags = Counter(all_tags).most_common(10) if all_tags else []
+            clean_tags = normalize_tags(tags)
+
+            rows, stats, window = await self._fetch_window(
+                period_days, location, clean_tags, tag_match, limit, anchor or window_anchor()
+            )
             
+            logging.info(f"Jobs found after query: {stats['total_jobs']} (window: {window['days']} days)")
+
+            encode = job_row_encoder(SUMMARY_JOB_FIELDS, parse_tags=self._parse_job_tags)
+            jobs = [encode(row) for row in rows]
+
             return {
                 "summary": {
-                    "total_jobs": total_jobs,
+                    "total_jobs": stats["total_jobs"],
                     "period_days": period_days,
+                    "window": window,
                     "filters_applied": {
                         "location_filter": location,
                         "tags": tags,
+                        "tag_match": tag_match,
                         "limit": limit
                     },
-                    "top_companies": companies[:10],
-                    "work_modalities": work_modalities,
-                    "top_skills": [{"skill": tag, "count": count} for tag, count in top_tags]
+                    "top_companies": stats["top_companies"],
+                    "work_modalities": stats["work_modalities"],
+                    "top_skills": stats["top_skills"]
                 },
-                "jobs": [
-                    {
-                        "id": job.id,
-                        "title": job.title,
-                        "company": job.company,
-                        "work_modality": job.work_modality,
-                        "url": job.url,
-                        "tags": self._parse_job_tags(job.tags),
-                        "created_at": job.created_at.isoformat() if job.created_at else None
-                    }
-                    for job in jobs
-                ]
+                # created_at stays a datetime; ORJSONResponse renders it as ISO 8601.
+                "jobs": jobs
             }
             
         except Exception as e:
@@ -121,6 +109,7 @@ class SummaryService:
                     "filters_applied": {
                         "location_filter": location,
                         "tags": tags,
+                        "tag_match": tag_match,
                         "limit": limit
                     },
                     "top_companies": [],
@@ -130,6 +119,121 @@ class SummaryService:
                 "jobs": []
             }
     
+    def _window_criteria(self, since_date: datetime, location: Optional[str], clean_tags: List[str], tag_match: str) -> list:
+        """WHERE clauses shared by the job list and the window aggregates."""
+        criteria = [Job.created_at >= since_date]
+
+        # Apply location filter using work_modality
+        if location and location.strip():
+            criteria.append(func.lower(Job.work_modality).like(f"%{location.lower()}%"))
+
+        # Apply tags filter on whole, normalized tags
+        if clean_tags:
+            criteria.append(tag_filter(clean_tags, tag_match))
+
+        return criteria
+
+    def _build_query(self, period_days: int, location: Optional[str], clean_tags: List[str], tag_match: str):
+        """Filtered, newest-first jobs select for the last `period_days` days."""
+        since_date = datetime.now() - timedelta(days=period_days)
+        return self._jobs_query(self._window_criteria(since_date, location, clean_tags, tag_match))
+
+    def _jobs_query(self, criteria: list):
+        return select(*job_columns(SUMMARY_JOB_FIELDS)).where(*criteria).order_by(Job.created_at.desc())
+
+    def _aggregate_queries(self, since_date: datetime, criteria: list) -> list:
+        """
+        GROUP BY queries over the whole filtered window (not just the listed
+        jobs): work modalities (whose counts also sum to the total), top
+        companies and top skills.
+        """
+        modalities = (
+            select(Job.work_modality, func.count().label("count"))
+            .where(*criteria)
+            .group_by(Job.work_modality)
+            .order_by(func.count().desc(), Job.work_modality)
+        )
+        companies = (
+            select(Job.company, func.count().label("count"))
+            .where(*criteria, Job.company.isnot(None), Job.company != "")
+            .group_by(Job.company)
+            .order_by(func.count().desc(), Job.company)
+            .limit(SUMMARY_TOP_N)
+        )
+        tag_counts = select(JobTag.tag_id, func.count().label("count"))
+        if len(criteria) == 1:
+            # Date window only: job_tags carries created_at, so jobs is never read
+            # (index-only on ix_job_tags_created_at_tag_id).
+            tag_counts = tag_counts.where(JobTag.created_at >= since_date)
+        else:
+            tag_counts = tag_counts.join(Job, Job.id == JobTag.job_id).where(*criteria)
+        # Count per tag id first, then join the (small) grouped result to tags.
+        tag_counts = tag_counts.group_by(JobTag.tag_id).subquery("tag_counts")
+        skills = (
+            select(Tag.label, tag_counts.c.count)
+            .join(tag_counts, tag_counts.c.tag_id == Tag.id)
+            # Single-character tags were never reported as skills.
+            .where(func.length(Tag.name) > 1)
+            .order_by(tag_counts.c.count.desc(), Tag.label)
+            .limit(SUMMARY_TOP_N)
+        )
+        return [modalities, companies, skills]
+
+    async def _fetch_window(self, period_days: int, location: Optional[str], clean_tags: List[str], tag_match: str, limit: int, anchor: datetime):
+        """
+        (newest `limit` rows, window stats, window used) for the `period_days`
+        days before `anchor`, or the fallback window when those have no match.
+
+        The job list is read over the fallback window, newest first, so its
+        first row is the newest match and decides the window without another
+        query: rows inside the requested window are exactly that window's
+        list. The aggregates run concurrently with it over the requested
+        window and again over the fallback one only when that was empty.
+        """
+        since_date = anchor - timedelta(days=period_days)
+        fallback_days = max(period_days, SUMMARY_FALLBACK_DAYS)
+        fallback_since = anchor - timedelta(days=fallback_days)
+        criteria = self._window_criteria(since_date, location, clean_tags, tag_match)
+        fallback_criteria = self._window_criteria(fallback_since, location, clean_tags, tag_match)
+
+        rows, modalities, companies, skills = await self._execute_concurrently(
+            [self._jobs_query(fallback_criteria).limit(limit), *self._aggregate_queries(since_date, criteria)]
+        )
+        window_days = period_days
+        if rows and rows[0].created_at < since_date:
+            logging.info(f"No jobs in the last {period_days} days. Expanding the window to {fallback_days} days.")
+            window_days, since_date = fallback_days, fallback_since
+            modalities, companies, skills = await self._execute_concurrently(
+                self._aggregate_queries(fallback_since, fallback_criteria)
+            )
+        else:
+            rows = [row for row in rows if row.created_at >= since_date]
+
+        stats = {
+            "total_jobs": sum(count for _, count in modalities),
+            "top_companies": [company for company, _ in companies],
+            "work_modalities": [modality for modality, _ in modalities if modality],
+            "top_skills": [{"skill": skill, "count": count} for skill, count in skills],
+        }
+        window = {"days": window_days, "since": since_date, "expanded": window_days != period_days}
+        return rows, stats, window
+
+    async def _execute_concurrently(self, queries: list) -> List[List[Row]]:
+        """
+        Run `queries` at the same time, one session per query on this
+        session's engine (an AsyncSession runs one statement at a time).
+        Falls back to running them in turn on self.db if it has no single bind.
+        """
+        bind = self.db.bind
+        if bind is None:
+            return [list((await self.db.execute(query)).all()) for query in queries]
+
+        async def _run(query):
+            async with AsyncSession(bind) as db:
+                return list((await db.execute(query)).all())
+
+        return list(await asyncio.gather(*(_run(query) for query in queries)))
+
     def _parse_job_tags(self, tags) -> List[str]:
         """Helper method to parse job tags consistently"""
         if not tags:
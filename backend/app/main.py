@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
 from sqlalchemy.exc import IntegrityError
@@ -12,9 +13,12 @@ from app.routers import jobs_router
 from app.routers.notifications_router import router as notifications_router
 from app.middleware import rate_limit_middleware
 from sqlalchemy import text
-from app.database import get_db
+from app.database import get_async_db
 from app.routers.summary_router import router as summary_router
 from app.routers.ai_router import router as ai_router
+from app.routers.internal_router import router as internal_router
+from app.routers.analytics_router import router as analytics_router
+from app.services.response_cache import bind_warm_loop
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +34,8 @@ async def lifespan(app: FastAPI):
 
     job_scheduler = None
     email_scheduler = None
+    # Scheduler threads warm the response cache on this loop after each collection.
+    bind_warm_loop(asyncio.get_running_loop())
     
     # Try to start scheduler, but don't fail if it doesn't work
     try:
@@ -52,6 +58,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🔄️ Shutting down OrionJobs AI...")
+    bind_warm_loop(None)
     if job_scheduler:
         try:
             job_scheduler.shutdown()
@@ -97,8 +104,10 @@ app.add_middleware(
 # Routers
 app.include_router(jobs_router.router, prefix="/api/v1", tags=["jobs"])
 app.include_router(summary_router)
+app.include_router(analytics_router)
 app.include_router(notifications_router)
 app.include_router(ai_router, prefix="/api/v1", tags=["ai"])
+app.include_router(internal_router)
 
 @app.get("/")
 async def root():
@@ -110,11 +119,11 @@ async def root():
 
 # Only fixing the typo in the function name
 @app.get("/health")
-async def health_check(db=Depends(get_db)):
+async def health_check(db=Depends(get_async_db)):
     """ Health check endpoint - checks API and database"""
     db_status = "unhealthy"
     try:
-        result = db.execute(text("SELECT 1")).scalar()
+        result = (await db.execute(text("SELECT 1"))).scalar()
         db_status = "healthy" if result == 1 else "unhealthy"
     except Exception as e:
         db_status = f"error: {str(e)}"
@@ -1,2 +1,9 @@
 from .job import Job
-from .cache import APICache
\ No newline at end of file
+from .cache import APICache
+from .tag import JobTag, Tag, TagAlias, TagCooccurrence
+from .rollup import JobDailyCompany, JobDailyRollup, JobDailySketch
+
+# Keep job_tags (and tag co-occurrences), the daily rollups and sketches in sync with Jobs on every flush.
+from app.services import tag_dictionary  # noqa: E402,F401
+from app.analytics import rollups  # noqa: E402,F401
+from app.analytics import daily_sketches  # noqa: E402,F401
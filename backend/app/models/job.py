@@ -1,20 +1,94 @@
 from app.base import Base
-from sqlalchemy import Integer, String, DateTime, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import Integer, String, DateTime, Text, JSON, Computed, DDL, Index, event, func, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import List, Optional
 
+# Weighted full-text document: title > company/tags > description.
+# jobs_tags_text() is an IMMUTABLE wrapper because array_to_string() is only
+# STABLE and Postgres refuses non-immutable generation expressions.
+JOB_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(company, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, jobs_tags_text(tags)), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'D')"
+)
+
+CREATE_JOBS_TAGS_TEXT_FUNCTION = (
+    "CREATE OR REPLACE FUNCTION jobs_tags_text(tags text[]) RETURNS text "
+    "LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+    "AS $$ SELECT coalesce(array_to_string(tags, ' '), '') $$"
+)
+
+
+def pg_trgm_available(ddl, target, bind, **kw) -> bool:
+    """ddl_if() hook: only emit trigram DDL on Postgres servers that ship pg_trgm."""
+    if bind is None or bind.dialect.name != "postgresql":
+        return False
+    return bool(bind.execute(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar())
+
 
 class Job(Base):
     __tablename__ = "jobs"
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # Every list/summary query filters or orders by created_at.
+        Index("ix_jobs_created_at", "created_at"),
+        Index("ix_jobs_source_created_at", "source", "created_at"),
+        Index("ix_jobs_work_modality_created_at", "work_modality", "created_at"),
+        # URL dedup lookup in save_jobs_to_db.
+        Index("ix_jobs_url", "url"),
+        Index("ix_jobs_tags", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    # Don't RETURNING the generated search_vector on every insert; it's deferred anyway.
+    __mapper_args__ = {"eager_defaults": False}
+
+    # Partitioned deployments (app/services/job_partitions.py) key rows on (id, created_at).
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String)
     company: Mapped[str] = mapped_column(String)
     location: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Short single-line preview computed at ingest for card/list views.
+    excerpt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     work_modality: Mapped[str] = mapped_column(String, nullable=False)
-    tags: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), nullable=True)  # Fixed: List[str] type
+    # Postgres array; SQLite databases store the same list as JSON text.
+    tags: Mapped[Optional[List[str]]] = mapped_column(
+        ARRAY(Text).with_variant(JSON(), "sqlite"), nullable=True
+    )
     url: Mapped[str] = mapped_column(String, nullable=False)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
\ No newline at end of file
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Generated by Postgres; deferred so list/detail queries never fetch it.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(JOB_SEARCH_DOCUMENT, persisted=True),
+        nullable=True,
+        deferred=True,
+    )
+
+
+# Dedup lookup in save_jobs_to_db: lower(title) = ? AND lower(company) = ?
+Index("ix_jobs_lower_title_company", func.lower(Job.title), func.lower(Job.company))
+
+# Substring filters on work_modality (lower(...) LIKE '%remote%') need trigrams.
+Index(
+    "ix_jobs_lower_work_modality_trgm",
+    func.lower(Job.work_modality).label("lower_work_modality"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_work_modality": "gin_trgm_ops"},
+).ddl_if(callable_=pg_trgm_available)
+
+event.listen(
+    Job.__table__,
+    "before_create",
+    DDL(CREATE_JOBS_TAGS_TEXT_FUNCTION).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Job.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(callable_=pg_trgm_available),
+)
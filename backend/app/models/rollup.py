@@ -0,0 +1,47 @@
+from app.base import Base
+from sqlalchemy import Date, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import date
+
+
+class JobDailyRollup(Base):
+    """
+    Jobs per day per dimension value, maintained by app/analytics/rollups.py.
+
+    dimension is one of "total" (value "all"), "source", "work_modality",
+    "country" or "tag" (canonical tag name). A year of one dimension is a few
+    hundred to a few thousand rows, so analytics never scan jobs.
+    """
+    __tablename__ = "job_daily_rollups"
+    __table_args__ = (
+        # Top values over a window: dimension = ? AND day >= ? GROUP BY value.
+        Index("ix_job_daily_rollups_dimension_day", "dimension", "day"),
+    )
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    dimension: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[str] = mapped_column(String, primary_key=True)
+    jobs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class JobDailyCompany(Base):
+    """Jobs per day per company; one row per distinct company and day."""
+    __tablename__ = "job_daily_companies"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    company: Mapped[str] = mapped_column(String, primary_key=True)
+    jobs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class JobDailySketch(Base):
+    """
+    Per-day probabilistic sketch, maintained by app/analytics/daily_sketches.py.
+
+    kind is "companies" or "locations" (HyperLogLog registers) or "tags"
+    (SpaceSaving heavy hitters); see app/analytics/sketches.py.
+    """
+    __tablename__ = "job_daily_sketches"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, primary_key=True)
+    sketch: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
@@ -0,0 +1,59 @@
+from app.base import Base
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+
+
+class Tag(Base):
+    """Canonical skill tag; `name` is the normalized spelling ("javascript")."""
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    # First spelling seen at ingest, for display ("JavaScript").
+    label: Mapped[str] = mapped_column(String, nullable=False)
+
+
+class TagAlias(Base):
+    """Every normalized spelling of a tag, including its own name ("js" -> javascript)."""
+    __tablename__ = "tag_aliases"
+    __table_args__ = (
+        Index("ix_tag_aliases_tag_id", "tag_id"),
+    )
+
+    alias: Mapped[str] = mapped_column(String, primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), nullable=False)
+
+
+class JobTag(Base):
+    """
+    Job <-> tag association, maintained from Job.tags by app/services/tag_dictionary.py.
+
+    No foreign key to jobs: a partitioned jobs table is keyed on (id, created_at).
+    created_at is copied from the job so windowed tag counts never touch jobs.
+    """
+    __tablename__ = "job_tags"
+    __table_args__ = (
+        # Tag filters: job ids carrying a tag.
+        Index("ix_job_tags_tag_id_job_id", "tag_id", "job_id"),
+        # Tag counts over a created_at window (index-only GROUP BY tag_id).
+        Index("ix_job_tags_created_at_tag_id", "created_at", "tag_id"),
+    )
+
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+class TagCooccurrence(Base):
+    """
+    Jobs carrying both tags, maintained with job_tags by app/analytics/cooccurrence.py.
+
+    Stored in both directions so a tag's row is one primary-key range; the
+    diagonal (tag_id = other_tag_id) holds the tag's own job count.
+    """
+    __tablename__ = "tag_cooccurrences"
+
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    other_tag_id: Mapped[int] = mapped_column(ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    jobs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,149 @@
+"""
+Connection pool instrumentation: checkout wait histograms, in-use/overflow
+gauges and connection lifetimes, one PoolMetrics per engine.
+
+Lifetimes and in-use counts come from SQLAlchemy pool events. Pools have no
+"before checkout" event, so wait time is measured by a per-engine subclass
+of the pool class around `_do_get()` (the step that blocks on a free slot or
+opens a new connection). Pool.recreate() reuses `self.__class__`, so the
+instrumentation survives engine.dispose().
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Sequence
+from sqlalchemy import event, exc
+
+# Milliseconds waited for a connection.
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Seconds a physical connection stayed open.
+CONNECTION_LIFETIME_BUCKETS_S = (1, 10, 60, 300, 900, 1800, 3600, 7200)
+
+# name -> PoolMetrics, for the stats endpoint.
+REGISTRY: Dict[str, "PoolMetrics"] = {}
+
+
+class Histogram:
+    """Fixed-bucket histogram; each bucket counts observations <= its bound."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            return {
+                "count": self.count,
+                "sum": round(self.total, 3),
+                "max": round(self.max, 3),
+                "buckets": buckets,
+            }
+
+
+class PoolMetrics:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkout_wait_ms = Histogram(CHECKOUT_WAIT_BUCKETS_MS)
+        self.connection_lifetime_s = Histogram(CONNECTION_LIFETIME_BUCKETS_S)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.engine = None
+        # Pool events fire on whichever thread checks out; `+=` is not atomic.
+        self._lock = threading.Lock()
+        REGISTRY[name] = self
+
+    def pool_class(self, base):
+        """Subclass of `base` (e.g. QueuePool) that times every checkout into this object."""
+        metrics = self
+
+        def _do_get(pool):
+            started = time.perf_counter()
+            try:
+                return base._do_get(pool)
+            except exc.TimeoutError:
+                with metrics._lock:
+                    metrics.checkout_timeouts += 1
+                raise
+            finally:
+                metrics.checkout_wait_ms.observe((time.perf_counter() - started) * 1000)
+
+        return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+    def attach(self, engine) -> None:
+        """Listen to pool events on a sync Engine (use async_engine.sync_engine for async ones)."""
+        self.engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        connection_record.info["connected_at"] = time.monotonic()
+        with self._lock:
+            self.connects += 1
+
+    def _on_close(self, dbapi_connection, connection_record):
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is not None:
+            self.connection_lifetime_s.observe(time.monotonic() - connected_at)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def snapshot(self) -> Dict:
+        pool = self.engine.pool if self.engine is not None else None
+        gauges = {}
+        if pool is not None:
+            gauges["pool_class"] = type(pool).__name__
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                method = getattr(pool, name, None)
+                if method is not None:
+                    gauges[name] = method()
+            gauges["timeout"] = getattr(pool, "_timeout", None)
+        with self._lock:
+            counters = {
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+            }
+        return {
+            **gauges,
+            **counters,
+            "checkout_wait_ms": self.checkout_wait_ms.snapshot(),
+            "connection_lifetime_s": self.connection_lifetime_s.snapshot(),
+        }
@@ -2,18 +2,27 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.job import Job
 from app.services.ai_service import ai_service
+from app.services.single_flight import SingleFlight
 
 router = APIRouter()
 
+# A popular job opened by many users at once costs one lookup and one Gemini call.
+analyze_flight = SingleFlight("ai/analyze-job")
+
 @router.get("/ai/analyze-job/{job_id}")
-def analyze_job(job_id: int, db: Session = Depends(get_db)):
+def analyze_job(job_id: int, db: Session = Depends(get_read_db)):
     """
     Analyzes a specific job from the database using AI.
     Returns insights like pros, cons, a summary, and interview questions.
+    Concurrent requests for the same job share one analysis.
     """
+    return analyze_flight.do(job_id, lambda: _analyze_job(job_id, db))
+
+
+def _analyze_job(job_id: int, db: Session) -> Dict[str, Any]:
     job = db.query(Job).filter(Job.id == job_id).first()
     
     if not job:
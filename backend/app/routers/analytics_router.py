@@ -0,0 +1,119 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.analytics.analytics_service import AnalyticsService
+from app.analytics.charts.job_trends import JobTrendsChartService
+from app.database import get_async_read_db
+
+router = APIRouter(prefix="/api/v1/analytics", tags=["analytics"])
+
+# Rollups keep every day, so long windows stay cheap.
+MAX_WINDOW_DAYS = 730
+
+
+@router.get("/top", response_class=ORJSONResponse)
+async def get_top_values(
+    dimension: str = Query("tag", description="total, source, work_modality, country or tag"),
+    days: int = Query(90, ge=1, le=MAX_WINDOW_DAYS, description="Days to look back, including today"),
+    limit: int = Query(10, ge=1, le=100, description="Max values to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Values with the most jobs over the window, from the daily rollups."""
+    try:
+        values = await AnalyticsService(db).top_values(dimension, days, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({"dimension": dimension, "days": days, "values": values})
+
+
+@router.get("/daily", response_class=ORJSONResponse)
+async def get_daily_series(
+    dimension: str = Query("total", description="total, source, work_modality, country or tag"),
+    days: int = Query(90, ge=1, le=MAX_WINDOW_DAYS, description="Days to look back, including today"),
+    values: Optional[List[str]] = Query(None, description="Values to chart; defaults to the top `limit`"),
+    limit: int = Query(10, ge=1, le=50, description="Number of top values when `values` is not given"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Jobs per day per value, from the daily rollups."""
+    try:
+        data = await AnalyticsService(db).daily_series(dimension, days, values, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(data)
+
+
+@router.get("/companies", response_class=ORJSONResponse)
+async def get_company_activity(
+    days: int = Query(90, ge=1, le=MAX_WINDOW_DAYS, description="Days to look back, including today"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Distinct hiring companies per day and over the window."""
+    return ORJSONResponse(await AnalyticsService(db).company_activity(days))
+
+
+@router.get("/charts/dashboard", response_class=ORJSONResponse)
+async def get_dashboard_charts(
+    days: int = Query(30, ge=1, le=MAX_WINDOW_DAYS, description="Days to chart, including today"),
+    bucket: str = Query("day", description="Trend granularity: day or week"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Every dashboard widget (totals, trend, modality, locations, companies,
+    skills) pre-bucketed over all jobs in the window, cached until the next
+    ingestion.
+    """
+    try:
+        data = await JobTrendsChartService(db).dashboard(days, bucket)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(data)
+
+
+@router.get("/estimates", response_class=ORJSONResponse)
+async def get_estimates(
+    days: int = Query(365, ge=1, le=MAX_WINDOW_DAYS, description="Days to look back, including today"),
+    limit: int = Query(10, ge=1, le=100, description="Max top tags to return"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Approximate distinct companies and locations and top tags, merged from
+    daily sketches so long windows stay interactive.
+    """
+    return ORJSONResponse(await AnalyticsService(db).estimates(days, limit))
+
+
+@router.get("/trends", response_class=ORJSONResponse)
+async def get_trends(
+    dimension: str = Query("tag", description="tag (skills) or company"),
+    days: int = Query(90, ge=14, le=MAX_WINDOW_DAYS, description="Days of history, including today"),
+    limit: int = Query(10, ge=1, le=100, description="Max risers, fallers and spikes each"),
+    min_jobs: int = Query(3, ge=1, description="Ignore values with fewer jobs in both weeks"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Week-over-week risers and fallers, moving averages and z-score spikes,
+    cached until the next ingestion.
+    """
+    try:
+        data = await AnalyticsService(db).trends(dimension, days, limit, min_jobs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(data)
+
+
+@router.get("/related-skills", response_class=ORJSONResponse)
+async def get_related_skills(
+    skill: str = Query(..., min_length=1, description="Skill tag, any spelling (\"k8s\", \"Kubernetes\")"),
+    limit: int = Query(10, ge=1, le=100, description="Max related skills to return"),
+    score: str = Query("lift", description="lift, pmi or jobs (shared job count)"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Skills most often listed together with `skill`, from the tag co-occurrence index."""
+    try:
+        data = await AnalyticsService(db).related_skills(skill, limit, score)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if data is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return ORJSONResponse(data)
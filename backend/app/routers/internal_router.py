@@ -0,0 +1,40 @@
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import ORJSONResponse
+from app.config import ENVIRONMENT, INTERNAL_STATS_TOKEN
+from app.database import database_pool_metrics
+from app.services.single_flight import single_flight_metrics
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """
+    Guard for operator endpoints. Without INTERNAL_STATS_TOKEN they are open
+    in development only; in any other environment they fail closed.
+    """
+    if not INTERNAL_STATS_TOKEN:
+        if ENVIRONMENT != "development":
+            raise HTTPException(status_code=403, detail="Internal endpoints are disabled")
+        return
+    if not hmac.compare_digest(x_internal_token or "", INTERNAL_STATS_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid internal token")
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/stats/db", response_class=ORJSONResponse)
+def get_database_stats():
+    """Pool sizing, in-use/overflow gauges, checkout wait and connection lifetime histograms."""
+    return ORJSONResponse(database_pool_metrics())
+
+
+@router.get("/stats/coalescing", response_class=ORJSONResponse)
+def get_coalescing_stats():
+    """Per endpoint: computations run, requests that joined one in flight, errors."""
+    return ORJSONResponse(single_flight_metrics())
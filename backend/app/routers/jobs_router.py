@@ -1,128 +1,330 @@
 import logging
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.database import get_db
+from sqlalchemy import func
+from app.database import get_read_db, is_postgresql
 from app.models.job import Job
+from app.services.job_export import EXPORT_BATCH_SIZE, EXPORT_MEDIA_TYPES, export_chunks
+from app.services.conditional_get import conditional_response, newest_created_at, with_validators
+from app.services.data_version import current_data_version
+from app.services.job_facets import facet_counts, facets_cache, facets_cache_key, parse_facets
+from app.services.job_formats import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    arrow_page,
+    msgpack_page,
+    negotiate_media_type,
+)
+from app.services.job_projection import (
+    JOB_FIELDS,
+    job_columns,
+    job_row_encoder,
+    resolve_fields,
+)
+from app.services.response_cache import cache_response, cached_response, normalize_text
+from app.services.job_search import (
+    build_ts_query,
+    fetch_snippets,
+    legacy_search_filter,
+    search_filter,
+    search_rank,
+)
+from app.config import RESPONSE_CACHE_MAX_PAGE
 from job_schedule import collect_remote_jobs
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Sequence
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.get("/jobs")
+# Media types the list endpoint can negotiate via Accept; JSON is the default.
+LIST_MEDIA_TYPES = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, ARROW_MEDIA_TYPE)
+
+# The list body depends on Accept (format) and, for cached JSON pages, Accept-Encoding.
+LIST_VARY = "Accept, Accept-Encoding"
+
+# Upper bound on ids per /jobs/batch request (keeps the IN list and response small).
+BATCH_MAX_IDS = 200
+
+# jobs.id is a 32-bit INTEGER; larger ids can't exist and would overflow the bind.
+MAX_JOB_ID = 2**31 - 1
+
+
+def _job_filter_criteria(db: Session, search: Optional[str], remote: Optional[bool]):
+    """Shared search/remote filters. Returns (criteria, ts_query); ts_query is None unless FTS is used."""
+    criteria = []
+    ts_query = None
+    if search:
+        if is_postgresql(db):
+            ts_query = build_ts_query(search)
+        if ts_query is not None:
+            criteria.append(search_filter(ts_query))
+        else:
+            criteria.append(legacy_search_filter(search))
+
+    if remote is True:
+        # Filter by remote work modality (case-insensitive).
+        # lower() LIKE matches the trigram index shared with SummaryService.
+        criteria.append(func.lower(Job.work_modality).like("%remote%"))
+
+    return criteria, ts_query
+
+
+def _apply_job_filters(query, db: Session, search: Optional[str], remote: Optional[bool]):
+    """_job_filter_criteria() applied to `query`. Returns (query, ts_query)."""
+    criteria, ts_query = _job_filter_criteria(db, search, remote)
+    return query.filter(*criteria), ts_query
+
+
+def _negotiate(accept: Optional[str], offered: Sequence[str]) -> str:
+    media_type = negotiate_media_type(accept, offered)
+    if media_type is None:
+        raise HTTPException(status_code=406, detail=f"Acceptable media types: {', '.join(offered)}")
+    return media_type
+
+
+def _parse_job_ids(ids: str) -> List[int]:
+    """Comma-separated ids -> de-duplicated ints in request order."""
+    job_ids = {}
+    for value in ids.split(","):
+        value = value.strip()
+        if not value:
+            continue
+        # isdigit() alone accepts non-ASCII digits such as "²".
+        if not (value.isascii() and value.isdigit()):
+            raise ValueError(f"Invalid job id: {value}")
+        job_id = int(value)
+        if not 1 <= job_id <= MAX_JOB_ID:
+            raise ValueError(f"Job id out of range: {value}")
+        job_ids[job_id] = None
+        if len(job_ids) > BATCH_MAX_IDS:
+            raise ValueError(f"Too many job ids (max {BATCH_MAX_IDS})")
+    if not job_ids:
+        raise ValueError("No job ids given")
+    return list(job_ids)
+
+
+@router.get("/jobs", response_class=ORJSONResponse)
 def get_jobs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(12, ge=1, le=100, description="Items per page"),
-    search: Optional[str] = Query(None, description="Search by title or company"),
+    search: Optional[str] = Query(None, description="Full-text search over title, company, tags and description"),
     remote: Optional[bool] = Query(None, description="Filter remote jobs only"),
-    db: Session = Depends(get_db)
+    highlight: bool = Query(False, description="Include highlighted description snippets for search matches"),
+    view: str = Query("full", description="Field set: compact (no description) or full"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; overrides view"),
+    facets: Optional[str] = Query(None, description="Comma-separated facet counts to include: source, work_modality, location, tags"),
+    accept: Optional[str] = Header(None, description="application/json, application/x-msgpack or application/vnd.apache.arrow.stream"),
+    accept_encoding: Optional[str] = Header(None, include_in_schema=False),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+    if_modified_since: Optional[str] = Header(None, include_in_schema=False),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get paginated list of jobs with filters.
     Optimized with database-level pagination.
+    On Postgres, search is ranked full-text matching backed by a GIN index.
+    Only the columns needed for the requested view/fields are fetched, as
+    plain rows encoded straight to orjson (no ORM objects, no jsonable_encoder).
+    Bulk clients can ask for column-oriented MessagePack or Arrow IPC instead.
+    `facets` adds top-value counts over the whole filtered set (cached until
+    the next ingestion). The first RESPONSE_CACHE_MAX_PAGE pages of JSON are
+    cached whole, pre-compressed, until the next ingestion. Every format
+    carries an ETag/Last-Modified for conditional requests (304 Not Modified).
     """
     try:
-        # Base query
-        query = db.query(Job)
-        
-        # Apply filters
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Job.title.ilike(search_pattern),
-                    Job.company.ilike(search_pattern)
-                )
-            )
-        
-        if remote is True:
-            # Filter by remote work modality (case-insensitive)
-            query = query.filter(
-                Job.work_modality.ilike("%remote%")
-            )
+        selected_fields = resolve_fields(fields, view)
+        facet_names = parse_facets(facets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    media_type = _negotiate(accept, LIST_MEDIA_TYPES)
+    # The cache keys and the query must see the same text: spacing decides
+    # between prefix and websearch matching (SHORT_QUERY_MAX_LENGTH).
+    search = normalize_text(search)
+
+    request_key = (
+        "jobs", media_type, page, page_size, search, remote,
+        highlight and bool(search), tuple(selected_fields), tuple(facet_names),
+    )
+    cacheable = media_type == JSON_MEDIA_TYPE and page <= RESPONSE_CACHE_MAX_PAGE
+    if cacheable:
+        cached = cached_response(request_key, accept_encoding, if_none_match, if_modified_since, LIST_VARY)
+        if cached is not None:
+            return cached
+    else:
+        not_modified = conditional_response(request_key, if_none_match, if_modified_since, {"Vary": LIST_VARY})
+        if not_modified is not None:
+            return not_modified
+    version = current_data_version()
+
+    try:
+        # Base query with filters
+        criteria, ts_query = _job_filter_criteria(db, search, remote)
+        query = db.query(*job_columns(selected_fields)).filter(*criteria)
         
         # Get total count BEFORE pagination
-        total = query.count()
+        total = query.with_entities(func.count(Job.id)).scalar()
+
+        facet_data = None
+        if facet_names:
+            cache_key = facets_cache_key(search, remote, facet_names)
+            facet_data = facets_cache.get(cache_key)
+            if facet_data is None:
+                facet_data = facet_counts(db, criteria, facet_names)
+                facets_cache.set(cache_key, facet_data, version)
         
         # Apply pagination (OFFSET and LIMIT)
         offset = (page - 1) * page_size
-        jobs = query.order_by(Job.created_at.desc()).offset(offset).limit(page_size).all()
+        if ts_query is not None:
+            query = query.order_by(search_rank(ts_query).desc(), Job.created_at.desc())
+        else:
+            query = query.order_by(Job.created_at.desc())
+        rows = query.offset(offset).limit(page_size).all()
+
+        last_modified = newest_created_at(getattr(row, "created_at", None) for row in rows)
+
+        snippets = {}
+        if highlight and ts_query is not None:
+            snippets = fetch_snippets(db, [row.id for row in rows], ts_query)
+
+        if media_type != JSON_MEDIA_TYPE:
+            extra_columns = {}
+            if highlight and search:
+                extra_columns["snippet"] = [snippets.get(row.id) for row in rows]
+            meta = {"total": total, "page": page, "page_size": page_size}
+            if facet_data is not None:
+                meta["facets"] = facet_data
+            encode_page = msgpack_page if media_type == MSGPACK_MEDIA_TYPE else arrow_page
+            body = encode_page(rows, selected_fields, extra_columns, **meta)
+            return with_validators(Response(body, media_type=media_type), request_key, version,
+                                   last_modified, if_none_match, {"Vary": LIST_VARY})
         
         # Format jobs for response
+        encode = job_row_encoder(selected_fields)
         jobs_list = []
-        for job in jobs:
-            # Handle tags formatting
-            if isinstance(job.tags, list):
-                formatted_tags = job.tags
-            elif isinstance(job.tags, str) and job.tags:
-                formatted_tags = job.tags.split(",")
-            else:
-                formatted_tags = []
-            
-            jobs_list.append({
-                "id": job.id,
-                "title": job.title,
-                "company": job.company,
-                "location": getattr(job, 'location', None),
-                "work_modality": job.work_modality,
-                "description": getattr(job, 'description', None),
-                "tags": formatted_tags,
-                "url": job.url,
-                "created_at": str(job.created_at),
-                "source": getattr(job, 'source', None)
-            })
+        for row in rows:
+            job_data = encode(row)
+            if highlight and search:
+                job_data["snippet"] = snippets.get(row.id)
+            jobs_list.append(job_data)
         
-        return {
+        response = {
             "jobs": jobs_list,
             "total": total,
             "page": page,
             "page_size": page_size
         }
+        if facet_data is not None:
+            response["facets"] = facet_data
+        if cacheable:
+            return cache_response(request_key, response, version, accept_encoding, last_modified,
+                                  if_none_match, LIST_VARY)
+        return with_validators(ORJSONResponse(response), request_key, version, last_modified,
+                               if_none_match, {"Vary": LIST_VARY})
         
     except Exception as e:
         logger.exception(f"Error in get_jobs: {str(e)}")  # Debug log
-        return {
+        return ORJSONResponse({
             "jobs": [],
             "total": 0,
             "page": page,
             "page_size": page_size,
             "error": str(e)
-        }
+        }, headers={"Vary": LIST_VARY})
 
 
-@router.get("/jobs/{job_id}")
-def get_job_by_id(job_id: int, db: Session = Depends(get_db)):
-    """Get single job by ID"""
+@router.get("/jobs/export", response_class=StreamingResponse)
+def export_jobs(
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv|msgpack|arrow)$", description="Export format: ndjson, csv, msgpack or arrow; defaults to the Accept header, then ndjson"),
+    since: Optional[datetime] = Query(None, description="Only jobs created at or after this time (incremental export)"),
+    search: Optional[str] = Query(None, description="Full-text search over title, company, tags and description"),
+    remote: Optional[bool] = Query(None, description="Filter remote jobs only"),
+    view: str = Query("full", description="Field set: compact (no description) or full"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; overrides view"),
+    accept: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Stream every matching job, oldest first, as NDJSON, CSV, MessagePack or Arrow IPC.
+    Rows come off a server-side cursor in batches, so memory stays flat
+    regardless of table size. Pass the last exported created_at as `since`
+    to resume or mirror incrementally (dedupe on id at the boundary).
+    """
     try:
-        job = db.query(Job).filter(Job.id == job_id).first()
+        selected_fields = resolve_fields(fields, view)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if format is None:
+        media_type = _negotiate(accept, list(EXPORT_MEDIA_TYPES.values()))
+        format = next(name for name, value in EXPORT_MEDIA_TYPES.items() if value == media_type)
+
+    query, _ = _apply_job_filters(db.query(*job_columns(selected_fields)), db, search, remote)
+    if since is not None:
+        query = query.filter(Job.created_at >= since)
+    # yield_per turns on stream_results: a named (server-side) cursor on Postgres.
+    query = query.order_by(Job.created_at, Job.id).yield_per(EXPORT_BATCH_SIZE)
+
+    return StreamingResponse(
+        export_chunks(format, query, selected_fields),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        # Without `format` the body depends on Accept.
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"', "Vary": "Accept"},
+    )
+
+
+@router.get("/jobs/batch", response_class=ORJSONResponse)
+def get_jobs_batch(
+    ids: str = Query(..., description=f"Comma-separated job ids, at most {BATCH_MAX_IDS}"),
+    view: str = Query("full", description="Field set: compact (no description) or full"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; overrides view"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Get many jobs in one round trip and one `WHERE id IN (...)` query.
+    Jobs come back in request order; ids that don't exist are listed in `missing`.
+    """
+    try:
+        selected_fields = resolve_fields(fields, view)
+        job_ids = _parse_job_ids(ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = db.query(*job_columns(selected_fields)).filter(Job.id.in_(job_ids)).all()
+    encode = job_row_encoder(selected_fields)
+    jobs_by_id = {row.id: encode(row) for row in rows}
+
+    return ORJSONResponse({
+        "jobs": [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id],
+        "missing": [job_id for job_id in job_ids if job_id not in jobs_by_id],
+    })
+
+
+@router.get("/jobs/{job_id}", response_class=ORJSONResponse)
+def get_job_by_id(
+    job_id: int,
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+    if_modified_since: Optional[str] = Header(None, include_in_schema=False),
+    db: Session = Depends(get_read_db)
+):
+    """Get single job by ID (with ETag/Last-Modified for conditional requests)"""
+    request_key = ("job", job_id)
+    not_modified = conditional_response(request_key, if_none_match, if_modified_since)
+    if not_modified is not None:
+        return not_modified
+    version = current_data_version()
+    try:
+        row = db.query(*job_columns(JOB_FIELDS)).filter(Job.id == job_id).first()
         
-        if not job:
+        if not row:
             return {
                 "message": "Job not found",
                 "status": "error"
             }
         
-        # Handle tags formatting
-        if isinstance(job.tags, list):
-            formatted_tags = job.tags
-        elif isinstance(job.tags, str) and job.tags:
-            formatted_tags = job.tags.split(",")
-        else:
-            formatted_tags = []
-        
-        return {
-            "id": job.id,
-            "title": job.title,
-            "company": job.company,
-            "location": getattr(job, 'location', None),
-            "work_modality": job.work_modality,
-            "description": getattr(job, 'description', None),
-            "tags": formatted_tags,
-            "url": job.url,
-            "created_at": str(job.created_at),
-            "source": getattr(job, 'source', None)
-        }
+        return with_validators(ORJSONResponse(job_row_encoder(JOB_FIELDS)(row)), request_key, version,
+                               newest_created_at([row.created_at]), if_none_match)
         
     except Exception as e:
         return {
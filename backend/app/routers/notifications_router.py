@@ -4,8 +4,8 @@ import logging
 from ..features.notifications.email_service import EmailService
 from ..features.summaries.summary_service import SummaryService
 from .. import config
-from ..database import get_db
-from sqlalchemy.orm import Session
+from ..database import get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/v1/notifications", tags=["notifications"])
@@ -71,7 +71,7 @@ async def send_daily_summary_email(
     recipients: Optional[List[str]] = Query(None),
     period_days: int = Query(default=1),
     limit: int = Query(default=50),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Send daily summary email."""
     try:
@@ -141,7 +141,7 @@ async def send_daily_summary_email(
         # Step 5: Get summary data
         try:
             logger.info(f"📊 Getting summary data for {final_period_days} days, limit {final_limit}")
-            summary_data = summary_service.get_daily_summary(
+            summary_data = await summary_service.get_daily_summary(
                 period_days=final_period_days, 
                 limit=final_limit
             )
@@ -1,49 +1,107 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from functools import partial
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.database import get_db
-from app.features.summaries.summary_service import SummaryService
+from app.database import get_async_read_db
+from app.features.summaries.filters.job_filter import normalize_tags
+from app.features.summaries.summary_service import SummaryService, window_anchor
+from app.services.conditional_get import newest_created_at
+from app.services.data_version import current_data_version
+from app.services.response_cache import body_response, cached_response, normalize_text, store_body
+from app.services.single_flight import SingleFlight
 
 router = APIRouter(prefix="/api/v1/summary", tags=["summaries"])
 
-@router.get("/daily")
+# Cache misses for the same summary (a dashboard load right after ingestion)
+# share one query and one serialization.
+summary_flight = SingleFlight("summary")
+
+
+async def _summary_response(cache_key, compute, accept_encoding: Optional[str], if_none_match: Optional[str]):
+    """Run `compute` once for concurrent identical misses, cache its body and answer this request."""
+    version = current_data_version()
+
+    async def fill():
+        data = await compute()
+        if "error" in data:
+            return data, None
+        last_modified = newest_created_at(job.get("created_at") for job in data["jobs"])
+        return data, store_body(cache_key, data, version, last_modified)
+
+    data, body = await summary_flight.do_async((cache_key, version), fill)
+    if body is None:
+        return ORJSONResponse(data)
+    return body_response(body, accept_encoding, if_none_match)
+
+
+@router.get("/daily", response_class=ORJSONResponse)
 async def get_daily_summary(
     location: Optional[str] = Query(None, description="Filter by work modality (remote, hybrid, onsite)"),
     tags: Optional[List[str]] = Query(None, description="Filter by skills/tags"),
+    tag_match: str = Query("any", pattern="^(any|all)$", description="Match any of the tags or all of them"),
     period_days: int = Query(1, ge=1, le=30, description="Days to look back"),
     limit: int = Query(50, ge=1, le=200, description="Max jobs to return"),
     format: str = Query("json", description="Response format: json, telegram, discord"),
-    db: Session = Depends(get_db)
+    accept_encoding: Optional[str] = Header(None, include_in_schema=False),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+    if_modified_since: Optional[str] = Header(None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get daily job summary with smart filtering.
     
     Note: 'location' parameter actually filters by work_modality field 
     (remote, hybrid, onsite) since the Job model doesn't have a location field.
+    JSON responses are cached, pre-compressed, until the next ingestion, and
+    carry an ETag/Last-Modified for conditional requests (304 Not Modified).
     """
-
+    # Filters are matched case-insensitively and tags in any order, so normalize
+    # them once: equivalent requests then share a cache entry and response body.
+    location = normalize_text(location)
+    tags = sorted(normalize_tags(tags)) or None
+    # The window start is part of the key: once it moves, so do the cached body and validators.
+    anchor = window_anchor()
+    cache_key = ("summary/daily", location, tuple(tags or ()), tag_match, period_days, limit, anchor)
     summary_service = SummaryService(db)
-    data = summary_service.get_daily_summary(
+    compute = partial(
+        summary_service.get_daily_summary,
         location=location,
         tags=tags,
         period_days=period_days,
-        limit=limit
+        limit=limit,
+        tag_match=tag_match,
+        anchor=anchor
     )
 
     if format == "json":
-        return data
-    elif format == "telegram":
-        return {"message": "Telegram format coming soon", "data": data}
+        cached = cached_response(cache_key, accept_encoding, if_none_match, if_modified_since)
+        if cached is not None:
+            return cached
+        return await _summary_response(cache_key, compute, accept_encoding, if_none_match)
+
+    data = await compute()
+    if format == "telegram":
+        return ORJSONResponse({"message": "Telegram format coming soon", "data": data})
     elif format == "discord":
-        return {"message": "Discord format coming soon", "data": data}
+        return ORJSONResponse({"message": "Discord format coming soon", "data": data})
     else:
         return {"error": "Invalid format. Use: json, telegram, or discord"}
 
-@router.get("/recent")
+@router.get("/recent", response_class=ORJSONResponse)
 async def get_recent_jobs(
     limit: int = Query(50, ge=1, le=200, description="Max jobs to return"),
-    db: Session = Depends(get_db)
+    accept_encoding: Optional[str] = Header(None, include_in_schema=False),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+    if_modified_since: Optional[str] = Header(None, include_in_schema=False),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get recent jobs without filters"""
+    """Get recent jobs without filters (cached until the next ingestion, with ETag/Last-Modified)"""
+    anchor = window_anchor()
+    cache_key = ("summary/recent", limit, anchor)
+    cached = cached_response(cache_key, accept_encoding, if_none_match, if_modified_since)
+    if cached is not None:
+        return cached
+
     summary_service = SummaryService(db)
-    data = summary_service.get_daily_summary(period_days=30, limit=limit)
-    return data
+    compute = partial(summary_service.get_daily_summary, period_days=30, limit=limit, anchor=anchor)
+    return await _summary_response(cache_key, compute, accept_encoding, if_none_match)
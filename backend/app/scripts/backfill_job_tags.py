@@ -0,0 +1,32 @@
+"""
+Link existing jobs to the tag dictionary (job_tags) and recount the tag
+co-occurrences from it. Safe to re-run: jobs that already have job_tags rows
+are skipped.
+
+    python app/scripts/backfill_job_tags.py
+"""
+import sys
+import os
+
+# Ensure project root is on sys.path so `from app...` imports work when
+# running this script directly (python app/scripts/backfill_job_tags.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.analytics.cooccurrence import rebuild_cooccurrence
+from app.database import engine
+from app.services.tag_dictionary import backfill_job_tags
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    with engine.begin() as conn:
+        inserted = backfill_job_tags(conn)
+        pairs = rebuild_cooccurrence(conn)
+    logger.info(f"Linked {inserted} job/tag pairs; {pairs} tag co-occurrence pairs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Monthly partitioning of the jobs table (Postgres).
+
+    python app/scripts/partition_jobs.py convert    # one-off: rebuild jobs as a partitioned table
+    python app/scripts/partition_jobs.py maintain   # what the daily scheduler job runs
+    python app/scripts/partition_jobs.py status
+
+`convert` rewrites the whole table in one transaction and holds an exclusive
+lock on jobs while it runs; schedule it in a quiet window.
+"""
+import argparse
+import sys
+import os
+
+# Ensure project root is on sys.path so `from app...` imports work when
+# running this script directly (python app/scripts/partition_jobs.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import engine
+from app.services.job_partitions import convert_to_partitioned, is_partitioned, maintain_partitions, month_partitions
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partition the jobs table by month")
+    parser.add_argument("command", choices=("convert", "maintain", "status"))
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        if args.command == "convert":
+            if not convert_to_partitioned(conn):
+                logger.info("jobs is already partitioned")
+        elif args.command == "maintain":
+            logger.info(f"Maintenance: {maintain_partitions(conn)}")
+        else:
+            if not is_partitioned(conn):
+                print("jobs is not partitioned")
+                return
+            for month, name in month_partitions(conn).items():
+                print(f"{month:%Y-%m}  {name}")
+
+
+if __name__ == '__main__':
+    main()
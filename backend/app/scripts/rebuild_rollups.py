@@ -0,0 +1,42 @@
+"""
+Recompute the daily analytics rollups and sketches from the jobs table.
+Ingestion keeps them current afterwards; run this once after the migrations,
+or to repair a range of days (sketches only see deletes and edits this way).
+
+    python app/scripts/rebuild_rollups.py                    # every day
+    python app/scripts/rebuild_rollups.py --since 2026-01-01
+
+Days covered are replaced, so on partitioned deployments with archived
+months pass --since to keep their history.
+"""
+import argparse
+import sys
+import os
+from datetime import date
+
+# Ensure project root is on sys.path so `from app...` imports work when
+# running this script directly (python app/scripts/rebuild_rollups.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import engine
+from app.analytics.daily_sketches import rebuild_sketches
+from app.analytics.rollups import rebuild_rollups
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the daily analytics rollups and sketches")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="first day to rebuild (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        read = rebuild_rollups(conn, since=args.since)
+        rebuild_sketches(conn, since=args.since)
+    logger.info(f"Rolled up and sketched {read} jobs")
+
+
+if __name__ == '__main__':
+    main()
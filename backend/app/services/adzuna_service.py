@@ -7,7 +7,7 @@ import hashlib
 from datetime import datetime
 from app.config import ADZUNA_APP_ID, ADZUNA_APP_KEY
 from app.services.cache_service import get_cached_response, save_response_to_cache
-from app.database import SessionLocal
+from app.database import SchedulerSessionLocal
 from app.services.text_cleaner import clean_job_description
 
 # Load environment variables from .env file
@@ -34,7 +34,7 @@ def fetch_adzuna_jobs(
 ) -> List[Dict]:
     """Fetches job data from Adzuna API using a context-managed DB session for cache access."""
 
-    with SessionLocal() as db:
+    with SchedulerSessionLocal() as db:
         try:
             cache_query = f"{query}::p{page}::r{results_per_page}"
             cached_response = get_cached_response(cache_query, country, db)
@@ -153,7 +153,7 @@ if __name__ == "__main__":
         print("-" * 50)
 
     # Save to database using a short-lived session
-    from app.database import SessionLocal as _SessionLocal
+    from app.database import SchedulerSessionLocal as _SessionLocal
 
     with _SessionLocal() as db:
         try:
@@ -0,0 +1,147 @@
+"""
+Conditional GET for the read endpoints: strong ETags, Last-Modified and
+304 Not Modified.
+
+The ETag is a hash of the serialized body, so it is the same from every
+worker and across restarts and changes whenever the bytes do. Last-Modified
+is the newest created_at among the jobs in the response.
+
+Answering a conditional request without work needs the validators of the
+current data: they are kept per normalized request key in a VersionedCache,
+so they die with the data version that ingestion bumps, and a request whose
+If-None-Match / If-Modified-Since matches them gets a 304 before any query
+runs. A summary's key includes the start of its time window
+(summary_service.window_anchor()), so once the window moves on the old
+validators no longer apply. Without them (first request after ingestion, another worker) the
+response is computed and a matching If-None-Match still turns it into a 304.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import blake2b
+from typing import Dict, Hashable, Iterable, NamedTuple, Optional
+from fastapi.responses import Response
+from app.config import RESPONSE_CACHE_TTL
+from app.services.versioned_cache import VersionedCache
+
+# Make clients revalidate every time instead of guessing freshness from Last-Modified.
+CACHE_CONTROL = "no-cache"
+
+# Content codings whose representations get their own ETag ("<etag>-br").
+ENCODED_SUFFIXES = ("-br", "-gzip")
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: Optional[datetime]
+
+
+validator_cache = VersionedCache(max_entries=4096, ttl_seconds=RESPONSE_CACHE_TTL)
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """The strong ETag of the `encoding`-coded representation of a body."""
+    return etag if encoding is None else f'{etag[:-1]}-{encoding}"'
+
+
+def newest_created_at(values: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    """Newest of the given created_at values (naive ones are UTC); None if there are none."""
+    newest = None
+    for value in values:
+        if value is None:
+            continue
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        if newest is None or value > newest:
+            newest = value
+    return newest
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match against `etag`: weak comparison, any content coding of the same body."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        for suffix in ENCODED_SUFFIXES:
+            if candidate.endswith(f'{suffix}"'):
+                candidate = f'{candidate[:-len(suffix) - 1]}"'
+                break
+        if candidate == etag:
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole seconds.
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime], headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status_code=304, headers={**validator_headers(etag, last_modified), **(headers or {})})
+
+
+def conditional_response(
+    key: Hashable,
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Optional[Response]:
+    """
+    304 when the client's validators match the current ones for `key`; None
+    when they don't, or the current ones are unknown (compute the response).
+    If-Modified-Since only counts without If-None-Match.
+    """
+    if not if_none_match and not if_modified_since:
+        return None
+    current = validator_cache.get(key)
+    if current is None:
+        return None
+    if if_none_match:
+        matched = etag_matches(if_none_match, current.etag)
+    else:
+        matched = _not_modified_since(if_modified_since, current.last_modified)
+    return not_modified_response(current.etag, current.last_modified, headers) if matched else None
+
+
+def with_validators(
+    response: Response,
+    key: Hashable,
+    version: int,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Tag a freshly computed (uncompressed) response, remember its validators
+    for `key` and return a 304 instead when If-None-Match already names it.
+    `headers` (e.g. Vary) go on either.
+    """
+    etag = body_etag(response.body)
+    validator_cache.set(key, Validators(etag, last_modified), version)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag, last_modified, headers)
+    response.headers.update({**validator_headers(etag, last_modified), **(headers or {})})
+    return response
@@ -0,0 +1,29 @@
+"""
+Process-wide data version for the jobs table.
+
+Ingestion bumps it whenever it inserts rows; caches of derived results
+(facets, summaries, ...) compare against it instead of guessing a TTL.
+"""
+import threading
+from datetime import datetime, timezone
+
+_lock = threading.Lock()
+_version = 0
+_updated_at = datetime.now(timezone.utc)
+
+
+def current_data_version() -> int:
+    return _version
+
+
+def data_updated_at() -> datetime:
+    """When the data version last changed (process start if never)."""
+    return _updated_at
+
+
+def bump_data_version() -> int:
+    global _version, _updated_at
+    with _lock:
+        _version += 1
+        _updated_at = datetime.now(timezone.utc)
+        return _version
@@ -0,0 +1,73 @@
+import csv
+import io
+from itertools import islice
+from typing import Iterable, Iterator, List
+import orjson
+from sqlalchemy.engine import Row
+from app.services.job_formats import (
+    ARROW_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    arrow_stream_chunks,
+    msgpack_chunks,
+)
+from app.services.job_projection import job_row_encoder
+
+# Rows fetched per server-side cursor round trip, and rows per streamed chunk.
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "msgpack": MSGPACK_MEDIA_TYPE,
+    "arrow": ARROW_MEDIA_TYPE,
+}
+
+
+def _batches(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def ndjson_chunks(rows: Iterable[Row], fields: List[str], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """One JSON object per line, `batch_size` lines per chunk."""
+    encode = job_row_encoder(fields)
+    for batch in _batches(rows, batch_size):
+        yield b"".join(orjson.dumps(encode(row), option=orjson.OPT_APPEND_NEWLINE) for row in batch)
+
+
+def csv_chunks(rows: Iterable[Row], fields: List[str], batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """Header line, then `batch_size` records per chunk; tags are comma-joined in one cell."""
+    encode = job_row_encoder(fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(fields)
+    yield flush()
+    for batch in _batches(rows, batch_size):
+        for row in batch:
+            data = encode(row)
+            if "tags" in data:
+                data["tags"] = ",".join(data["tags"])
+            if data.get("created_at") is not None:
+                data["created_at"] = data["created_at"].isoformat()
+            writer.writerow(data.values())
+        yield flush()
+
+
+def export_chunks(export_format: str, rows: Iterable[Row], fields: List[str]) -> Iterator[bytes]:
+    if export_format == "csv":
+        return csv_chunks(rows, fields)
+    if export_format == "ndjson":
+        return ndjson_chunks(rows, fields)
+    if export_format == "msgpack":
+        return msgpack_chunks(_batches(rows, EXPORT_BATCH_SIZE), fields)
+    if export_format == "arrow":
+        return arrow_stream_chunks(_batches(rows, EXPORT_BATCH_SIZE), fields)
+    raise ValueError(f"Unknown export format: {export_format}. Use: {', '.join(EXPORT_MEDIA_TYPES)}")
@@ -0,0 +1,111 @@
+from typing import Dict, List, Optional
+from sqlalchemy import case, func, literal, select, union_all
+from sqlalchemy.orm import Session
+from app.database import is_postgresql
+from app.models.job import Job
+from app.models.tag import JobTag, Tag
+from app.services.response_cache import normalize_text
+from app.services.versioned_cache import VersionedCache
+from app.config import FACETS_CACHE_TTL
+
+# Facets the jobs search can count, in response order.
+FACET_FIELDS = ("source", "work_modality", "location", "tags")
+FACET_LIMIT = 10
+
+_COLUMN_FACETS = {
+    "source": Job.source,
+    "work_modality": Job.work_modality,
+    "location": Job.location,
+}
+
+# Keyed by facets_cache_key(); dropped whenever ingestion bumps the data version.
+facets_cache = VersionedCache(max_entries=512, ttl_seconds=FACETS_CACHE_TTL)
+
+
+def parse_facets(facets: Optional[str]) -> List[str]:
+    """`facets=` (comma separated) -> ordered facet names; unknown names raise ValueError."""
+    if not facets:
+        return []
+    requested = {facet.strip() for facet in facets.split(",") if facet.strip()}
+    unknown = requested - set(FACET_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown facets: {', '.join(sorted(unknown))}. Use: {', '.join(FACET_FIELDS)}")
+    return [facet for facet in FACET_FIELDS if facet in requested]
+
+
+def facets_cache_key(search: Optional[str], remote: Optional[bool], facets: List[str]) -> tuple:
+    """Normalized filter set: case/whitespace-insensitive search, boolean remote, ordered facets."""
+    return (normalize_text(search), remote is True, tuple(facets))
+
+
+def _column_facets_query(criteria: list, names: List[str], postgres: bool):
+    columns = [_COLUMN_FACETS[name] for name in names]
+    if postgres:
+        # One scan: GROUPING SETS ((source), (work_modality), (location)).
+        # The other set's columns are NULL in each row, so coalesce() yields the grouped value.
+        facet = case(*[(func.grouping(column) == 0, name) for name, column in zip(names, columns)])
+        value = func.coalesce(*columns) if len(columns) > 1 else columns[0]
+        return [
+            select(facet.label("facet"), value.label("value"), func.count().label("count"))
+            .where(*criteria)
+            .group_by(func.grouping_sets(*columns))
+        ]
+    return [
+        select(literal(name).label("facet"), column.label("value"), func.count().label("count"))
+        .where(*criteria)
+        .group_by(column)
+        for name, column in zip(names, columns)
+    ]
+
+
+def _tag_facet_query(criteria: list):
+    # Integer join through job_tags; values are canonical tag names.
+    return (
+        select(literal("tags").label("facet"), Tag.name.label("value"), func.count().label("count"))
+        .select_from(Job)
+        .join(JobTag, JobTag.job_id == Job.id)
+        .join(Tag, Tag.id == JobTag.tag_id)
+        .where(*criteria)
+        .group_by(Tag.name)
+    )
+
+
+def facet_counts(db: Session, criteria: list, facets: List[str], limit: int = FACET_LIMIT) -> Dict[str, List[Dict]]:
+    """
+    Top `limit` values per facet for the jobs matching `criteria`, in one statement:
+    the grouped selects are UNION ALLed and ranked with row_number() per facet.
+    """
+    result = {facet: [] for facet in facets}
+    if not facets:
+        return result
+
+    postgres = is_postgresql(db)
+    selects = []
+    column_names = [facet for facet in facets if facet in _COLUMN_FACETS]
+    if column_names:
+        selects.extend(_column_facets_query(criteria, column_names, postgres))
+    if "tags" in facets:
+        selects.append(_tag_facet_query(criteria))
+
+    counts = union_all(*selects).subquery("facet_counts")
+    ranked = (
+        select(
+            counts.c.facet,
+            counts.c.value,
+            counts.c.count,
+            func.row_number().over(
+                partition_by=counts.c.facet,
+                order_by=(counts.c.count.desc(), counts.c.value),
+            ).label("rank"),
+        )
+        .where(counts.c.value.isnot(None), counts.c.value != "")
+        .subquery("ranked")
+    )
+    rows = db.execute(
+        select(ranked.c.facet, ranked.c.value, ranked.c.count)
+        .where(ranked.c.rank <= limit)
+        .order_by(ranked.c.facet, ranked.c.rank)
+    )
+    for facet, value, count in rows:
+        result[facet].append({"value": value, "count": count})
+    return result
@@ -0,0 +1,124 @@
+import io
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+import msgpack
+import orjson
+import pyarrow as pa
+from sqlalchemy.engine import Row
+from app.services.job_projection import format_tags
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Arrow column types; every other job field is a nullable string.
+ARROW_FIELD_TYPES = {
+    "id": pa.int64(),
+    "tags": pa.list_(pa.string()),
+    "created_at": pa.timestamp("us"),
+}
+
+
+def negotiate_media_type(accept: Optional[str], offered: Sequence[str]) -> Optional[str]:
+    """
+    Pick the offered media type the Accept header prefers (q-values, then order).
+    No header or a bare wildcard gives offered[0]; None when nothing offered
+    is acceptable (the caller answers 406 Not Acceptable).
+    """
+    if not accept:
+        return offered[0]
+
+    best, best_q = None, 0.0
+    for part in accept.split(","):
+        media, _, params = part.strip().partition(";")
+        media = media.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        for candidate in offered:
+            if media in (candidate, "*/*") or (media.endswith("/*") and candidate.startswith(media[:-1])):
+                if q > best_q:
+                    best, best_q = candidate, q
+                break
+    return best
+
+
+def rows_to_columns(rows: Sequence[Row], fields: List[str]) -> Dict[str, list]:
+    """Transpose a batch of row tuples into {field: values}; no per-row dicts."""
+    if rows:
+        columns = dict(zip(fields, map(list, zip(*rows))))
+    else:
+        columns = {field: [] for field in fields}
+    if "tags" in columns:
+        columns["tags"] = [format_tags(tags) for tags in columns["tags"]]
+    return columns
+
+
+def _msgpack_columns(columns: Dict[str, list]) -> Dict[str, list]:
+    # msgpack only packs tz-aware datetimes; send ISO strings like the JSON API.
+    if "created_at" in columns:
+        columns["created_at"] = [value.isoformat() if value else None for value in columns["created_at"]]
+    return columns
+
+
+def msgpack_page(rows: Sequence[Row], fields: List[str], extra_columns: Optional[Dict[str, list]] = None, **meta) -> bytes:
+    """One msgpack map: the page metadata plus column-oriented `columns`."""
+    columns = _msgpack_columns(rows_to_columns(rows, fields))
+    columns.update(extra_columns or {})
+    return msgpack.packb({**meta, "columns": columns})
+
+
+def msgpack_chunks(batches: Iterable[Sequence[Row]], fields: List[str]) -> Iterator[bytes]:
+    """A stream of msgpack maps, one {field: values} map per batch (read with msgpack.Unpacker)."""
+    for batch in batches:
+        yield msgpack.packb(_msgpack_columns(rows_to_columns(batch, fields)))
+
+
+def arrow_schema(fields: List[str], metadata: Optional[Dict[str, str]] = None) -> pa.Schema:
+    return pa.schema(
+        [pa.field(field, ARROW_FIELD_TYPES.get(field, pa.string())) for field in fields],
+        metadata=metadata,
+    )
+
+
+def arrow_record_batch(rows: Sequence[Row], fields: List[str], schema: pa.Schema,
+                       extra_columns: Optional[Dict[str, list]] = None) -> pa.RecordBatch:
+    columns = rows_to_columns(rows, fields)
+    columns.update(extra_columns or {})
+    return pa.RecordBatch.from_arrays(
+        [pa.array(columns[field.name], type=field.type) for field in schema],
+        schema=schema,
+    )
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    chunk = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return chunk
+
+
+def arrow_stream_chunks(batches: Iterable[Sequence[Row]], fields: List[str]) -> Iterator[bytes]:
+    """Arrow IPC stream: schema, one record batch per query batch, end-of-stream marker."""
+    schema = arrow_schema(fields)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(arrow_record_batch(batch, fields, schema))
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def arrow_page(rows: Sequence[Row], fields: List[str], extra_columns: Optional[Dict[str, list]] = None, **meta) -> bytes:
+    """Single-batch Arrow IPC stream; page metadata travels as JSON-encoded schema metadata."""
+    extra_columns = extra_columns or {}
+    metadata = {key: orjson.dumps(value) for key, value in meta.items()}
+    schema = arrow_schema(list(fields) + list(extra_columns), metadata)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(arrow_record_batch(rows, fields, schema, extra_columns))
+    return sink.getvalue()
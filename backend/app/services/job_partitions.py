@@ -0,0 +1,255 @@
+"""
+Optional monthly range partitioning of `jobs` on created_at (Postgres only).
+
+`convert_to_partitioned()` is the one-off migration path for an existing
+table: jobs is rebuilt as `PARTITION BY RANGE (created_at)` with one
+partition per month (jobs_pYYYY_MM) plus jobs_default for rows outside them.
+Postgres requires the partition key in every unique constraint, so the
+primary key becomes (id, created_at); ids stay unique because ingestion
+looks them up before inserting.
+
+`maintain_partitions()` runs daily from the scheduler: it pre-creates the
+coming months and detaches months older than the retention window into the
+jobs_archive table or gzipped CSV files. Hot queries filter or order by
+created_at, so they only scan recent partitions.
+"""
+import gzip
+import logging
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.analytics.cooccurrence import remove_window
+from app.config import (
+    JOBS_ARCHIVE_DIR,
+    JOBS_ARCHIVE_MODE,
+    JOBS_PARTITION_PREMAKE_MONTHS,
+    JOBS_RETENTION_MONTHS,
+)
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION = "jobs_default"
+ARCHIVE_TABLE = "jobs_archive"
+ARCHIVE_MODES = ("table", "files")
+_MONTH_PARTITION = re.compile(r"^jobs_p(\d{4})_(\d{2})$")
+
+# Columns that can be copied between tables; the generated search_vector is recomputed.
+COPY_COLUMNS = ", ".join(column.name for column in Job.__table__.columns if column.computed is None)
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"jobs_p{month:%Y_%m}"
+
+
+def is_partition_table(name: str) -> bool:
+    """Tables this module manages outside Base.metadata (partitions and the archive)."""
+    return bool(_MONTH_PARTITION.match(name)) or name in (DEFAULT_PARTITION, ARCHIVE_TABLE)
+
+
+def is_partitioned(conn: Connection, table: str = "jobs") -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    return bool(conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = :table AND pg_table_is_visible(c.oid)
+        )
+    """), {"table": table}).scalar())
+
+
+def _partitions(conn: Connection, table: str) -> List[str]:
+    return list(conn.execute(text("""
+        SELECT c.relname FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = :table AND pg_table_is_visible(p.oid)
+    """), {"table": table}).scalars())
+
+
+def month_partitions(conn: Connection, table: str = "jobs") -> Dict[date, str]:
+    """{first day of month: partition name} for the monthly partitions of `table`."""
+    months = {}
+    for name in _partitions(conn, table):
+        match = _MONTH_PARTITION.match(name)
+        if match:
+            months[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return dict(sorted(months.items()))
+
+
+def _bounds(month: date) -> str:
+    return f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def create_month_partition(conn: Connection, month: date) -> str:
+    """
+    Add the partition for `month`. Rows already sitting in jobs_default for that
+    month are moved into it (Postgres refuses the new partition otherwise).
+    """
+    name = partition_name(month)
+    window = {"lower": month, "upper": add_months(month, 1)}
+    in_window = "created_at >= :lower AND created_at < :upper"
+    has_default = DEFAULT_PARTITION in _partitions(conn, "jobs")
+    stranded = has_default and conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {in_window})"), window
+    ).scalar()
+
+    if stranded:
+        conn.execute(text(
+            f"CREATE TEMP TABLE jobs_moving AS SELECT {COPY_COLUMNS} FROM {DEFAULT_PARTITION} WHERE {in_window}"
+        ), window)
+        conn.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_window}"), window)
+    conn.execute(text(f"CREATE TABLE {name} PARTITION OF jobs FOR VALUES {_bounds(month)}"))
+    if stranded:
+        conn.execute(text(f"INSERT INTO jobs ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM jobs_moving"))
+        conn.execute(text("DROP TABLE jobs_moving"))
+    return name
+
+
+def ensure_partitions(conn: Connection, through: date, since: Optional[date] = None) -> List[str]:
+    """Create missing monthly partitions from `since` (default: this month) through `through`, plus jobs_default."""
+    existing = month_partitions(conn)
+    created = []
+    month = month_start(since or date.today())
+    while month <= month_start(through):
+        if month not in existing:
+            created.append(create_month_partition(conn, month))
+        month = add_months(month, 1)
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF jobs DEFAULT"))
+    if created:
+        logger.info(f"Created partitions {created[0]}..{created[-1]} ({len(created)})")
+    return created
+
+
+def convert_to_partitioned(conn: Connection, premake_months: int = JOBS_PARTITION_PREMAKE_MONTHS,
+                           today: Optional[date] = None) -> bool:
+    """
+    Rebuild an unpartitioned jobs table as a partitioned one, in the caller's
+    transaction (readers see the old table until commit). Returns False when
+    jobs is already partitioned.
+    """
+    if conn.dialect.name != "postgresql":
+        raise ValueError("Partitioning requires Postgres")
+    if is_partitioned(conn):
+        return False
+
+    oldest = conn.execute(text("SELECT min(created_at) FROM jobs")).scalar()
+    primary_key = conn.execute(text(
+        "SELECT conname FROM pg_constraint WHERE conrelid = 'jobs'::regclass AND contype = 'p'"
+    )).scalar()
+    indexes = conn.execute(text("""
+        SELECT indexrelid::regclass::text FROM pg_index
+        WHERE indrelid = 'jobs'::regclass AND NOT indisprimary
+    """)).scalars().all()
+
+    # Index and constraint names are schema-wide; free them for the new table.
+    conn.execute(text("ALTER TABLE jobs RENAME TO jobs_unpartitioned"))
+    for index in indexes:
+        conn.execute(text(f"DROP INDEX {index}"))
+    if primary_key:
+        conn.execute(text(f'ALTER TABLE jobs_unpartitioned DROP CONSTRAINT "{primary_key}"'))
+
+    conn.execute(text(
+        "CREATE TABLE jobs (LIKE jobs_unpartitioned INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)"
+    ))
+    conn.execute(text("ALTER TABLE jobs ADD CONSTRAINT jobs_pkey PRIMARY KEY (id, created_at)"))
+    today = today or date.today()
+    ensure_partitions(conn, since=oldest or today, through=add_months(month_start(today), premake_months))
+    conn.execute(text(f"INSERT INTO jobs ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM jobs_unpartitioned"))
+    # A SERIAL id's sequence belongs to the old table; keep it alive for the new one.
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence('jobs_unpartitioned', 'id')")).scalar()
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY jobs.id"))
+    conn.execute(text("DROP TABLE jobs_unpartitioned"))
+
+    # Indexes on the parent cascade to every partition; build them after the bulk copy.
+    for index in Job.__table__.indexes:
+        index.create(conn)
+    conn.execute(text("ANALYZE jobs"))
+    logger.info(f"Partitioned jobs by month starting {month_start(oldest or today)}")
+    return True
+
+
+def _archive_to_table(conn: Connection, name: str, month: date) -> None:
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {ARCHIVE_TABLE} "
+        "(LIKE jobs INCLUDING DEFAULTS INCLUDING GENERATED) PARTITION BY RANGE (created_at)"
+    ))
+    conn.execute(text(f"ALTER TABLE {ARCHIVE_TABLE} ATTACH PARTITION {name} FOR VALUES {_bounds(month)}"))
+
+
+def _archive_to_file(conn: Connection, name: str, archive_dir: str) -> str:
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{name}.csv.gz")
+    partial = f"{path}.partial"
+    cursor = conn.connection.cursor()
+    try:
+        with gzip.open(partial, "wb") as out:
+            cursor.copy_expert(
+                f"COPY (SELECT {COPY_COLUMNS} FROM {name} ORDER BY created_at, id) TO STDOUT WITH (FORMAT csv, HEADER)",
+                out,
+            )
+    finally:
+        cursor.close()
+    os.replace(partial, path)
+    conn.execute(text(f"DROP TABLE {name}"))
+    return path
+
+
+def archive_partitions(conn: Connection, retain_months: int, mode: str = JOBS_ARCHIVE_MODE,
+                       archive_dir: str = JOBS_ARCHIVE_DIR, today: Optional[date] = None) -> List[str]:
+    """
+    Detach monthly partitions older than `retain_months` full months. "table"
+    attaches them to jobs_archive (no data is copied); "files" writes
+    <archive_dir>/<partition>.csv.gz and drops the partition. Their job_tags
+    rows are deleted (and subtracted from the tag co-occurrences) either way.
+    """
+    if mode not in ARCHIVE_MODES:
+        raise ValueError(f"Unknown archive mode: {mode}. Use: {', '.join(ARCHIVE_MODES)}")
+    cutoff = add_months(month_start(today or date.today()), -retain_months)
+    archived = []
+    has_job_tags = conn.execute(text("SELECT to_regclass('job_tags') IS NOT NULL")).scalar()
+    has_cooccurrence = conn.execute(text("SELECT to_regclass('tag_cooccurrences') IS NOT NULL")).scalar()
+    for month, name in month_partitions(conn).items():
+        if month >= cutoff:
+            break
+        conn.execute(text(f"ALTER TABLE jobs DETACH PARTITION {name}"))
+        if has_cooccurrence:
+            remove_window(conn, month, add_months(month, 1))
+        if has_job_tags:
+            conn.execute(text(
+                "DELETE FROM job_tags WHERE created_at >= :lower AND created_at < :upper"
+            ), {"lower": month, "upper": add_months(month, 1)})
+        if mode == "table":
+            _archive_to_table(conn, name, month)
+        else:
+            _archive_to_file(conn, name, archive_dir)
+        archived.append(name)
+        logger.info(f"Archived partition {name} ({mode})")
+    return archived
+
+
+def maintain_partitions(conn: Connection, today: Optional[date] = None) -> Dict:
+    """Daily upkeep: pre-create future partitions, then apply retention. No-op on unpartitioned tables."""
+    if not is_partitioned(conn):
+        return {"partitioned": False, "created": [], "archived": []}
+    today = today or datetime.now().date()
+    created = ensure_partitions(conn, since=today, through=add_months(month_start(today), JOBS_PARTITION_PREMAKE_MONTHS))
+    archived = []
+    if JOBS_RETENTION_MONTHS > 0:
+        archived = archive_partitions(conn, JOBS_RETENTION_MONTHS, JOBS_ARCHIVE_MODE, JOBS_ARCHIVE_DIR, today)
+    return {"partitioned": True, "created": created, "archived": archived}
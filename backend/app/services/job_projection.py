@@ -0,0 +1,74 @@
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.engine import Row
+from app.models.job import Job
+
+# Public job fields, in response order.
+JOB_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "work_modality",
+    "description",
+    "excerpt",
+    "tags",
+    "url",
+    "created_at",
+    "source",
+)
+
+# Card views never render the full description, so compact leaves it out.
+JOB_VIEWS = {
+    "compact": tuple(field for field in JOB_FIELDS if field != "description"),
+    "full": JOB_FIELDS,
+}
+
+
+def resolve_fields(fields: Optional[str] = None, view: str = "full") -> List[str]:
+    """
+    Turn `fields=` (comma separated) or `view=` into an ordered field list.
+    An explicit field list wins over the view; `id` is always included.
+    """
+    if fields:
+        requested = {field.strip() for field in fields.split(",") if field.strip()}
+        unknown = requested - set(JOB_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        requested.add("id")
+        return [field for field in JOB_FIELDS if field in requested]
+
+    if view not in JOB_VIEWS:
+        raise ValueError(f"Unknown view: {view}. Use: {', '.join(JOB_VIEWS)}")
+    return list(JOB_VIEWS[view])
+
+
+def job_columns(fields: List[str]) -> List:
+    """Columns to SELECT for `fields`; the query then yields plain Row tuples, not ORM objects."""
+    return [getattr(Job, field) for field in fields]
+
+
+def format_tags(tags) -> List[str]:
+    if isinstance(tags, list):
+        return tags
+    if isinstance(tags, str) and tags:
+        return tags.split(",")
+    return []
+
+
+def job_row_encoder(fields: List[str], parse_tags: Callable = format_tags) -> Callable[[Row], Dict]:
+    """
+    Encoder for rows selected with job_columns(fields).
+    Values are left as-is (datetimes included) for ORJSONResponse to
+    serialize natively; only tags go through `parse_tags`, which by default
+    normalizes legacy comma-separated strings.
+    """
+    field_names = tuple(fields)
+    tags_index = field_names.index("tags") if "tags" in field_names else None
+
+    def encode(row: Row) -> Dict:
+        data = dict(zip(field_names, row))
+        if tags_index is not None:
+            data["tags"] = parse_tags(row[tags_index])
+        return data
+
+    return encode
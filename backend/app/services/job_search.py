@@ -0,0 +1,84 @@
+import re
+from typing import Dict, List, Optional
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.orm import Session
+from app.models.job import Job
+
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+# Queries up to this many characters are treated as "still typing" and
+# matched by prefix instead of whole words.
+SHORT_QUERY_MAX_LENGTH = 12
+# Terms at least this long also match with their last character dropped,
+# which forgives a mistyped final letter ("pythn" -> "pyth:*").
+TYPO_TOLERANT_MIN_TERM_LENGTH = 5
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def prefix_query_text(search: str) -> Optional[str]:
+    """Build a to_tsquery() string that prefix-matches every term in `search`."""
+    terms = _TERM_RE.findall(search.lower())
+    if not terms:
+        return None
+
+    parts = []
+    for term in terms:
+        if len(term) >= TYPO_TOLERANT_MIN_TERM_LENGTH:
+            parts.append(f"({term}:* | {term[:-1]}:*)")
+        else:
+            parts.append(f"{term}:*")
+    return " & ".join(parts)
+
+
+def build_ts_query(search: str):
+    """
+    Return a tsquery expression for `search`, or None when nothing is searchable.
+    Short queries use typo-tolerant prefix matching; longer ones use
+    websearch syntax (quoted phrases, OR, -exclusions).
+    """
+    search = (search or "").strip()
+    if not search:
+        return None
+
+    if len(search) <= SHORT_QUERY_MAX_LENGTH:
+        query_text = prefix_query_text(search)
+        if query_text is None:
+            return None
+        return func.to_tsquery(SEARCH_CONFIG, query_text)
+
+    return func.websearch_to_tsquery(SEARCH_CONFIG, search)
+
+
+def search_filter(ts_query):
+    return Job.search_vector.op("@@")(ts_query)
+
+
+def search_rank(ts_query):
+    return func.ts_rank_cd(Job.search_vector, ts_query)
+
+
+def legacy_search_filter(search: str):
+    """Substring match used on databases without full-text search (SQLite)."""
+    search_pattern = f"%{search}%"
+    return or_(
+        Job.title.ilike(search_pattern),
+        Job.company.ilike(search_pattern)
+    )
+
+
+def fetch_snippets(db: Session, job_ids: List[int], ts_query) -> Dict[int, str]:
+    """Highlighted description fragments for an already paginated set of jobs."""
+    if not job_ids:
+        return {}
+
+    headline = func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(Job.description, ""),
+        ts_query,
+        HEADLINE_OPTIONS,
+    )
+    rows = db.execute(select(Job.id, headline).where(Job.id.in_(job_ids))).all()
+    return {job_id: snippet for job_id, snippet in rows}
@@ -6,7 +6,8 @@ from app.models.job import Job
 from datetime import datetime, timezone
 import logging
 import hashlib
-from app.services.text_cleaner import clean_job_description
+from app.services.data_version import bump_data_version
+from app.services.text_cleaner import clean_job_description, make_excerpt
 from urllib.parse import urlsplit, urlunsplit
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -133,6 +134,7 @@ def save_jobs_to_db(jobs: List[Dict], db: Session) -> None:
         
         return datetime.utcnow()
 
+    inserted = 0
     for job in jobs:
         job_id = to_int_id(job.get("id"))
 
@@ -176,25 +178,38 @@ def save_jobs_to_db(jobs: List[Dict], db: Session) -> None:
                 cleaned = [tag.strip() for tag in raw_tags.split(",") if tag.strip()]
                 tags_val = cleaned if cleaned else None
 
+        description = job.get("description") or "No description available"
         new_job = Job(
             id=job_id,
             title=job.get("title") or "",
             company=job.get("company") or "",
             work_modality=job.get("work_modality") or "",
             location=job.get("location") or "Remote",
-            description=job.get("description") or "No description available",
+            description=description,
+            excerpt=make_excerpt(description),
             tags=tags_val if tags_val is not None else [],  # Use empty array if None
             url=normalized_url or (job.get("url") or ""),
             source=job.get("source"),
             created_at=parse_created_at(job.get("created_at"))
         )
 
-        # Insert job with per-job commit to avoid whole-batch failure
+        # One savepoint per job so a bad row doesn't fail the batch; the batch
+        # commits once, which also updates the rollups and sketches once.
         try:
-            db.add(new_job)
-            db.commit()
+            with db.begin_nested():
+                db.add(new_job)
+            inserted += 1
         except Exception as e:
             logger.exception(f"Failed to insert job id={job.get('id')}: {e}")
-            db.rollback()
 
+    try:
+        db.commit()
+    except Exception as e:
+        logger.exception(f"Failed to commit {inserted} new jobs: {e}")
+        db.rollback()
+        inserted = 0
+
+    if inserted:
+        # Invalidate cached facets/summaries derived from the jobs table.
+        bump_data_version()
     logger.info("Jobs saved (attempted) to database")
\ No newline at end of file
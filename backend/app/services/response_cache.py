@@ -0,0 +1,233 @@
+"""
+Whole-response cache for the hottest read endpoints: /summary/daily,
+/summary/recent and the first pages of /jobs.
+
+Entries hold the serialized JSON body plus gzip and brotli encodings of it,
+compressed once on the miss that fills them, so a hit is a dict lookup and a
+bytes copy: no queries, no serialization, no compression. Responses carry the
+validators of app/services/conditional_get.py, and a conditional request
+that matches them gets a 304 before the cache is even read. Keys are built by
+the routers from their validated parameters, so spellings that mean the same
+query ("Python" / " python", tags in any order) share an entry.
+
+Like the other result caches, entries die when ingestion bumps the data
+version; after a scheduled collection the default pages are re-requested
+(warm_response_cache) so the next visitor doesn't pay for the miss.
+"""
+import asyncio
+import gzip
+import logging
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional
+import brotli
+import httpx
+import orjson
+from fastapi.responses import Response
+from app.config import (
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_WARM,
+    RESPONSE_CACHE_WARM_PATHS,
+)
+from app.services.conditional_get import (
+    Validators,
+    body_etag,
+    conditional_response,
+    encoded_etag,
+    etag_matches,
+    not_modified_response,
+    validator_cache,
+    validator_headers,
+)
+from app.services.versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Vary of a cached endpoint whose body only changes with Content-Encoding (the
+# summaries); endpoints that also negotiate Accept pass "Accept, Accept-Encoding".
+VARY_ENCODING = "Accept-Encoding"
+
+# Preferred first when the client accepts several with the same q.
+CACHE_ENCODINGS = ("br", "gzip")
+
+# Below this the encodings save less than their headers cost.
+MIN_COMPRESS_BYTES = 1024
+
+# Compressed once per entry, so spend more CPU than per-request middleware would.
+BROTLI_QUALITY = 6
+GZIP_LEVEL = 6
+
+response_cache = VersionedCache(max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds=RESPONSE_CACHE_TTL)
+
+# Event loop serving the app; scheduler threads submit warming runs to it.
+_warm_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class CachedBody:
+    """A serialized JSON body, its pre-compressed encodings and its validators."""
+
+    __slots__ = ("identity", "encoded", "etag", "last_modified", "vary")
+
+    def __init__(
+        self,
+        identity: bytes,
+        encoded: Dict[str, bytes],
+        last_modified: Optional[datetime] = None,
+        vary: str = VARY_ENCODING,
+    ):
+        self.identity = identity
+        self.encoded = encoded
+        self.etag = body_etag(identity)
+        self.last_modified = last_modified
+        self.vary = vary
+
+    @classmethod
+    def from_content(cls, content, last_modified: Optional[datetime] = None, vary: str = VARY_ENCODING) -> "CachedBody":
+        # Same options as ORJSONResponse, so cached and uncached bodies are byte-identical.
+        body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        encoded = {}
+        if len(body) >= MIN_COMPRESS_BYTES:
+            encoded["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+            encoded["gzip"] = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+        return cls(body, encoded, last_modified, vary)
+
+    def response(self, accept_encoding: Optional[str], cache_status: str) -> Response:
+        encoding = negotiate_encoding(accept_encoding) if self.encoded else None
+        headers = {
+            "Vary": self.vary,
+            **validator_headers(encoded_etag(self.etag, encoding), self.last_modified),
+            "X-Cache": cache_status,
+        }
+        if encoding is None:
+            return Response(self.identity, media_type=JSON_MEDIA_TYPE, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(self.encoded[encoding], media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Best of CACHE_ENCODINGS the Accept-Encoding header allows; None for identity."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+    best, best_q = None, 0.0
+    for coding in CACHE_ENCODINGS:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def cached_response(
+    key: Hashable,
+    accept_encoding: Optional[str],
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None,
+    vary: str = VARY_ENCODING,
+) -> Optional[Response]:
+    """
+    A 304 when the client's copy is current, else the cached response for
+    `key` in the client's preferred encoding; None on a miss.
+    """
+    not_modified = conditional_response(key, if_none_match, if_modified_since, {"Vary": vary})
+    if not_modified is not None:
+        return not_modified
+    body = response_cache.get(key)
+    return None if body is None else body.response(accept_encoding, "HIT")
+
+
+def store_body(
+    key: Hashable,
+    content,
+    version: int,
+    last_modified: Optional[datetime] = None,
+    vary: str = VARY_ENCODING,
+) -> CachedBody:
+    """
+    Serialize and compress `content` and store it and its validators under
+    `key`. Pass the data version read before `content` was computed.
+    """
+    body = CachedBody.from_content(content, last_modified, vary)
+    response_cache.set(key, body, version)
+    validator_cache.set(key, Validators(body.etag, last_modified), version)
+    return body
+
+
+def body_response(body: CachedBody, accept_encoding: Optional[str], if_none_match: Optional[str] = None) -> Response:
+    """A freshly stored body for one client: a 304 if If-None-Match already names it."""
+    if etag_matches(if_none_match, body.etag):
+        return not_modified_response(body.etag, body.last_modified, {"Vary": body.vary})
+    return body.response(accept_encoding, "MISS")
+
+
+def cache_response(
+    key: Hashable,
+    content,
+    version: int,
+    accept_encoding: Optional[str],
+    last_modified: Optional[datetime] = None,
+    if_none_match: Optional[str] = None,
+    vary: str = VARY_ENCODING,
+) -> Response:
+    """store_body() and the body_response() for this request."""
+    return body_response(store_body(key, content, version, last_modified, vary), accept_encoding, if_none_match)
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """Case- and whitespace-insensitive key part; None for blank."""
+    return " ".join((value or "").lower().split()) or None
+
+
+def bind_warm_loop(loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Remember the app's event loop (set in the lifespan handler, cleared on shutdown)."""
+    global _warm_loop
+    _warm_loop = loop
+
+
+async def warm_response_cache(paths: List[str] = RESPONSE_CACHE_WARM_PATHS) -> int:
+    """
+    Request `paths` in-process through the ASGI app, which fills the cache
+    under exactly the keys real requests use. Returns how many succeeded.
+    """
+    from app.main import app  # the app imports the routers, which import this module
+
+    warmed = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://cache-warm") as client:
+        for path in paths:
+            try:
+                response = await client.get(path)
+            except Exception as e:
+                logger.error(f"Response cache warming failed for {path}: {e}")
+                continue
+            if response.status_code == 200:
+                warmed += 1
+            else:
+                logger.warning(f"Response cache warming got {response.status_code} for {path}")
+    logger.info(f"Response cache warmed: {warmed}/{len(paths)} paths")
+    return warmed
+
+
+def schedule_warming() -> bool:
+    """
+    Warm the cache on the app's event loop; safe to call from scheduler
+    threads. Returns False when warming is disabled or no loop is bound
+    (e.g. run.py collecting outside the API process).
+    """
+    loop = _warm_loop
+    if not RESPONSE_CACHE_WARM or loop is None or loop.is_closed():
+        return False
+    asyncio.run_coroutine_threadsafe(warm_response_cache(), loop)
+    return True
@@ -0,0 +1,112 @@
+"""
+Request coalescing ("single flight") for expensive endpoints.
+
+Concurrent calls with the same key share one in-flight computation: the
+first caller (the leader) runs it, the others wait for it and get the same
+result, or the same exception. Nothing is kept once it finishes; caching
+the result is the caller's business (app/services/response_cache.py).
+
+SingleFlight.do() is for sync handlers, which FastAPI runs on threadpool
+threads; do_async() is for async ones and runs the computation as a task,
+shielded so a disconnecting caller doesn't cancel it for the others.
+Every instance registers its counters for /internal/stats/coalescing.
+"""
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# name -> SingleFlight, for single_flight_metrics().
+REGISTRY: Dict[str, "SingleFlight"] = {}
+
+
+class _Call:
+    """An in-flight sync computation and its outcome."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # Tasks are keyed by (event loop, key): a task can only be awaited on its own loop.
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+        REGISTRY[name] = self
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run `fn` unless an identical call is in flight; then wait for its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of do(): await `fn()` once for all concurrent identical calls."""
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = loop.create_task(fn())
+                task.add_done_callback(lambda done: self._finish(task_key, done))
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, task_key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            del self._tasks[task_key]
+            # exception() also marks it retrieved when every caller went away.
+            if not task.cancelled() and task.exception() is not None:
+                self.errors += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            requests = self.executions + self.coalesced
+            return {
+                "in_flight": len(self._calls) + len(self._tasks),
+                "requests": requests,
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "coalesced_ratio": round(self.coalesced / requests, 4) if requests else 0.0,
+                "errors": self.errors,
+            }
+
+
+def single_flight_metrics() -> Dict:
+    """Counters of every SingleFlight in this process, by name."""
+    return {name: flight.snapshot() for name, flight in REGISTRY.items()}
@@ -0,0 +1,185 @@
+"""
+Tag dictionary: canonical tags, their aliases and the job_tags association.
+
+Job.tags keeps the spellings each source sent ("JS", "Javascript"). Every
+flush that inserts, re-tags or deletes a Job mirrors it into job_tags as
+integer tag ids (the after_flush hook at the bottom), so tag filters and
+counts are indexed joins and GROUP BYs instead of array scans. The same sync
+keeps the tag co-occurrence counts (app/analytics/cooccurrence.py) in step.
+backfill_job_tags() covers rows written before job_tags existed or by raw SQL.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import delete, event, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, attributes
+from app.analytics.cooccurrence import apply_job_tag_changes
+from app.models.job import Job
+from app.models.tag import JobTag, Tag, TagAlias
+from app.services.job_projection import format_tags
+
+# Curated synonyms: normalized spelling -> canonical tag name.
+TAG_ALIASES = {
+    "js": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "golang": "go",
+    "py": "python",
+    "python3": "python",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "k8s": "kubernetes",
+    "csharp": "c#",
+    "c sharp": "c#",
+    "cpp": "c++",
+    "dotnet": ".net",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+}
+
+# Postgres spelling of normalize_tag(), for set-based backfills.
+NORMALIZE_TAG_SQL = "btrim(regexp_replace(lower({}), '\\s+', ' ', 'g'))"
+
+
+def normalize_tag(raw) -> str:
+    """Lowercase and collapse whitespace: " Node  JS " -> "node js"."""
+    return " ".join(str(raw).lower().split())
+
+
+def canonical_tag(raw) -> str:
+    normalized = normalize_tag(raw)
+    return TAG_ALIASES.get(normalized, normalized)
+
+
+def _insert_ignore(conn: Connection, model):
+    """INSERT ... ON CONFLICT DO NOTHING for Postgres and SQLite."""
+    dialect_insert = postgresql_insert if conn.dialect.name == "postgresql" else sqlite_insert
+    return dialect_insert(model).on_conflict_do_nothing()
+
+
+def resolve_tag_ids(conn: Connection, spellings: Iterable[str]) -> Dict[str, int]:
+    """
+    {normalized spelling: tag id} for `spellings`. Spellings seen for the first
+    time get an alias (and, unless they are a curated synonym, a new tag).
+    """
+    labels = {}
+    for raw in spellings:
+        normalized = normalize_tag(raw)
+        if normalized and normalized not in labels:
+            labels[normalized] = " ".join(str(raw).split())
+    if not labels:
+        return {}
+
+    known = dict(conn.execute(
+        select(TagAlias.alias, TagAlias.tag_id).where(TagAlias.alias.in_(labels))
+    ).all())
+    missing = [spelling for spelling in labels if spelling not in known]
+    if not missing:
+        return known
+
+    canonical = {spelling: TAG_ALIASES.get(spelling, spelling) for spelling in missing}
+    new_tags = {}
+    for spelling, name in canonical.items():
+        new_tags.setdefault(name, labels.get(name, labels[spelling] if name == spelling else name))
+    conn.execute(_insert_ignore(conn, Tag), [{"name": name, "label": label} for name, label in new_tags.items()])
+    tag_ids = dict(conn.execute(select(Tag.name, Tag.id).where(Tag.name.in_(new_tags))).all())
+
+    # Each canonical name is also an alias of its own tag.
+    aliases = {name: tag_ids[name] for name in new_tags}
+    aliases.update({spelling: tag_ids[name] for spelling, name in canonical.items()})
+    conn.execute(_insert_ignore(conn, TagAlias), [{"alias": alias, "tag_id": tag_id} for alias, tag_id in aliases.items()])
+    known.update(conn.execute(
+        select(TagAlias.alias, TagAlias.tag_id).where(TagAlias.alias.in_(missing))
+    ).all())
+    return known
+
+
+def link_job_tags(conn: Connection, jobs: Sequence[Tuple[int, datetime, Optional[list]]]) -> int:
+    """Insert job_tags rows for (job id, created_at, tags) triples. Returns the number of rows."""
+    return len(_link_job_tags(conn, jobs))
+
+
+def _link_job_tags(conn: Connection, jobs: Sequence[Tuple[int, datetime, Optional[list]]]) -> List[dict]:
+    tag_ids = resolve_tag_ids(conn, (tag for _, _, tags in jobs for tag in format_tags(tags)))
+    rows = []
+    for job_id, created_at, tags in jobs:
+        linked = set()
+        for tag in format_tags(tags):
+            tag_id = tag_ids.get(normalize_tag(tag))
+            if tag_id is not None and tag_id not in linked:
+                linked.add(tag_id)
+                rows.append({"job_id": job_id, "tag_id": tag_id, "created_at": created_at})
+    if rows:
+        conn.execute(insert(JobTag), rows)
+    return rows
+
+
+def _untagged_jobs_query():
+    linked = select(JobTag.job_id).where(JobTag.job_id == Job.id).exists()
+    return select(Job.id, Job.created_at, Job.tags).where(~linked)
+
+
+def backfill_job_tags(conn: Connection, batch_size: int = 5000) -> int:
+    """Link every job that has no job_tags rows yet. Returns the number of rows inserted."""
+    if conn.dialect.name == "postgresql":
+        # Resolve each distinct spelling once, then link all jobs in one statement.
+        spellings = conn.execute(text("SELECT DISTINCT unnest(tags) FROM jobs")).scalars()
+        resolve_tag_ids(conn, [spelling for spelling in spellings if spelling])
+        return conn.execute(text(f"""
+            INSERT INTO job_tags (job_id, tag_id, created_at)
+            SELECT DISTINCT j.id, a.tag_id, j.created_at
+            FROM jobs j
+            CROSS JOIN LATERAL unnest(j.tags) AS t(raw)
+            JOIN tag_aliases a ON a.alias = {NORMALIZE_TAG_SQL.format('t.raw')}
+            WHERE NOT EXISTS (SELECT 1 FROM job_tags jt WHERE jt.job_id = j.id)
+            ON CONFLICT DO NOTHING
+        """)).rowcount
+
+    inserted, last_id = 0, None
+    while True:
+        query = _untagged_jobs_query().order_by(Job.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(Job.id > last_id)
+        batch = conn.execute(query).all()
+        if not batch:
+            return inserted
+        inserted += link_job_tags(conn, batch)
+        last_id = batch[-1].id
+
+
+def _sync_job_tags(session: Session, flush_context) -> None:
+    """after_flush: mirror inserted, re-tagged and deleted Jobs into job_tags."""
+    linked: List[Job] = [obj for obj in session.new if isinstance(obj, Job)]
+    stale_ids = [obj.id for obj in session.deleted if isinstance(obj, Job)]
+    for obj in session.dirty:
+        if isinstance(obj, Job) and (
+            attributes.get_history(obj, "tags").has_changes()
+            or attributes.get_history(obj, "created_at").has_changes()
+        ):
+            linked.append(obj)
+            stale_ids.append(obj.id)
+    if not linked and not stale_ids:
+        return
+
+    conn = session.connection()
+    removed, added = [], []
+    if stale_ids:
+        removed = conn.execute(
+            delete(JobTag).where(JobTag.job_id.in_(stale_ids)).returning(JobTag.job_id, JobTag.tag_id)
+        ).all()
+    if linked:
+        rows = _link_job_tags(conn, [(job.id, job.created_at, job.tags) for job in linked])
+        added = [(row["job_id"], row["tag_id"]) for row in rows]
+    apply_job_tag_changes(conn, added, removed)
+
+
+event.listen(Session, "after_flush", _sync_job_tags)
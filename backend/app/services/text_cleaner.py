@@ -1,5 +1,6 @@
 import html
 import re
+from typing import Optional
 
 _TAG_RE = re.compile(r"<[^>]+>")
 _BLOCK_BREAK_RE = re.compile(r"(?i)</?(p|div|section|article|h[1-6]|ul|ol|li|br)\b[^>]*>")
@@ -25,3 +26,21 @@ def clean_job_description(value: str, fallback: str = "No description available"
     normalized = "\n".join(line for line in lines if line)
     normalized = _PARA_RE.sub("\n\n", normalized).strip()
     return normalized or fallback
+
+
+EXCERPT_MAX_LENGTH = 280
+_ANY_WS_RE = re.compile(r"\s+")
+
+
+def make_excerpt(value: str, max_length: int = EXCERPT_MAX_LENGTH) -> Optional[str]:
+    """Single-line preview of a cleaned description, cut at a word boundary."""
+    if not value:
+        return None
+
+    text = _ANY_WS_RE.sub(" ", str(value)).strip()
+    if len(text) <= max_length:
+        return text
+
+    head = text[:max_length + 1]
+    cut = head.rsplit(" ", 1)[0] if " " in head else text[:max_length]
+    return cut.rstrip(" ,.;:-") + "…"
@@ -0,0 +1,144 @@
+"""Helpers for tests that need a real Postgres server.
+
+Point TEST_POSTGRES_URL at a throwaway database to enable them; the schema
+is dropped and recreated by reset_schema().
+"""
+import os
+import re
+import unittest
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from app.base import Base
+from app.database import to_async_url
+from app.services.tag_dictionary import backfill_job_tags
+import app.models  # noqa: F401  (registers tables on Base.metadata)
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+# Size of the synthetic table used by query-plan tests.
+TEST_PLAN_ROWS = int(os.getenv("TEST_PLAN_ROWS", "1000000"))
+
+requires_postgres = unittest.skipUnless(TEST_POSTGRES_URL, "TEST_POSTGRES_URL is not set")
+
+
+def create_test_engine():
+    return create_engine(TEST_POSTGRES_URL)
+
+
+def create_test_async_engine():
+    # NullPool: asyncpg connections are bound to the loop that opened them.
+    url, connect_args = to_async_url(TEST_POSTGRES_URL)
+    return create_async_engine(url, connect_args=connect_args, poolclass=NullPool)
+
+
+def reset_schema(engine):
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+@requires_postgres
+class PostgresTestCase(unittest.TestCase):
+    """Postgres counterpart of sqlite.SqliteTestCase: the schema is reset before every seed()."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+        cls.async_engine = create_test_async_engine()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        reset_schema(self.engine)
+        self.seed()
+
+    def seed(self) -> None:
+        """Insert the test's data into self.engine; nothing by default."""
+
+
+def seed_jobs(engine, rows: int):
+    """Bulk-insert `rows` synthetic jobs server-side and refresh planner stats.
+
+    About 2% of rows are Remote and 2% Hybrid, spread over two years, so
+    selective filters look like production to the planner.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE jobs, job_tags"))
+        conn.execute(
+            text("""
+                INSERT INTO jobs (id, title, company, location, description,
+                                  work_modality, tags, url, source, created_at)
+                SELECT g,
+                       'Engineer ' || g,
+                       'Company ' || (g % 50000),
+                       'City ' || (g % 300),
+                       'Synthetic description ' || g,
+                       CASE WHEN g % 50 = 0 THEN 'Remote'
+                            WHEN g % 50 = 1 THEN 'Hybrid'
+                            ELSE 'Onsite' END,
+                       ARRAY['tag' || (g % 2000), 'skill' || (g % 37)],
+                       'https://example.com/jobs/' || g,
+                       (ARRAY['remoteok', 'adzuna', 'jsearch'])[1 + g % 3],
+                       now() - (g % 730) * interval '1 day' - (g % 1440) * interval '1 minute'
+                FROM generate_series(1, :rows) AS g
+            """),
+            {"rows": rows},
+        )
+        backfill_job_tags(conn)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE jobs"))
+        conn.execute(text("VACUUM ANALYZE job_tags"))
+
+
+@contextmanager
+def capture_statements(engine):
+    """Collect (statement, parameters) for every query run on `engine`."""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def explain(engine, statement: str, parameters=None) -> dict:
+    """EXPLAIN (FORMAT JSON) a driver-level statement and return the root plan node.
+
+    `engine` is a psycopg2 engine; statements captured from asyncpg ($1, $2
+    placeholders with positional parameters) are rewritten to its paramstyle.
+    """
+    if isinstance(parameters, (tuple, list)) and "$1" in statement:
+        # Placeholders need not appear in numeric order (e.g. LIMIT $2 ... IN ($3)).
+        parameters = tuple(parameters[int(n) - 1] for n in re.findall(r"\$(\d+)", statement))
+        statement = re.sub(r"\$\d+", "%s", statement.replace("%", "%%"))
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters or {})
+        return result.scalar()[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def scanned_indexes(plan: dict, table: str = "jobs") -> set:
+    return {
+        node["Index Name"]
+        for node in plan_nodes(plan)
+        if node.get("Relation Name", table) == table and "Index Name" in node
+    }
+
+
+def has_seq_scan(plan: dict, table: str = "jobs") -> bool:
+    return any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") == table
+        for node in plan_nodes(plan)
+    )
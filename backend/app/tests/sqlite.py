@@ -0,0 +1,101 @@
+"""Temporary SQLite schema for tests of the SQLite fallbacks.
+
+Postgres-only pieces (generated tsvector column, GIN/trigram indexes,
+helper SQL functions) are left out; everything else mirrors Base.metadata.
+The database lives in a temp file so sync and async engines can share it.
+api_client() points the app's session dependencies at such engines (or at
+any other test engine); add_jobs() and SqliteTestCase are the shared fixtures
+of tests that run against both databases (see postgres.PostgresTestCase).
+"""
+import atexit
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Iterable
+from fastapi.testclient import TestClient
+from sqlalchemy import MetaData, Table, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from app.base import Base
+from app.database import get_async_db, get_db, to_async_url
+import app.models  # noqa: F401  (registers tables on Base.metadata)
+# After `import app.models`, which binds `app` to the package.
+from app.main import app
+from app.middleware import request_counts
+from app.models.job import Job
+
+_TEMP_DIR = tempfile.mkdtemp(prefix="orionjobs-tests-")
+atexit.register(shutil.rmtree, _TEMP_DIR, ignore_errors=True)
+
+
+def create_sqlite_engine():
+    fd, path = tempfile.mkstemp(suffix=".db", dir=_TEMP_DIR)
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        columns = [column._copy() for column in table.columns if column.computed is None]
+        Table(table.name, metadata, *columns)
+    metadata.create_all(engine)
+    return engine
+
+
+def create_async_sqlite_engine(engine):
+    """Async (aiosqlite) engine over the same file as a create_sqlite_engine() engine."""
+    url, connect_args = to_async_url(engine.url.render_as_string(hide_password=False))
+    return create_async_engine(url, connect_args=connect_args, poolclass=NullPool)
+
+
+def api_client(engine=None, async_engine=None) -> TestClient:
+    """
+    TestClient whose get_db / get_async_db sessions use the given engines.
+    Callers clear app.dependency_overrides in tearDown.
+    """
+    if engine is not None:
+        def _get_test_db():
+            db = Session(engine)
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = _get_test_db
+    if async_engine is not None:
+        async def _get_test_async_db():
+            async with AsyncSession(async_engine) as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = _get_test_async_db
+    # The in-memory rate limiter is per client IP and TestClient always uses one.
+    request_counts.clear()
+    return TestClient(app)
+
+
+def add_jobs(engine, jobs: Iterable[dict]) -> None:
+    """
+    Insert one Job per dict of column values and commit. `id` is required;
+    title, url, company and work_modality default to placeholders.
+    """
+    with Session(engine) as db:
+        db.add_all([
+            Job(**{
+                "title": f"Engineer {values['id']}", "url": f"https://example.com/{values['id']}",
+                "company": "Acme", "work_modality": "Remote", **values,
+            })
+            for values in jobs
+        ])
+        db.commit()
+
+
+class SqliteTestCase(unittest.TestCase):
+    """A fresh SQLite `engine` / `async_engine` per test, filled by seed()."""
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        self.seed()
+
+    def seed(self) -> None:
+        """Insert the test's data into self.engine; nothing by default."""
@@ -0,0 +1,132 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from unittest.mock import patch
+from sqlalchemy.orm import Session
+from app.features.summaries.summary_service import window_anchor
+from app.main import app
+from app.models.job import Job
+from app.services.conditional_get import encoded_etag, etag_matches, newest_created_at, validator_cache
+from app.services.remoteok_service import save_jobs_to_db
+from app.services.response_cache import response_cache
+from app.tests.postgres import capture_statements
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+TODAY = datetime.combine(date.today(), time(12))
+
+
+class TestEtagMatches(unittest.TestCase):
+
+    def test_any_coding_of_the_body_matches(self):
+        etag = '"abc"'
+        self.assertTrue(etag_matches('"abc"', etag))
+        self.assertTrue(etag_matches(encoded_etag(etag, "br"), etag))
+        self.assertTrue(etag_matches('"x", W/"abc-gzip"', etag))
+        self.assertTrue(etag_matches("*", etag))
+        self.assertFalse(etag_matches('"abcd"', etag))
+        self.assertFalse(etag_matches(None, etag))
+
+    def test_newest_created_at_treats_naive_as_utc(self):
+        newest = newest_created_at([datetime(2026, 1, 1), None, datetime(2026, 1, 2)])
+        self.assertEqual(format_datetime(newest, usegmt=True), "Fri, 02 Jan 2026 00:00:00 GMT")
+        self.assertIsNone(newest_created_at([None]))
+
+
+class TestConditionalRequests(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        with Session(self.engine) as db:
+            db.add_all([
+                Job(id=job_id, title=f"Engineer {job_id}", company="Acme", work_modality="Remote",
+                    description="Build things. " * 20, tags=["Python"], url=f"https://example.com/{job_id}",
+                    created_at=TODAY - timedelta(hours=job_id))
+                for job_id in range(1, 21)
+            ])
+            db.commit()
+
+        response_cache.clear()
+        validator_cache.clear()
+        self.client = api_client(self.engine, self.async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def _get(self, path, **headers):
+        with capture_statements(self.engine) as statements, \
+                capture_statements(self.async_engine.sync_engine) as async_statements:
+            response = self.client.get(path, headers=headers)
+        return response, statements + async_statements
+
+    def test_matching_etag_skips_the_queries(self):
+        paths = (
+            "/api/v1/jobs/1",
+            "/api/v1/jobs?page=5&page_size=3",
+            "/api/v1/jobs?view=compact",
+            "/api/v1/summary/daily?tags=python",
+            "/api/v1/summary/recent",
+        )
+        for path in paths:
+            with self.subTest(path=path):
+                first = self.client.get(path)
+                self.assertEqual(first.headers["cache-control"], "no-cache")
+                response, statements = self._get(path, **{"If-None-Match": first.headers["etag"]})
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b"")
+                self.assertEqual(response.headers["etag"], first.headers["etag"].replace("-br", ""))
+                self.assertEqual(response.headers.get("vary"), first.headers.get("vary"))
+                self.assertFalse(statements)
+
+    def test_other_formats_are_tagged_separately(self):
+        headers = {"Accept": "application/x-msgpack"}
+        msgpack = self.client.get("/api/v1/jobs", headers=headers)
+        json_etag = self.client.get("/api/v1/jobs").headers["etag"]
+        self.assertNotEqual(msgpack.headers["etag"], json_etag)
+        response, statements = self._get("/api/v1/jobs", **headers, **{"If-None-Match": msgpack.headers["etag"]})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["vary"], "Accept, Accept-Encoding")
+        self.assertFalse(statements)
+
+    def test_last_modified_is_the_newest_job(self):
+        first = self.client.get("/api/v1/jobs?page_size=5")
+        self.assertEqual(parsedate_to_datetime(first.headers["last-modified"]).replace(tzinfo=None),
+                         TODAY - timedelta(hours=1))
+        response, statements = self._get("/api/v1/jobs?page_size=5",
+                                         **{"If-Modified-Since": first.headers["last-modified"]})
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(statements)
+        earlier = format_datetime(newest_created_at([TODAY - timedelta(days=1)]), usegmt=True)
+        self.assertEqual(self.client.get("/api/v1/jobs?page_size=5", headers={"If-Modified-Since": earlier}).status_code, 200)
+
+    def test_ingestion_revalidates(self):
+        etag = self.client.get("/api/v1/jobs?page_size=5").headers["etag"]
+        job_etag = self.client.get("/api/v1/jobs/1").headers["etag"]
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Hooli", "work_modality": "Remote",
+                "url": "https://example.com/99", "tags": ["python"], "created_at": TODAY.isoformat(),
+            }], db)
+        self.assertEqual(self.client.get("/api/v1/jobs?page_size=5", headers={"If-None-Match": etag}).status_code, 200)
+        # The job itself didn't change: recomputed, but still a 304.
+        response, statements = self._get("/api/v1/jobs/1", **{"If-None-Match": job_etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertTrue(statements)
+
+    def test_moved_summary_window_revalidates(self):
+        first = self.client.get("/api/v1/summary/daily")
+        # Later on the window starts after every job, without any ingestion in between.
+        later = window_anchor() + timedelta(days=2)
+        with patch("app.routers.summary_router.window_anchor", return_value=later):
+            response = self.client.get("/api/v1/summary/daily", headers={"If-None-Match": first.headers["etag"]})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], first.headers["etag"])
+        self.assertEqual(response.json()["summary"]["window"]["expanded"], True)
+
+    def test_errors_are_not_tagged(self):
+        response = self.client.get("/api/v1/jobs/12345")
+        self.assertNotIn("etag", response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
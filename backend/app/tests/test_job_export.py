@@ -0,0 +1,164 @@
+import csv
+import io
+import json
+import unittest
+from datetime import datetime
+import msgpack
+import pyarrow as pa
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.main import app
+from app.models.job import Job
+from app.services.job_export import ndjson_chunks
+from app.services.job_formats import ARROW_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate_media_type
+from app.tests.postgres import create_test_engine, requires_postgres, reset_schema
+from app.tests.sqlite import api_client, create_sqlite_engine
+
+
+def _add_jobs(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Job(id=index, title=f"Engineer {index}", company="Acme",
+                work_modality="Remote" if index % 2 else "Onsite",
+                description="Long description", tags=["python", "sql"],
+                url=f"https://example.com/{index}", created_at=datetime(2026, 1, index))
+            for index in range(1, 6)
+        ])
+        db.commit()
+
+
+class TestNegotiateMediaType(unittest.TestCase):
+
+    OFFERED = ("application/json", MSGPACK_MEDIA_TYPE, ARROW_MEDIA_TYPE)
+
+    def test_missing_or_wildcard_accept_defaults_to_first_offer(self):
+        self.assertEqual(negotiate_media_type(None, self.OFFERED), "application/json")
+        self.assertEqual(negotiate_media_type("*/*", self.OFFERED), "application/json")
+        self.assertEqual(negotiate_media_type("text/html, */*;q=0.8", self.OFFERED), "application/json")
+
+    def test_nothing_acceptable_is_none(self):
+        self.assertIsNone(negotiate_media_type("text/html", self.OFFERED))
+        self.assertIsNone(negotiate_media_type("application/json;q=0", self.OFFERED))
+
+    def test_q_values_pick_the_preferred_type(self):
+        accept = f"application/json;q=0.5, {ARROW_MEDIA_TYPE}"
+        self.assertEqual(negotiate_media_type(accept, self.OFFERED), ARROW_MEDIA_TYPE)
+
+
+class ExportClientMixin:
+
+    def setUp(self):
+        self.client = api_client(self.engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+
+class TestJobExport(ExportClientMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_sqlite_engine()
+        _add_jobs(cls.engine)
+
+    def test_ndjson_streams_one_job_per_line_oldest_first(self):
+        response = self.client.get("/api/v1/jobs/export")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        jobs = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([job["id"] for job in jobs], [1, 2, 3, 4, 5])
+        self.assertEqual(jobs[0]["tags"], ["python", "sql"])
+        self.assertEqual(jobs[0]["created_at"], "2026-01-01T00:00:00")
+
+    def test_csv_has_header_and_joined_tags(self):
+        response = self.client.get("/api/v1/jobs/export?format=csv&fields=title,tags&remote=true")
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.reader(io.StringIO(response.text)))
+        self.assertEqual(rows[0], ["id", "title", "tags"])
+        self.assertEqual(rows[1], ["1", "Engineer 1", "python,sql"])
+        self.assertEqual(len(rows), 4)
+
+    def test_since_limits_export_to_newer_jobs(self):
+        response = self.client.get("/api/v1/jobs/export?since=2026-01-04T00:00:00&view=compact")
+        jobs = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([job["id"] for job in jobs], [4, 5])
+        self.assertNotIn("description", jobs[0])
+
+    def test_invalid_format_or_field_is_rejected(self):
+        self.assertEqual(self.client.get("/api/v1/jobs/export?format=xml").status_code, 422)
+        self.assertEqual(self.client.get("/api/v1/jobs/export?fields=salary").status_code, 400)
+
+    def test_export_msgpack_streams_column_batches(self):
+        response = self.client.get("/api/v1/jobs/export?format=msgpack&fields=title")
+        self.assertEqual(response.headers["content-type"], MSGPACK_MEDIA_TYPE)
+        batches = list(msgpack.Unpacker(io.BytesIO(response.content)))
+        self.assertEqual(batches, [{"id": [1, 2, 3, 4, 5], "title": [f"Engineer {i}" for i in range(1, 6)]}])
+
+    def test_export_arrow_negotiated_from_accept(self):
+        response = self.client.get("/api/v1/jobs/export?fields=tags,created_at",
+                                   headers={"Accept": ARROW_MEDIA_TYPE})
+        self.assertEqual(response.headers["content-type"], ARROW_MEDIA_TYPE)
+        self.assertEqual(response.headers["vary"], "Accept")
+        table = pa.ipc.open_stream(response.content).read_all()
+        self.assertEqual(table.column_names, ["id", "tags", "created_at"])
+        self.assertEqual(table.num_rows, 5)
+        self.assertEqual(table.column("tags")[0].as_py(), ["python", "sql"])
+        self.assertEqual(table.column("created_at")[0].as_py(), datetime(2026, 1, 1))
+
+    def test_list_endpoint_negotiates_binary_formats(self):
+        response = self.client.get("/api/v1/jobs?page_size=2&fields=title",
+                                   headers={"Accept": MSGPACK_MEDIA_TYPE})
+        self.assertEqual(response.headers["vary"], "Accept, Accept-Encoding")
+        page = msgpack.unpackb(response.content)
+        self.assertEqual(page["total"], 5)
+        self.assertEqual(page["columns"], {"id": [5, 4], "title": ["Engineer 5", "Engineer 4"]})
+
+        response = self.client.get("/api/v1/jobs?page_size=2", headers={"Accept": ARROW_MEDIA_TYPE})
+        table = pa.ipc.open_stream(response.content).read_all()
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.metadata[b"total"], b"5")
+
+    def test_unacceptable_accept_is_406(self):
+        for path in ("/api/v1/jobs", "/api/v1/jobs/export"):
+            response = self.client.get(path, headers={"Accept": "text/html"})
+            self.assertEqual(response.status_code, 406)
+
+    def test_chunks_hold_one_batch_each(self):
+        rows = [(index, "Engineer") for index in range(5)]
+        chunks = list(ndjson_chunks(rows, ["id", "title"], batch_size=2))
+        self.assertEqual([chunk.count(b"\n") for chunk in chunks], [2, 2, 1])
+
+
+@requires_postgres
+class TestJobExportPostgres(ExportClientMixin, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+        reset_schema(cls.engine)
+        _add_jobs(cls.engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def test_export_reads_through_server_side_cursor(self):
+        cursor_names = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM jobs" in statement:
+                cursor_names.append(cursor.name)
+
+        event.listen(self.engine, "before_cursor_execute", _record)
+        try:
+            response = self.client.get("/api/v1/jobs/export?since=2026-01-02")
+        finally:
+            event.remove(self.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(len(response.text.splitlines()), 4)
+        self.assertTrue(cursor_names)
+        self.assertTrue(all(cursor_names), "export must use a named (server-side) cursor")
+
+
+if __name__ == '__main__':
+    unittest.main()
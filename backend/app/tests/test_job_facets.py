@@ -0,0 +1,126 @@
+import unittest
+from datetime import datetime
+from sqlalchemy.orm import Session
+from app.main import app
+from app.models.job import Job
+from app.services.job_facets import facets_cache, facets_cache_key, parse_facets
+from app.services.remoteok_service import save_jobs_to_db
+from app.services.response_cache import response_cache
+from app.tests.postgres import capture_statements, create_test_engine, requires_postgres, reset_schema
+from app.tests.sqlite import api_client, create_sqlite_engine
+
+JOBS = [
+    # (id, source, work_modality, location, tags)
+    (1, "adzuna", "Remote", "Berlin", ["Python", "SQL"]),
+    (2, "adzuna", "Remote", "Berlin", ["python"]),
+    (3, "remoteok", "Hybrid", "Lisbon", ["go", "SQL"]),
+    (4, "jsearch", "Onsite", "Berlin", ["python", "go"]),
+]
+
+
+def _add_jobs(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Job(id=job_id, title=f"Engineer {job_id}", company="Acme", source=source,
+                work_modality=modality, location=location, tags=tags,
+                url=f"https://example.com/{job_id}", created_at=datetime(2026, 1, job_id))
+            for job_id, source, modality, location, tags in JOBS
+        ])
+        db.commit()
+
+
+class TestParseFacets(unittest.TestCase):
+
+    def test_facets_are_ordered_and_validated(self):
+        self.assertEqual(parse_facets("tags, source"), ["source", "tags"])
+        self.assertEqual(parse_facets(None), [])
+        with self.assertRaises(ValueError):
+            parse_facets("salary")
+
+    def test_cache_key_normalizes_search(self):
+        self.assertEqual(
+            facets_cache_key("  Python   Developer", None, ["tags"]),
+            facets_cache_key("python developer", False, ["tags"]),
+        )
+
+
+class FacetBehaviour:
+    """Shared cases; subclasses provide `engine`."""
+
+    def setUp(self):
+        facets_cache.clear()
+        response_cache.clear()
+        self.client = api_client(self.engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def _facets(self, query):
+        response = self.client.get(f"/api/v1/jobs?page_size=1&{query}")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["facets"]
+
+    def test_counts_per_facet(self):
+        facets = self._facets("facets=source,work_modality,location,tags")
+        self.assertEqual(facets["source"][0], {"value": "adzuna", "count": 2})
+        self.assertEqual(facets["location"], [{"value": "Berlin", "count": 3}, {"value": "Lisbon", "count": 1}])
+        self.assertEqual(len(facets["work_modality"]), 3)
+        self.assertEqual(facets["tags"], [
+            {"value": "python", "count": 3},
+            {"value": "go", "count": 2},
+            {"value": "sql", "count": 2},
+        ])
+
+    def test_counts_follow_filters(self):
+        facets = self._facets("facets=source&remote=true")
+        self.assertEqual(facets, {"source": [{"value": "adzuna", "count": 2}]})
+
+    def test_unknown_facet_is_rejected(self):
+        self.assertEqual(self.client.get("/api/v1/jobs?facets=salary").status_code, 400)
+
+    def test_cache_is_invalidated_by_ingestion(self):
+        self.assertEqual(self._facets("facets=location")["location"][1]["count"], 1)
+        with capture_statements(self.engine) as statements:
+            self._facets("facets=location")
+        self.assertFalse([sql for sql, _ in statements if "facet_counts" in sql])
+
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Other", "work_modality": "Remote",
+                "location": "Lisbon", "url": "https://example.com/99",
+            }], db)
+        self.assertEqual(self._facets("facets=location")["location"][1]["count"], 2)
+
+
+class TestFacetsSQLite(FacetBehaviour, unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        _add_jobs(self.engine)
+        super().setUp()
+
+
+@requires_postgres
+class TestFacetsPostgres(FacetBehaviour, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        reset_schema(self.engine)
+        _add_jobs(self.engine)
+        super().setUp()
+
+    def test_column_facets_use_grouping_sets(self):
+        with capture_statements(self.engine) as statements:
+            self._facets("facets=source,location")
+        self.assertTrue([sql for sql, _ in statements if "GROUPING SETS" in sql])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.features.summaries.filters.job_filter import normalize_tags, tag_filter
+from app.features.summaries.summary_service import SummaryService
+from app.models.job import Job
+from app.tests.postgres import create_test_async_engine, create_test_engine, requires_postgres, reset_schema
+from app.tests.sqlite import create_async_sqlite_engine, create_sqlite_engine
+
+SAMPLE_TAGS = {
+    1: ["Java", "Spring"],
+    2: ["JavaScript", "React"],
+    3: ["python", " Django "],
+    4: ["Python"],
+    5: ["JS", "Node"],
+}
+
+
+def _seed(engine):
+    with Session(engine) as db:
+        db.add_all([
+            Job(id=job_id, title=f"Job {job_id}", company="Acme", work_modality="Remote",
+                tags=tags, url=f"https://example.com/{job_id}", created_at=datetime.now())
+            for job_id, tags in SAMPLE_TAGS.items()
+        ])
+        db.commit()
+
+
+class TestNormalizeTags(unittest.TestCase):
+
+    def test_lowercases_trims_and_dedupes(self):
+        self.assertEqual(normalize_tags([" Python", "python", "", "Go "]), ["python", "go"])
+
+    def test_empty_input(self):
+        self.assertEqual(normalize_tags(None), [])
+
+
+class TestTagFilterSql(unittest.TestCase):
+
+    def _compile(self, expression):
+        return str(expression.compile(dialect=postgresql.dialect()))
+
+    def test_any_joins_job_tags_through_aliases(self):
+        sql = self._compile(tag_filter(["go"]))
+        self.assertIn("jobs.id IN (SELECT job_tags.job_id", sql)
+        self.assertIn("tag_aliases.alias IN", sql)
+
+    def test_all_groups_job_tags(self):
+        self.assertIn("HAVING count(job_tags.tag_id) =", self._compile(tag_filter(["go"], "all")))
+
+    def test_rejects_unknown_match_mode(self):
+        with self.assertRaises(ValueError):
+            tag_filter(["go"], "some")
+
+
+class TagFilterBehaviour:
+    """Shared assertions, run against SQLite and Postgres."""
+
+    def _summary_ids(self, tags, tag_match="any"):
+        async def _summary():
+            async with AsyncSession(self.async_engine) as db:
+                return await SummaryService(db).get_daily_summary(tags=tags, tag_match=tag_match)
+
+        data = asyncio.run(_summary())
+        self.assertNotIn("error", data)
+        return sorted(job["id"] for job in data["jobs"])
+
+    def test_whole_tag_match_only(self):
+        self.assertEqual(self._summary_ids(["java"]), [1])
+
+    def test_any_of(self):
+        self.assertEqual(self._summary_ids(["JAVA", "react"]), [1, 2])
+
+    def test_all_of(self):
+        self.assertEqual(self._summary_ids(["python", "django"], "all"), [3])
+
+    def test_all_of_with_unknown_tag_matches_nothing(self):
+        self.assertEqual(self._summary_ids(["python", "cobol"], "all"), [])
+
+    def test_aliases_match_canonical_tag(self):
+        self.assertEqual(self._summary_ids(["javascript"]), [2, 5])
+        self.assertEqual(self._summary_ids(["js", "nodejs"], "all"), [5])
+
+
+class TestTagFilterSqlite(TagFilterBehaviour, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_sqlite_engine()
+        cls.async_engine = create_async_sqlite_engine(cls.engine)
+        _seed(cls.engine)
+
+
+@requires_postgres
+class TestTagFilterPostgres(TagFilterBehaviour, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+        cls.async_engine = create_test_async_engine()
+        reset_schema(cls.engine)
+        _seed(cls.engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+from sqlalchemy import text
+from app.analytics.cooccurrence import rebuild_cooccurrence
+from app.services import job_partitions
+from app.services.job_partitions import (
+    add_months,
+    archive_partitions,
+    convert_to_partitioned,
+    create_month_partition,
+    is_partition_table,
+    is_partitioned,
+    maintain_partitions,
+    month_partitions,
+)
+from app.services.tag_dictionary import backfill_job_tags
+from app.tests.postgres import create_test_engine, explain, plan_nodes, requires_postgres, reset_schema
+from app.tests.sqlite import create_sqlite_engine
+
+TODAY = date(2026, 10, 19)
+
+
+class TestPartitionHelpers(unittest.TestCase):
+
+    def test_add_months_crosses_years(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+
+    def test_partition_tables_are_recognised(self):
+        self.assertTrue(is_partition_table("jobs_p2026_10"))
+        self.assertTrue(is_partition_table("jobs_archive"))
+        self.assertFalse(is_partition_table("jobs"))
+
+    def test_sqlite_is_never_partitioned(self):
+        with create_sqlite_engine().begin() as conn:
+            self.assertEqual(maintain_partitions(conn)["partitioned"], False)
+
+
+@requires_postgres
+class TestJobPartitionsPostgres(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        self._drop_archive()
+        reset_schema(self.engine)
+        # Two jobs a month from 2025-10 through 2026-10.
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+                INSERT INTO jobs (id, title, company, work_modality, tags, url, created_at)
+                SELECT g, 'Engineer ' || g, 'Acme', 'Remote', ARRAY['python'], 'https://example.com/' || g,
+                       timestamp '2025-10-05' + (g / 2) * interval '1 month' + (g % 2) * interval '10 days'
+                FROM generate_series(0, 25) AS g
+            """))
+            self.assertTrue(convert_to_partitioned(conn, premake_months=1, today=TODAY))
+        self.archive_dir = tempfile.mkdtemp(prefix="orionjobs-archive-")
+
+    def tearDown(self):
+        shutil.rmtree(self.archive_dir, ignore_errors=True)
+        self._drop_archive()
+        reset_schema(self.engine)
+
+    def _drop_archive(self):
+        with self.engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS jobs_archive CASCADE"))
+
+    def _count(self, table="jobs"):
+        with self.engine.connect() as conn:
+            return conn.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+    def test_convert_keeps_rows_indexes_and_search_vector(self):
+        self.assertEqual(self._count(), 26)
+        with self.engine.connect() as conn:
+            self.assertTrue(is_partitioned(conn))
+            self.assertIn(date(2025, 10, 1), month_partitions(conn))
+            self.assertEqual(conn.execute(text(
+                "SELECT count(*) FROM jobs WHERE search_vector @@ to_tsquery('english', 'engineer')"
+            )).scalar(), 26)
+            self.assertIn("ix_jobs_created_at", conn.execute(text(
+                "SELECT indexname FROM pg_indexes WHERE tablename = 'jobs'"
+            )).scalars().all())
+            self.assertFalse(convert_to_partitioned(conn))
+
+    def test_recent_queries_prune_old_partitions(self):
+        plan = explain(self.engine, "SELECT id FROM jobs WHERE created_at >= '2026-10-01' ORDER BY created_at DESC")
+        scanned = {node.get("Relation Name") for node in plan_nodes(plan)} - {None}
+        self.assertTrue(scanned)
+        self.assertLessEqual(scanned, {"jobs_p2026_10", "jobs_p2026_11", "jobs_default"})
+
+    def test_new_partition_adopts_rows_from_default(self):
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "INSERT INTO jobs (id, title, company, work_modality, url, created_at) "
+                "VALUES (100, 'Future', 'Acme', 'Remote', 'https://example.com/100', '2027-06-02')"
+            ))
+            create_month_partition(conn, date(2027, 6, 1))
+        self.assertEqual(self._count("jobs_default"), 0)
+        self.assertEqual(self._count("jobs_p2027_06"), 1)
+
+    def test_archive_to_table_detaches_old_months(self):
+        with self.engine.begin() as conn:
+            archived = archive_partitions(conn, retain_months=6, mode="table", today=TODAY)
+        self.assertEqual(archived[0], "jobs_p2025_10")
+        self.assertEqual(archived[-1], "jobs_p2026_03")
+        self.assertEqual(self._count("jobs_archive"), 12)
+        self.assertEqual(self._count(), 14)
+
+    def test_archive_subtracts_tag_cooccurrences(self):
+        with self.engine.begin() as conn:
+            backfill_job_tags(conn)
+            rebuild_cooccurrence(conn)
+            archive_partitions(conn, retain_months=6, mode="table", today=TODAY)
+        with self.engine.connect() as conn:
+            self.assertEqual(conn.execute(text("SELECT jobs FROM tag_cooccurrences")).scalars().all(), [14])
+
+    def test_archive_to_files_writes_gzipped_csv(self):
+        with self.engine.begin() as conn:
+            archived = archive_partitions(conn, retain_months=11, mode="files",
+                                          archive_dir=self.archive_dir, today=TODAY)
+        self.assertEqual(archived, ["jobs_p2025_10"])
+        with gzip.open(os.path.join(self.archive_dir, "jobs_p2025_10.csv.gz"), "rt") as archive:
+            lines = archive.read().splitlines()
+        self.assertTrue(lines[0].startswith("id,title"))
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(self._count(), 24)
+
+    def test_maintain_premakes_and_applies_retention(self):
+        with patch.object(job_partitions, "JOBS_RETENTION_MONTHS", 3), \
+                patch.object(job_partitions, "JOBS_PARTITION_PREMAKE_MONTHS", 3), \
+                patch.object(job_partitions, "JOBS_ARCHIVE_MODE", "table"):
+            with self.engine.begin() as conn:
+                result = maintain_partitions(conn, today=TODAY)
+        self.assertEqual(result["created"], ["jobs_p2026_12", "jobs_p2027_01"])
+        self.assertEqual(result["archived"][-1], "jobs_p2026_06")
+
+
+if __name__ == '__main__':
+    unittest.main()
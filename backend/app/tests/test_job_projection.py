@@ -0,0 +1,112 @@
+import json
+import unittest
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.main import app
+from app.models.job import Job
+from app.routers.jobs_router import get_jobs
+from app.services.job_projection import job_columns, job_row_encoder, resolve_fields
+from app.tests.sqlite import api_client, create_sqlite_engine
+
+
+class TestResolveFields(unittest.TestCase):
+
+    def test_compact_view_drops_description(self):
+        fields = resolve_fields(view="compact")
+        self.assertNotIn("description", fields)
+        self.assertIn("excerpt", fields)
+
+    def test_explicit_fields_keep_response_order_and_id(self):
+        self.assertEqual(resolve_fields("url, title"), ["id", "title", "url"])
+
+    def test_unknown_field_or_view_is_rejected(self):
+        with self.assertRaises(ValueError):
+            resolve_fields("title,salary")
+        with self.assertRaises(ValueError):
+            resolve_fields(view="tiny")
+
+
+class TestJobProjectionQueries(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_sqlite_engine()
+        with Session(cls.engine) as db:
+            db.add(Job(id=1, title="Backend Developer", company="Acme", work_modality="Remote",
+                       description="Long description " * 50, excerpt="Long description…",
+                       tags=["python"], url="https://example.com/1", created_at=datetime(2026, 1, 1)))
+            db.commit()
+
+    def test_compact_columns_skip_description(self):
+        sql = str(select(*job_columns(resolve_fields(view="compact"))))
+        self.assertNotIn("jobs.description", sql)
+        self.assertIn("jobs.excerpt", sql)
+
+    def test_get_jobs_compact_view(self):
+        with Session(self.engine) as db:
+            response = get_jobs(page=1, page_size=12, search=None, remote=None, highlight=False,
+                                view="compact", fields=None, facets=None, accept=None, accept_encoding=None,
+                                if_none_match=None, if_modified_since=None, db=db)
+        job = json.loads(response.body)["jobs"][0]
+        self.assertNotIn("description", job)
+        self.assertEqual(job["excerpt"], "Long description…")
+        self.assertEqual(job["created_at"], "2026-01-01T00:00:00")
+
+    def test_row_encoder_reads_row_tuples(self):
+        fields = ["id", "tags", "created_at"]
+        with Session(self.engine) as db:
+            row = db.execute(select(*job_columns(fields))).one()
+        self.assertEqual(
+            job_row_encoder(fields)(row),
+            {"id": 1, "tags": ["python"], "created_at": datetime(2026, 1, 1)},
+        )
+
+    def test_row_encoder_splits_legacy_tag_strings(self):
+        encode = job_row_encoder(["id", "tags"])
+        self.assertEqual(encode((2, "python,go")), {"id": 2, "tags": ["python", "go"]})
+
+
+class TestJobBatchLookup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_sqlite_engine()
+        with Session(cls.engine) as db:
+            db.add_all([
+                Job(id=index, title=f"Engineer {index}", company="Acme", work_modality="Remote",
+                    description="Long description", tags=["python"],
+                    url=f"https://example.com/{index}", created_at=datetime(2026, 1, index))
+                for index in range(1, 6)
+            ])
+            db.commit()
+
+    def setUp(self):
+        self.client = api_client(self.engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_jobs_come_back_in_request_order(self):
+        data = self.client.get("/api/v1/jobs/batch?ids=4,1,99,4,2").json()
+        self.assertEqual([job["id"] for job in data["jobs"]], [4, 1, 2])
+        self.assertEqual(data["missing"], [99])
+
+    def test_projection_matches_list_endpoint(self):
+        data = self.client.get("/api/v1/jobs/batch?ids=1&view=compact").json()
+        self.assertEqual(list(data["jobs"][0]), resolve_fields(view="compact"))
+        data = self.client.get("/api/v1/jobs/batch?ids=1&fields=title").json()
+        self.assertEqual(data["jobs"], [{"id": 1, "title": "Engineer 1"}])
+
+    def test_invalid_or_too_many_ids_are_rejected(self):
+        self.assertEqual(self.client.get("/api/v1/jobs/batch?ids=1,abc").status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/jobs/batch?ids=,").status_code, 400)
+        for bad in ("0", str(2**31), "99999999999999999999", "\u00b2"):
+            with self.subTest(ids=bad):
+                self.assertEqual(self.client.get("/api/v1/jobs/batch", params={"ids": bad}).status_code, 400)
+        too_many = ",".join(str(index) for index in range(1, 202))
+        self.assertEqual(self.client.get(f"/api/v1/jobs/batch?ids={too_many}").status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
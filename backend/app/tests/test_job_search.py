@@ -0,0 +1,91 @@
+import unittest
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from app.models.job import Job
+from app.services.job_search import build_ts_query, fetch_snippets, prefix_query_text, search_filter, search_rank
+from app.tests.postgres import create_test_engine, requires_postgres, reset_schema
+
+
+class TestPrefixQueryText(unittest.TestCase):
+
+    def test_short_terms_are_prefix_matched(self):
+        self.assertEqual(prefix_query_text("go aws"), "go:* & aws:*")
+
+    def test_long_terms_tolerate_last_character_typo(self):
+        self.assertEqual(prefix_query_text("Pythn"), "(pythn:* | pyth:*)")
+
+    def test_punctuation_is_not_passed_to_tsquery(self):
+        self.assertEqual(prefix_query_text("c++ & !sql"), "c:* & sql:*")
+        self.assertIsNone(prefix_query_text("&|!"))
+
+
+class TestBuildTsQuery(unittest.TestCase):
+
+    def _compile(self, expression):
+        return str(expression.compile(dialect=postgresql.dialect()))
+
+    def test_short_query_uses_to_tsquery(self):
+        self.assertIn("to_tsquery(", self._compile(build_ts_query("kube")))
+
+    def test_long_query_uses_websearch_syntax(self):
+        sql = self._compile(build_ts_query('"senior python" -django'))
+        self.assertIn("websearch_to_tsquery(", sql)
+
+    def test_blank_query_returns_none(self):
+        self.assertIsNone(build_ts_query("   "))
+
+
+@requires_postgres
+class TestFullTextSearchPostgres(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+        reset_schema(cls.engine)
+        with Session(cls.engine) as db:
+            db.add_all([
+                Job(id=1, title="Kubernetes Platform Engineer", company="Orbit", work_modality="Remote",
+                    tags=["k8s", "go"], url="https://example.com/1", description="Run clusters.",
+                    created_at=datetime(2026, 1, 1)),
+                Job(id=2, title="Backend Developer", company="Nova", work_modality="Hybrid",
+                    tags=["python"], url="https://example.com/2",
+                    description="You will also touch our Kubernetes deployment scripts.",
+                    created_at=datetime(2026, 1, 2)),
+                Job(id=3, title="Designer", company="Pixel", work_modality="Onsite",
+                    tags=["figma"], url="https://example.com/3", description="Design things.",
+                    created_at=datetime(2026, 1, 3)),
+            ])
+            db.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def _search(self, db, text):
+        ts_query = build_ts_query(text)
+        return (
+            db.query(Job)
+            .filter(search_filter(ts_query))
+            .order_by(search_rank(ts_query).desc(), Job.created_at.desc())
+            .all()
+        )
+
+    def test_title_matches_rank_above_description_matches(self):
+        with Session(self.engine) as db:
+            jobs = self._search(db, "kubernetes")
+            self.assertEqual([job.id for job in jobs], [1, 2])
+
+    def test_short_query_matches_by_prefix_and_tags(self):
+        with Session(self.engine) as db:
+            self.assertEqual([job.id for job in self._search(db, "kube")], [1, 2])
+            self.assertEqual([job.id for job in self._search(db, "figm")], [3])
+
+    def test_snippets_highlight_matches(self):
+        with Session(self.engine) as db:
+            snippets = fetch_snippets(db, [2], build_ts_query("kubernetes deployment scripts"))
+            self.assertIn("<mark>Kubernetes</mark>", snippets[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
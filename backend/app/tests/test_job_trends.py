@@ -0,0 +1,100 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from sqlalchemy.orm import Session
+from app.analytics.charts.job_trends import bucket_start, charts_cache
+from app.main import app
+from app.models.job import Job
+from app.services.remoteok_service import save_jobs_to_db
+from app.tests.postgres import capture_statements
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+TODAY = datetime.combine(date.today(), time(12))
+
+
+class TestBucketStart(unittest.TestCase):
+
+    def test_weeks_start_on_monday(self):
+        self.assertEqual(bucket_start(date(2026, 10, 18), "week"), date(2026, 10, 12))
+        self.assertEqual(bucket_start(date(2026, 10, 19), "week"), date(2026, 10, 19))
+        self.assertEqual(bucket_start(date(2026, 10, 18), "day"), date(2026, 10, 18))
+
+
+class TestDashboardCharts(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        jobs = []
+        # 12 companies with 12..1 jobs: the top 10 plus "other" for the last two.
+        for rank in range(12):
+            for _ in range(12 - rank):
+                job_id = len(jobs) + 1
+                jobs.append(Job(
+                    id=job_id, title="Engineer", company=f"Company {rank:02d}",
+                    work_modality="Remote" if job_id % 3 == 0 else "Onsite",
+                    location="Berlin, Germany" if job_id % 2 else None,
+                    tags=["Python", f"tag{job_id % 25}"], url=f"https://example.com/{job_id}",
+                    created_at=TODAY - timedelta(days=job_id % 10),
+                ))
+        with Session(self.engine) as db:
+            db.add_all(jobs)
+            db.commit()
+        self.total = len(jobs)
+
+        charts_cache.clear()
+        self.client = api_client(async_engine=self.async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_widgets_cover_every_job(self):
+        data = self.client.get("/api/v1/analytics/charts/dashboard?days=30").json()
+        self.assertEqual(data["totals"], {
+            "jobs": self.total, "remote": self.total // 3,
+            "with_location": (self.total + 1) // 2, "companies": 12,
+        })
+        self.assertEqual(len(data["trend"]["periods"]), 30)
+        self.assertEqual(sum(data["trend"]["jobs"]), self.total)
+
+        companies = data["companies"]
+        self.assertEqual(companies["labels"][:2], ["Company 00", "Company 01"])
+        self.assertEqual(companies["labels"][-1], "other")
+        self.assertEqual(companies["jobs"][-1], 2 + 1)
+        self.assertEqual(sum(companies["jobs"]), self.total)
+
+        skills = data["skills"]
+        # Two tags per job: the skills series counts tag occurrences, not jobs.
+        self.assertNotIn("jobs", skills)
+        self.assertEqual((skills["labels"][0], skills["tags"][0]), ("python", self.total))
+        self.assertEqual(len(skills["labels"]), 21)
+        self.assertEqual(sum(skills["tags"]), 2 * self.total)
+        self.assertEqual(data["locations"]["labels"], ["Germany", "unknown"])
+
+    def test_weekly_buckets(self):
+        data = self.client.get("/api/v1/analytics/charts/dashboard?days=28&bucket=week").json()
+        periods = [date.fromisoformat(period) for period in data["trend"]["periods"]]
+        self.assertTrue(all(period.weekday() == 0 for period in periods))
+        self.assertIn(len(periods), (4, 5))
+        self.assertEqual(sum(data["trend"]["jobs"]), self.total)
+
+    def test_unknown_bucket_is_rejected(self):
+        self.assertEqual(self.client.get("/api/v1/analytics/charts/dashboard?bucket=month").status_code, 400)
+
+    def test_cached_until_ingestion(self):
+        self.client.get("/api/v1/analytics/charts/dashboard")
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            self.client.get("/api/v1/analytics/charts/dashboard")
+        self.assertFalse(statements)
+
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 999, "title": "Engineer", "company": "Company 00", "work_modality": "Remote",
+                "url": "https://example.com/999", "tags": ["python"],
+                "created_at": TODAY.isoformat(),
+            }], db)
+        fresh = self.client.get("/api/v1/analytics/charts/dashboard").json()
+        self.assertEqual(fresh["totals"]["jobs"], self.total + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sqlalchemy import exc, text
+from app.config import pool_settings
+from app.database import create_instrumented_engine
+from app.pool_metrics import REGISTRY, Histogram
+from app.tests.sqlite import api_client
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["buckets"], {"1": 2, "10": 3, "+Inf": 4})
+        self.assertEqual(snapshot["count"], 4)
+        self.assertEqual(snapshot["max"], 50)
+
+
+class TestPoolSettings(unittest.TestCase):
+
+    def test_role_defaults_and_overrides(self):
+        self.assertLess(pool_settings("scheduler")["pool_size"], pool_settings("api")["pool_size"])
+        with patch.dict(os.environ, {"DB_POOL_SCHEDULER_SIZE": "7"}):
+            self.assertEqual(pool_settings("scheduler")["pool_size"], 7)
+
+
+class TestPoolMetrics(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engine = create_instrumented_engine(
+            f"sqlite:///{self.path}", "test_pool", role="scheduler",
+            pool_size=1, max_overflow=0, pool_timeout=0.05,
+        )
+        self.metrics = REGISTRY["test_pool"]
+
+    def tearDown(self):
+        self.engine.dispose()
+        REGISTRY.pop("test_pool", None)
+        os.remove(self.path)
+
+    def test_checkout_gauges_and_wait_histogram(self):
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            snapshot = self.metrics.snapshot()
+            self.assertEqual(snapshot["in_use"], 1)
+            self.assertEqual(snapshot["checkedout"], 1)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["in_use"], 0)
+        self.assertEqual(snapshot["max_in_use"], 1)
+        self.assertEqual(snapshot["size"], 1)
+        self.assertEqual(snapshot["checkout_wait_ms"]["count"], 1)
+        self.assertEqual(snapshot["pool_class"], "InstrumentedQueuePool")
+
+    def test_exhausted_pool_counts_timeouts(self):
+        with self.engine.connect():
+            with self.assertRaises(exc.TimeoutError):
+                self.engine.connect()
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["checkout_timeouts"], 1)
+        self.assertGreaterEqual(snapshot["checkout_wait_ms"]["max"], 50)
+
+    def test_connection_lifetime_recorded_on_close(self):
+        with self.engine.connect():
+            pass
+        self.engine.dispose()
+        self.assertEqual(self.metrics.connection_lifetime_s.snapshot()["count"], 1)
+        # dispose() recreates the pool from its class, so it stays instrumented.
+        with self.engine.connect():
+            pass
+        self.assertEqual(self.metrics.snapshot()["connects"], 2)
+
+
+class TestInternalStatsEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.client = api_client()
+
+    def test_reports_registered_pools(self):
+        response = self.client.get("/internal/stats/db")
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertIn("primary", body["pools"])
+        self.assertIn("checkout_wait_ms", body["pools"]["primary"])
+        self.assertIn("scheduler", body["pool_settings"])
+
+    def test_token_is_required_when_configured(self):
+        with patch("app.routers.internal_router.INTERNAL_STATS_TOKEN", "secret"):
+            self.assertEqual(self.client.get("/internal/stats/db").status_code, 403)
+            response = self.client.get("/internal/stats/db", headers={"X-Internal-Token": "secret"})
+            self.assertEqual(response.status_code, 200)
+
+    def test_unset_token_fails_closed_outside_development(self):
+        with patch("app.routers.internal_router.ENVIRONMENT", "production"):
+            self.assertEqual(self.client.get("/internal/stats/db").status_code, 403)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.features.summaries.summary_service import SummaryService
+from app.main import app
+from app.routers.jobs_router import get_jobs
+from app.services.remoteok_service import save_jobs_to_db
+from app.services.response_cache import response_cache
+from app.tests.postgres import (
+    TEST_PLAN_ROWS,
+    TEST_POSTGRES_URL,
+    capture_statements,
+    create_test_async_engine,
+    create_test_engine,
+    explain,
+    has_seq_scan,
+    requires_postgres,
+    reset_schema,
+    scanned_indexes,
+    seed_jobs,
+)
+from app.tests.sqlite import api_client
+
+engine = None
+async_engine = None
+has_pg_trgm = False
+
+
+def setUpModule():
+    # One seeded table is shared by every plan test in this module.
+    global engine, async_engine, has_pg_trgm
+    if not TEST_POSTGRES_URL:
+        return
+    engine = create_test_engine()
+    async_engine = create_test_async_engine()
+    reset_schema(engine)
+    seed_jobs(engine, TEST_PLAN_ROWS)
+    with engine.connect() as conn:
+        has_pg_trgm = bool(conn.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).scalar())
+
+
+def tearDownModule():
+    if engine is not None:
+        engine.dispose()
+
+
+def _plans_for(test, statements, marker):
+    plans = [explain(engine, sql, params) for sql, params in statements if marker in sql]
+    test.assertTrue(plans, f"no captured statement contains {marker!r}")
+    return plans
+
+
+@requires_postgres
+class TestSubstringFilterPlans(unittest.TestCase):
+    """EXPLAIN the substring/lower() filters against a large seeded table."""
+
+    def setUp(self):
+        response_cache.clear()
+
+    def test_get_jobs_remote_filter_uses_trigram_index(self):
+        if not has_pg_trgm:
+            self.skipTest("pg_trgm is not installed on the test server")
+        with Session(engine) as db, capture_statements(engine) as statements:
+            get_jobs(page=1, page_size=12, search=None, remote=True, highlight=False,
+                     view="full", fields=None, facets=None, accept=None, accept_encoding=None,
+                     if_none_match=None, if_modified_since=None, db=db)
+
+        for plan in _plans_for(self, statements, "lower(jobs.work_modality)"):
+            self.assertFalse(has_seq_scan(plan))
+            self.assertTrue(scanned_indexes(plan))
+
+    def test_summary_modality_filter_uses_trigram_index(self):
+        if not has_pg_trgm:
+            self.skipTest("pg_trgm is not installed on the test server")
+        async def _summary():
+            async with AsyncSession(async_engine) as db:
+                await SummaryService(db).get_daily_summary(location="remote", period_days=1)
+
+        with capture_statements(async_engine.sync_engine) as statements:
+            asyncio.run(_summary())
+
+        for plan in _plans_for(self, statements, "lower(jobs.work_modality)"):
+            self.assertFalse(has_seq_scan(plan))
+            self.assertTrue(scanned_indexes(plan))
+
+    def test_dedup_lookup_uses_lower_title_company_index(self):
+        duplicate = {
+            "id": "not-in-table",
+            "title": "ENGINEER 5",
+            "company": "company 5",
+            "work_modality": "Remote",
+            "url": "https://elsewhere.example.com/5",
+            "source": "adzuna",
+        }
+        with Session(engine) as db, capture_statements(engine) as statements:
+            save_jobs_to_db([duplicate], db)
+
+        for plan in _plans_for(self, statements, "lower(jobs.title)"):
+            self.assertFalse(has_seq_scan(plan))
+            self.assertIn("ix_jobs_lower_title_company", scanned_indexes(plan))
+        for plan in _plans_for(self, statements, "jobs.url ="):
+            self.assertIn("ix_jobs_url", scanned_indexes(plan))
+
+
+# (path, needs pg_trgm)
+ROUTER_REQUESTS = [
+    ("/api/v1/jobs", False),
+    ("/api/v1/jobs?page=40&page_size=25", False),
+    ("/api/v1/jobs?search=Company%204242", False),
+    ("/api/v1/jobs?search=synthetic%20description%2042&highlight=true", False),
+    ("/api/v1/jobs?search=Company%204242&facets=source,work_modality,location,tags", False),
+    ("/api/v1/jobs?remote=true", True),
+    ("/api/v1/jobs/4242", False),
+    ("/api/v1/jobs/batch?ids=4242,17,90001&view=compact", False),
+    ("/api/v1/summary/daily", False),
+    ("/api/v1/summary/daily?tags=tag42&period_days=7", False),
+    ("/api/v1/summary/daily?location=remote&period_days=7", True),
+    ("/api/v1/summary/recent", False),
+]
+
+
+@requires_postgres
+class TestRouterQueryPlans(unittest.TestCase):
+    """Guardrail: no query issued by the read routers may Seq Scan jobs."""
+
+    def setUp(self):
+        response_cache.clear()
+        self.client = api_client(engine, async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_router_queries_avoid_sequential_scans(self):
+        for path, needs_pg_trgm in ROUTER_REQUESTS:
+            if needs_pg_trgm and not has_pg_trgm:
+                continue
+            with self.subTest(path=path):
+                with capture_statements(engine) as statements, \
+                        capture_statements(async_engine.sync_engine) as async_statements:
+                    response = self.client.get(path)
+                statements = statements + async_statements
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn("error", response.json())
+
+                job_statements = [(sql, params) for sql, params in statements if "jobs" in sql]
+                self.assertTrue(job_statements)
+                for sql, params in job_statements:
+                    self.assertFalse(
+                        has_seq_scan(explain(engine, sql, params)),
+                        f"sequential scan on jobs for {path}:\n{sql}",
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app import database
+from app.database import REPLICA_LAG_SQL, ReplicaMonitor
+from app.main import app
+from app.models.job import Job
+from app.services.response_cache import response_cache
+from app.tests.postgres import create_test_engine, requires_postgres
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+
+def _add_job(engine, title):
+    with Session(engine) as db:
+        db.add(Job(id=1, title=title, company="Acme", work_modality="Remote", tags=["python"],
+                   url="https://example.com/1", created_at=datetime.now()))
+        db.commit()
+
+
+class TestReadReplicaRouting(unittest.TestCase):
+    """Two SQLite files stand in for a primary and its replica."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.primary = create_sqlite_engine()
+        cls.replica = create_sqlite_engine()
+        _add_job(cls.primary, "from primary")
+        _add_job(cls.replica, "from replica")
+        cls.async_primary = create_async_sqlite_engine(cls.primary)
+        cls.async_replica = create_async_sqlite_engine(cls.replica)
+
+    def setUp(self):
+        self.monitor = ReplicaMonitor(max_lag_seconds=30, check_interval=0)
+        self.patches = [
+            patch.object(database, "read_engine", self.replica),
+            patch.object(database, "ReadSessionLocal", sessionmaker(bind=self.replica)),
+            patch.object(database, "async_read_engine", self.async_replica),
+            patch.object(database, "AsyncReadSessionLocal", async_sessionmaker(self.async_replica)),
+            patch.object(database, "replica_monitor", self.monitor),
+        ]
+        for active in self.patches:
+            active.start()
+        response_cache.clear()
+        self.client = api_client(self.primary, self.async_primary)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        for active in self.patches:
+            active.stop()
+
+    def _title(self):
+        return self.client.get("/api/v1/jobs/1").json()["title"]
+
+    def test_get_routes_read_from_replica(self):
+        self.assertEqual(self._title(), "from replica")
+        summary = self.client.get("/api/v1/summary/daily").json()
+        self.assertEqual(summary["jobs"][0]["title"], "from replica")
+        self.assertEqual(self.monitor.replica_reads, 2)
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        self.monitor.max_lag_seconds = -1
+        self.assertEqual(self._title(), "from primary")
+        self.assertFalse(self.monitor.healthy)
+        self.assertEqual(self.monitor.primary_fallbacks, 1)
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        missing = os.path.join(tempfile.gettempdir(), "no-such-dir", "replica.db")
+        broken = create_engine(f"sqlite:///{missing}")
+        self.assertFalse(self.monitor.use_replica(broken))
+        self.assertIsNotNone(self.monitor.last_error)
+
+    def test_lag_is_only_rechecked_after_interval(self):
+        self.monitor.check_interval = 3600
+        self.assertTrue(self.monitor.use_replica(self.replica))
+        self.monitor.max_lag_seconds = -1
+        self.assertTrue(self.monitor.use_replica(self.replica))
+
+
+@requires_postgres
+class TestReplicaLagQuery(unittest.TestCase):
+
+    def test_primary_reports_zero_lag(self):
+        engine = create_test_engine()
+        try:
+            with engine.connect() as conn:
+                self.assertEqual(conn.execute(REPLICA_LAG_SQL).scalar(), 0)
+        finally:
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import unittest
+from datetime import datetime
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+from app.analytics.analytics_service import related_skills_cache
+from app.analytics.cooccurrence import rebuild_cooccurrence
+from app.analytics.related_skills import RelatedSkillsIndex
+from app.main import app
+from app.models.job import Job
+from app.models.tag import Tag, TagCooccurrence
+from app.services.remoteok_service import save_jobs_to_db
+from app.tests.postgres import PostgresTestCase, capture_statements
+from app.tests.sqlite import SqliteTestCase, add_jobs, api_client
+
+CREATED_AT = datetime(2026, 10, 1)
+
+# (number of jobs, tags); 14 tagged jobs in all.
+TAG_SETS = [
+    (4, ["Kubernetes", "Docker", "Go"]),
+    (3, ["k8s", "Terraform"]),
+    (4, ["Python", "Django"]),
+    (2, ["Python", "Docker"]),
+    (1, ["Kubernetes", "Python"]),
+]
+
+JOBS = [
+    dict(id=job_id, tags=tags, created_at=CREATED_AT)
+    for job_id, tags in enumerate((tags for count, tags in TAG_SETS for _ in range(count)), start=1)
+]
+
+
+def _cooccurrences(engine):
+    """{(tag name, other tag name): jobs}."""
+    other = aliased(Tag)
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(Tag.name, other.name, TagCooccurrence.jobs)
+            .join(Tag, Tag.id == TagCooccurrence.tag_id)
+            .join(other, other.id == TagCooccurrence.other_tag_id)
+        )
+        return {(name, other_name): jobs for name, other_name, jobs in rows}
+
+
+class TestRelatedSkillsIndex(unittest.TestCase):
+
+    def setUp(self):
+        tags = [(1, "go", "Go"), (2, "docker", "Docker"), (3, "rust", "Rust"), (4, "wasm", "WASM")]
+        rows = [
+            (1, 1, 10), (2, 2, 40), (3, 3, 5), (4, 4, 4),
+            (1, 2, 8), (2, 1, 8),
+            (3, 4, 4), (4, 3, 4),
+            (1, 3, 2), (3, 1, 2),   # below MIN_PAIR_JOBS
+        ]
+        self.index = RelatedSkillsIndex.from_rows(rows, tags, total_jobs=100)
+
+    def test_rows_are_sparse(self):
+        self.assertEqual(self.index.names, ["go", "docker", "rust", "wasm"])
+        np.testing.assert_array_equal(self.index.tag_jobs, [10, 40, 5, 4])
+        np.testing.assert_array_equal(np.diff(self.index.indptr), [1, 1, 1, 1])
+
+    def test_lift_pmi_and_confidence(self):
+        related = self.index.related("rust")["related"]
+        self.assertEqual(related, [{
+            "skill": "wasm", "label": "WASM", "jobs": 4,
+            "confidence": 0.8, "lift": 20.0, "pmi": round(float(np.log2(20)), 4),
+        }])
+        self.assertEqual(self.index.related("go")["related"][0]["lift"], 2.0)
+
+    def test_unknown_skill_and_score(self):
+        self.assertIsNone(self.index.related("cobol"))
+        with self.assertRaises(ValueError):
+            self.index.related("go", score="cosine")
+
+    def test_empty_index(self):
+        index = RelatedSkillsIndex.from_rows([], [], total_jobs=0)
+        self.assertIsNone(index.related("go"))
+
+
+class CooccurrenceBehaviour:
+    """Shared cases; subclasses provide `engine` and `async_engine`."""
+
+    def seed(self):
+        add_jobs(self.engine, JOBS)
+
+    def test_flush_maintains_cooccurrences(self):
+        counts = _cooccurrences(self.engine)
+        self.assertEqual(counts[("kubernetes", "kubernetes")], 8)
+        self.assertEqual(counts[("kubernetes", "go")], 4)
+        self.assertEqual(counts[("go", "kubernetes")], 4)
+        self.assertEqual(counts[("docker", "python")], 2)
+        self.assertNotIn(("go", "terraform"), counts)
+
+    def test_updates_and_deletes_move_counts(self):
+        with Session(self.engine) as db:
+            db.get(Job, 1).tags = ["Go", "Rust"]
+            for job_id in (12, 13):
+                db.delete(db.get(Job, job_id))
+            db.commit()
+        counts = _cooccurrences(self.engine)
+        self.assertEqual(counts[("kubernetes", "go")], 3)
+        self.assertEqual(counts[("go", "rust")], 1)
+        self.assertEqual(counts[("docker", "docker")], 3)
+        self.assertNotIn(("docker", "python"), counts)
+
+    def test_rebuild_matches_incremental(self):
+        expected = _cooccurrences(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(TagCooccurrence.__table__.delete())
+            self.assertEqual(rebuild_cooccurrence(conn), len(expected))
+        self.assertEqual(_cooccurrences(self.engine), expected)
+
+    def _get(self, path):
+        try:
+            return api_client(async_engine=self.async_engine).get(path)
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_related_skills_endpoint(self):
+        related_skills_cache.clear()
+        data = self._get("/api/v1/analytics/related-skills?skill=K8s").json()
+        self.assertEqual((data["skill"], data["jobs"], data["total_jobs"]), ("kubernetes", 8, 14))
+        # Lift ties (go, terraform: 1.75) go to the pair with more jobs; python is below support.
+        self.assertEqual([entry["skill"] for entry in data["related"]], ["go", "terraform", "docker"])
+        self.assertEqual(data["related"][0]["lift"], 1.75)
+
+        by_jobs = self._get("/api/v1/analytics/related-skills?skill=kubernetes&score=jobs&limit=2").json()
+        self.assertEqual([entry["skill"] for entry in by_jobs["related"]], ["go", "docker"])
+
+    def test_unknown_skill_and_score_are_rejected(self):
+        related_skills_cache.clear()
+        self.assertEqual(self._get("/api/v1/analytics/related-skills?skill=cobol").status_code, 404)
+        self.assertEqual(self._get("/api/v1/analytics/related-skills?skill=go&score=cosine").status_code, 400)
+
+    def test_index_is_reused_until_ingestion(self):
+        related_skills_cache.clear()
+        self._get("/api/v1/analytics/related-skills?skill=go")
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            self._get("/api/v1/analytics/related-skills?skill=docker")
+        self.assertFalse(statements)
+
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Acme", "work_modality": "Remote",
+                "url": "https://example.com/99", "tags": ["Go", "Docker"],
+                "created_at": CREATED_AT.isoformat(),
+            }], db)
+        data = self._get("/api/v1/analytics/related-skills?skill=go").json()
+        self.assertEqual(data["related"][0], {
+            "skill": "docker", "label": "Docker", "jobs": 5, "confidence": 1.0,
+            "lift": round(5 * 15 / (5 * 7), 4), "pmi": round(float(np.log2(5 * 15 / (5 * 7))), 4),
+        })
+
+
+class TestCooccurrenceSqlite(CooccurrenceBehaviour, SqliteTestCase):
+    pass
+
+
+class TestCooccurrencePostgres(CooccurrenceBehaviour, PostgresTestCase):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import asyncio
+import gzip
+import unittest
+from datetime import date, datetime, time, timedelta
+import brotli
+import orjson
+from sqlalchemy.orm import Session
+from app.main import app
+from app.models.job import Job
+from app.services import response_cache as response_cache_module
+from app.services.remoteok_service import save_jobs_to_db
+from app.services.response_cache import (
+    CachedBody,
+    negotiate_encoding,
+    response_cache,
+    schedule_warming,
+    warm_response_cache,
+)
+from app.tests.postgres import capture_statements
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+TODAY = datetime.combine(date.today(), time(12))
+
+
+class TestNegotiateEncoding(unittest.TestCase):
+
+    def test_prefers_brotli(self):
+        self.assertEqual(negotiate_encoding("gzip, deflate, br"), "br")
+        self.assertEqual(negotiate_encoding("gzip"), "gzip")
+        self.assertEqual(negotiate_encoding("*"), "br")
+
+    def test_respects_quality_values(self):
+        self.assertEqual(negotiate_encoding("br;q=0.5, gzip"), "gzip")
+        self.assertIsNone(negotiate_encoding("br;q=0, gzip;q=0"))
+        self.assertEqual(negotiate_encoding("*, br;q=0"), "gzip")
+
+    def test_identity(self):
+        self.assertIsNone(negotiate_encoding(None))
+        self.assertIsNone(negotiate_encoding("deflate"))
+
+
+class TestCachedBody(unittest.TestCase):
+
+    def test_encodings_decode_to_the_body(self):
+        content = {"jobs": [{"id": i, "title": "Engineer", "created_at": TODAY} for i in range(100)]}
+        body = CachedBody.from_content(content)
+        self.assertEqual(orjson.loads(body.identity)["jobs"][0]["created_at"], TODAY.isoformat())
+        self.assertEqual(gzip.decompress(body.encoded["gzip"]), body.identity)
+        self.assertEqual(brotli.decompress(body.encoded["br"]), body.identity)
+        self.assertLess(len(body.encoded["br"]), len(body.identity))
+
+    def test_small_bodies_are_not_compressed(self):
+        body = CachedBody.from_content({"jobs": []})
+        self.assertEqual(body.encoded, {})
+        self.assertNotIn("content-encoding", body.response("gzip, br", "MISS").headers)
+
+
+class TestCachedEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        with Session(self.engine) as db:
+            db.add_all([
+                Job(id=job_id, title=f"Engineer {job_id}", company="Acme",
+                    work_modality="Remote" if job_id % 2 else "Onsite", description="Build things. " * 20,
+                    tags=["Python", "Go"] if job_id % 3 else ["Rust"], url=f"https://example.com/{job_id}",
+                    created_at=TODAY - timedelta(hours=job_id))
+                for job_id in range(1, 31)
+            ])
+            db.commit()
+
+        response_cache.clear()
+        self.client = api_client(self.engine, self.async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def _statements(self, path, **kwargs):
+        with capture_statements(self.engine) as statements, \
+                capture_statements(self.async_engine.sync_engine) as async_statements:
+            response = self.client.get(path, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        return response, statements + async_statements
+
+    def test_hits_skip_the_database(self):
+        for path in ("/api/v1/summary/daily", "/api/v1/summary/recent", "/api/v1/jobs?view=compact"):
+            with self.subTest(path=path):
+                first, statements = self._statements(path)
+                self.assertEqual(first.headers["x-cache"], "MISS")
+                self.assertTrue(statements)
+                second, statements = self._statements(path)
+                self.assertEqual(second.headers["x-cache"], "HIT")
+                self.assertFalse(statements)
+                self.assertEqual(second.json(), first.json())
+
+    def test_serves_the_negotiated_encoding(self):
+        identity = self.client.get("/api/v1/jobs", headers={"Accept-Encoding": "identity"})
+        for encoding in ("br", "gzip"):
+            response = self.client.get("/api/v1/jobs", headers={"Accept-Encoding": encoding})
+            self.assertEqual(response.headers["content-encoding"], encoding)
+            self.assertEqual(response.headers["vary"], "Accept, Accept-Encoding")
+            self.assertEqual(response.json(), identity.json())
+        self.assertNotIn("content-encoding", identity.headers)
+
+    def test_equivalent_parameters_share_an_entry(self):
+        first = self.client.get("/api/v1/summary/daily?location=Remote&tags=Python&tags=go")
+        second = self.client.get("/api/v1/summary/daily?location=%20remote&tags=GO&tags=python")
+        self.assertEqual(second.headers["x-cache"], "HIT")
+        self.assertEqual(first.json()["summary"]["filters_applied"]["tags"], ["go", "python"])
+
+        self.client.get("/api/v1/jobs?search=Engineer&fields=id,title")
+        self.assertEqual(self.client.get("/api/v1/jobs?search=%20engineer&fields=title,id").headers["x-cache"], "HIT")
+
+    def test_search_runs_with_the_text_it_is_cached_under(self):
+        # Extra spaces share the entry, so the query must not see them either.
+        spaced = self.client.get("/api/v1/jobs?search=ENGINEER%20%20%201&fields=id").json()
+        self.assertEqual(spaced["total"], 11)
+        response = self.client.get("/api/v1/jobs?search=engineer%201&fields=id")
+        self.assertEqual(response.headers["x-cache"], "HIT")
+        self.assertEqual(response.json(), spaced)
+
+    def test_only_first_json_pages_are_cached(self):
+        self.assertNotIn("x-cache", self.client.get("/api/v1/jobs?page=4&page_size=5").headers)
+        msgpack = self.client.get("/api/v1/jobs", headers={"Accept": "application/x-msgpack"})
+        self.assertNotIn("x-cache", msgpack.headers)
+
+    def test_ingestion_invalidates(self):
+        self.client.get("/api/v1/summary/recent")
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Hooli", "work_modality": "Remote",
+                "url": "https://example.com/99", "tags": ["python"], "created_at": TODAY.isoformat(),
+            }], db)
+        response = self.client.get("/api/v1/summary/recent")
+        self.assertEqual(response.headers["x-cache"], "MISS")
+        self.assertEqual(response.json()["summary"]["total_jobs"], 31)
+
+    def test_warming_fills_the_default_pages(self):
+        paths = ["/api/v1/summary/daily", "/api/v1/jobs?view=compact&page_size=12&page=1"]
+        self.assertEqual(asyncio.run(warm_response_cache(paths)), 2)
+        for path in paths:
+            self.assertEqual(self.client.get(path).headers["x-cache"], "HIT")
+
+    def test_warming_needs_a_bound_loop(self):
+        self.assertIsNone(response_cache_module._warm_loop)
+        self.assertFalse(schedule_warming())
+
+
+if __name__ == '__main__':
+    unittest.main()
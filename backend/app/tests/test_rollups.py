@@ -0,0 +1,181 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from app.analytics.rollups import location_country, rebuild_rollups
+from app.main import app
+from app.models.job import Job
+from app.models.rollup import JobDailyCompany, JobDailyRollup
+from app.services.remoteok_service import save_jobs_to_db
+from app.tests.postgres import PostgresTestCase, capture_statements
+from app.tests.sqlite import SqliteTestCase, add_jobs, api_client
+
+TODAY = datetime.combine(date.today(), time(12))
+YESTERDAY = TODAY - timedelta(days=1)
+LAST_YEAR = TODAY - timedelta(days=200)
+
+JOBS = [
+    dict(id=1, created_at=TODAY, source="adzuna", work_modality="Remote", location="London, UK", tags=["Python", "py"]),
+    dict(id=2, created_at=TODAY, source="adzuna", work_modality="Hybrid", location="Leeds, England", tags=["Go"]),
+    dict(id=3, created_at=TODAY, source="remoteok", location="Remote", company="Globex", tags=["golang", "Python"]),
+    dict(id=4, created_at=YESTERDAY, source="jsearch", work_modality="Onsite", location="Austin, TX, USA",
+         company="Initech", tags=["Python"]),
+    dict(id=5, created_at=LAST_YEAR, source="jsearch", work_modality="Onsite", location=None, company="Initech", tags=[]),
+]
+
+
+def _rollups(engine):
+    with engine.connect() as conn:
+        rollups = {
+            (day, dimension, value): jobs
+            for day, dimension, value, jobs in conn.execute(select(JobDailyRollup.__table__))
+        }
+        companies = {(day, company): jobs for day, company, jobs in conn.execute(select(JobDailyCompany.__table__))}
+    return rollups, companies
+
+
+class TestLocationCountry(unittest.TestCase):
+
+    def test_last_part_with_aliases(self):
+        self.assertEqual(location_country("Austin, TX, USA"), "United States")
+        self.assertEqual(location_country("Leeds,  England"), "United Kingdom")
+        self.assertEqual(location_country("Berlin, Germany"), "Germany")
+
+    def test_remote_and_unknown(self):
+        self.assertEqual(location_country("Worldwide"), "Remote")
+        self.assertEqual(location_country("N/A"), "unknown")
+        self.assertEqual(location_country(None), "unknown")
+
+
+class RollupBehaviour:
+    """Shared cases; subclasses provide `engine` and `async_engine`."""
+
+    def seed(self):
+        add_jobs(self.engine, JOBS)
+
+    def test_flush_maintains_rollups(self):
+        rollups, companies = _rollups(self.engine)
+        today = TODAY.date()
+        self.assertEqual(rollups[(today, "total", "all")], 3)
+        self.assertEqual(rollups[(today, "source", "adzuna")], 2)
+        self.assertEqual(rollups[(today, "country", "United Kingdom")], 2)
+        self.assertEqual(rollups[(today, "country", "Remote")], 1)
+        # "py" and "Python" on one job count once; "golang" is "go".
+        self.assertEqual(rollups[(today, "tag", "python")], 2)
+        self.assertEqual(rollups[(today, "tag", "go")], 2)
+        self.assertEqual(rollups[(LAST_YEAR.date(), "country", "unknown")], 1)
+        self.assertEqual(companies[(today, "Acme")], 2)
+
+    def test_updates_and_deletes_move_counts(self):
+        with Session(self.engine) as db:
+            job = db.get(Job, 2)
+            job.work_modality = "Remote"
+            job.tags = ["Rust"]
+            db.delete(db.get(Job, 3))
+            db.commit()
+        rollups, companies = _rollups(self.engine)
+        today = TODAY.date()
+        self.assertEqual(rollups[(today, "work_modality", "Remote")], 2)
+        self.assertNotIn((today, "work_modality", "Hybrid"), rollups)
+        self.assertNotIn((today, "tag", "go"), rollups)
+        self.assertEqual(rollups[(today, "tag", "rust")], 1)
+        self.assertEqual(rollups[(today, "total", "all")], 2)
+        self.assertNotIn((today, "Globex"), companies)
+
+    def test_ingestion_updates_rollups(self):
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Hooli", "work_modality": "Remote",
+                "location": "Lisbon, Portugal", "url": "https://example.com/99", "tags": "Python, SQL",
+                "source": "remoteok", "created_at": TODAY.isoformat(),
+            }], db)
+        rollups, _ = _rollups(self.engine)
+        self.assertEqual(rollups[(TODAY.date(), "country", "Portugal")], 1)
+        self.assertEqual(rollups[(TODAY.date(), "tag", "python")], 3)
+
+    def test_changes_are_written_once_per_commit(self):
+        with capture_statements(self.engine) as statements, Session(self.engine) as db:
+            for job_id in (10, 11, 12):
+                try:
+                    with db.begin_nested():
+                        db.add(Job(id=job_id, title=f"Engineer {job_id}", company="Hooli", source="adzuna",
+                                   work_modality="Remote", location="Remote", tags=["Rust"],
+                                   url=f"https://example.com/{job_id}", created_at=TODAY))
+                        db.flush()
+                        if job_id == 12:
+                            raise ValueError("rolled back")
+                except ValueError:
+                    pass
+            db.commit()
+        upserts = [statement for statement, _ in statements if statement.startswith("INSERT INTO job_daily_rollups")]
+        self.assertEqual(len(upserts), 1)
+        rollups, companies = _rollups(self.engine)
+        self.assertEqual(rollups[(TODAY.date(), "tag", "rust")], 2)
+        self.assertEqual(companies[(TODAY.date(), "Hooli")], 2)
+
+    def test_rebuild_matches_incremental(self):
+        expected = _rollups(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(JobDailyRollup.__table__.delete())
+            conn.execute(JobDailyCompany.__table__.delete())
+            self.assertEqual(rebuild_rollups(conn, batch_size=2), len(JOBS))
+        self.assertEqual(_rollups(self.engine), expected)
+
+    def test_rebuild_since_keeps_older_days(self):
+        with self.engine.begin() as conn:
+            self.assertEqual(rebuild_rollups(conn, since=YESTERDAY.date()), 4)
+        rollups, _ = _rollups(self.engine)
+        self.assertEqual(rollups[(LAST_YEAR.date(), "total", "all")], 1)
+
+    def _get(self, path):
+        try:
+            return api_client(async_engine=self.async_engine).get(path)
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_top_values_endpoint(self):
+        response = self._get("/api/v1/analytics/top?dimension=tag&days=30")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["values"], [
+            {"value": "python", "jobs": 3},
+            {"value": "go", "jobs": 2},
+        ])
+        year = self._get("/api/v1/analytics/top?dimension=source&days=365").json()["values"]
+        self.assertEqual(year[0], {"value": "adzuna", "jobs": 2})
+        self.assertEqual(year[1], {"value": "jsearch", "jobs": 2})
+
+    def test_daily_series_endpoint(self):
+        data = self._get("/api/v1/analytics/daily?dimension=tag&values=python&days=7").json()
+        self.assertEqual(data["series"][0]["jobs"], 3)
+        self.assertEqual(
+            [point["jobs"] for point in data["series"][0]["daily"]], [1, 2],
+        )
+        total = self._get("/api/v1/analytics/daily?days=7").json()["series"]
+        self.assertEqual(total[0]["value"], "all")
+        self.assertEqual(total[0]["jobs"], 4)
+
+    def test_company_activity_endpoint(self):
+        data = self._get("/api/v1/analytics/companies?days=7").json()
+        self.assertEqual(data["distinct_companies"], 3)
+        self.assertEqual([day["companies"] for day in data["daily"]], [1, 2])
+
+    def test_unknown_dimension_is_rejected(self):
+        self.assertEqual(self._get("/api/v1/analytics/top?dimension=salary").status_code, 400)
+
+
+class TestRollupsSqlite(RollupBehaviour, SqliteTestCase):
+    pass
+
+
+class TestRollupsPostgres(RollupBehaviour, PostgresTestCase):
+
+    def test_rollups_survive_raw_sql_deletes(self):
+        # Archival detaches partitions with raw SQL; the history stays in the rollups.
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM jobs WHERE id = 5"))
+        rollups, _ = _rollups(self.engine)
+        self.assertEqual(rollups[(LAST_YEAR.date(), "total", "all")], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
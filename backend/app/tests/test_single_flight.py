@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import patch
+import httpx
+from sqlalchemy.orm import Session
+from app.features.summaries.summary_service import SummaryService
+from app.main import app
+from app.models.job import Job
+from app.routers.ai_router import analyze_flight
+from app.routers.summary_router import summary_flight
+from app.services.response_cache import response_cache
+from app.services.single_flight import SingleFlight
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+CALLERS = 8
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+class TestSingleFlightSync(unittest.TestCase):
+
+    def _run_concurrently(self, flight, fn):
+        """Call flight.do("key", fn) from CALLERS threads while the first call is still running."""
+        with ThreadPoolExecutor(CALLERS) as pool:
+            futures = [pool.submit(flight.do, "key", fn) for _ in range(CALLERS)]
+            _wait_for(lambda: flight.coalesced == CALLERS - 1)
+            self.release.set()
+            return futures
+
+    def setUp(self):
+        self.release = threading.Event()
+
+    def test_concurrent_calls_share_one_result(self):
+        flight = SingleFlight("test-sync")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            self.release.wait(5)
+            return object()
+
+        results = {future.result() for future in self._run_concurrently(flight, compute)}
+        self.assertEqual((len(calls), len(results)), (1, 1))
+        self.assertEqual(flight.snapshot(), {
+            "in_flight": 0, "requests": CALLERS, "executions": 1, "coalesced": CALLERS - 1,
+            "coalesced_ratio": round((CALLERS - 1) / CALLERS, 4), "errors": 0,
+        })
+        # Nothing is kept: the next call runs again.
+        flight.do("key", lambda: None)
+        self.assertEqual(flight.executions, 2)
+
+    def test_errors_reach_every_caller(self):
+        flight = SingleFlight("test-sync-errors")
+
+        def compute():
+            self.release.wait(5)
+            raise ValueError("boom")
+
+        for future in self._run_concurrently(flight, compute):
+            with self.assertRaises(ValueError):
+                future.result()
+        self.assertEqual(flight.errors, 1)
+
+
+class TestSingleFlightAsync(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_task(self):
+        flight = SingleFlight("test-async")
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", compute) for _ in range(CALLERS)))
+
+        self.assertEqual(asyncio.run(main()), [1] * CALLERS)
+        self.assertEqual((flight.executions, flight.coalesced), (1, CALLERS - 1))
+        self.assertEqual(flight.snapshot()["in_flight"], 0)
+
+    def test_cancelled_caller_does_not_cancel_the_others(self):
+        flight = SingleFlight("test-async-cancel")
+
+        async def compute():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            first = asyncio.ensure_future(flight.do_async("key", compute))
+            second = asyncio.ensure_future(flight.do_async("key", compute))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(main()), "done")
+        self.assertEqual(flight.executions, 1)
+
+    def test_errors_are_counted_once(self):
+        flight = SingleFlight("test-async-errors")
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", compute) for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in asyncio.run(main())))
+        self.assertEqual(flight.errors, 1)
+
+
+class TestCoalescedEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        with Session(self.engine) as db:
+            db.add(Job(id=1, title="Engineer", company="Acme", work_modality="Remote",
+                       description="Build things.", tags=["python"], url="https://example.com/1",
+                       created_at=datetime.now()))
+            db.commit()
+
+        response_cache.clear()
+        self.client = api_client(self.engine, self.async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_summary_misses_share_one_query(self):
+        original = SummaryService.get_daily_summary
+        calls = []
+
+        async def slow_summary(service, *args, **kwargs):
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return await original(service, *args, **kwargs)
+
+        async def burst():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(*(
+                    client.get("/api/v1/summary/daily", params={"tags": tag})
+                    for tag in ["Python", "python ", "PYTHON"] * 3
+                ))
+
+        executions = summary_flight.executions
+        with patch.object(SummaryService, "get_daily_summary", slow_summary):
+            responses = asyncio.run(burst())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(summary_flight.executions - executions, 1)
+        self.assertEqual({response.content for response in responses}, {responses[0].content})
+        self.assertEqual(responses[0].json()["summary"]["total_jobs"], 1)
+
+    def test_analyze_job_shares_one_ai_call(self):
+        calls = []
+        coalesced = analyze_flight.coalesced
+
+        def slow_analysis(description, title):
+            calls.append(title)
+            # Finish once the other requests have joined this call.
+            _wait_for(lambda: analyze_flight.coalesced - coalesced == 3)
+            return {"summary": f"About {title}"}
+
+        def request(_):
+            return self.client.get("/api/v1/ai/analyze-job/1")
+
+        with patch("app.routers.ai_router.ai_service.analyze_job", side_effect=slow_analysis):
+            with ThreadPoolExecutor(4) as pool:
+                responses = list(pool.map(request, range(4)))
+        self.assertEqual(calls, ["Engineer"])
+        self.assertEqual(analyze_flight.coalesced - coalesced, 3)
+        self.assertTrue(all(response.json() == {"summary": "About Engineer"} for response in responses))
+
+        stats = self.client.get("/internal/stats/coalescing").json()
+        self.assertIn("ai/analyze-job", stats)
+        self.assertIn("summary", stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
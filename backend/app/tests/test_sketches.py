@@ -0,0 +1,166 @@
+import random
+import unittest
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.analytics.analytics_service import estimates_cache
+from app.analytics.daily_sketches import load_sketch, rebuild_sketches, sketch_location
+from app.analytics.sketches import HyperLogLog, SpaceSaving
+from app.main import app
+from app.models.rollup import JobDailySketch
+from app.services.remoteok_service import save_jobs_to_db
+from app.tests.postgres import PostgresTestCase, capture_statements
+from app.tests.sqlite import SqliteTestCase, add_jobs, api_client
+
+TODAY = datetime.combine(date.today(), time(12))
+
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_estimate_within_three_standard_errors(self):
+        sketch = HyperLogLog().add(f"company {i}" for i in range(50000))
+        self.assertLess(abs(sketch.estimate() - 50000) / 50000, 3 * sketch.relative_error)
+
+    def test_small_counts_are_near_exact(self):
+        sketch = HyperLogLog().add(["Acme", "Globex", "Acme", "Initech"])
+        self.assertEqual(sketch.estimate(), 3)
+        self.assertEqual(HyperLogLog().estimate(), 0)
+
+    def test_union_equals_sketch_of_all_values(self):
+        first = HyperLogLog().add(str(i) for i in range(0, 6000))
+        second = HyperLogLog().add(str(i) for i in range(4000, 10000))
+        both = HyperLogLog().add(str(i) for i in range(10000))
+        np.testing.assert_array_equal(HyperLogLog.union([first, second]).registers, both.registers)
+
+    def test_bytes_round_trip(self):
+        sketch = HyperLogLog().add(["a", "b"])
+        np.testing.assert_array_equal(HyperLogLog.from_bytes(sketch.to_bytes()).registers, sketch.registers)
+
+
+class TestSpaceSaving(unittest.TestCase):
+
+    def test_exact_under_capacity(self):
+        sketch = SpaceSaving(capacity=10).add(["python"] * 5 + ["go"] * 3 + ["rust"])
+        self.assertEqual(sketch.top(2), [("python", 5, 0), ("go", 3, 0)])
+        self.assertEqual(sketch.floor, 0)
+
+    def test_merged_days_bound_true_counts(self):
+        rng = random.Random(3)
+        # Zipf-like: a few heavy tags and a long tail, split over 30 days.
+        weights = [1 / (rank + 1) for rank in range(2000)]
+        days = [Counter(rng.choices(range(2000), weights, k=3000)) for _ in range(30)]
+        truth = sum(days, Counter())
+        merged = SpaceSaving.merge_all(
+            [SpaceSaving.from_counts(Counter({str(k): v for k, v in day.items()}), capacity=100) for day in days],
+            capacity=100,
+        )
+        for value, count, error in merged.top(20):
+            self.assertGreaterEqual(count, truth[int(value)])
+            self.assertLessEqual(count - error, truth[int(value)])
+        expected = [str(value) for value, _ in truth.most_common(5)]
+        self.assertEqual([value for value, _, _ in merged.top(5)], expected)
+
+    def test_bytes_round_trip(self):
+        sketch = SpaceSaving.from_counts(Counter({"python": 3, "go": 2, "rust": 1}), capacity=2)
+        restored = SpaceSaving.from_bytes(sketch.to_bytes())
+        self.assertEqual((restored.counters, restored.floor), ({"python": (3, 0), "go": (2, 0)}, 1))
+
+
+class TestSketchLocation(unittest.TestCase):
+
+    def test_normalizes_and_skips_unknown(self):
+        self.assertEqual(sketch_location("  London,  UK "), "london, uk")
+        self.assertIsNone(sketch_location("N/A"))
+        self.assertIsNone(sketch_location(None))
+
+
+JOBS = [
+    dict(id=1, created_at=TODAY, company="Acme", location="London, UK", tags=["Python", "py"]),
+    dict(id=2, created_at=TODAY, company="Acme", location="Berlin", tags=["Go"]),
+    dict(id=3, created_at=TODAY - timedelta(days=1), company="Globex", location="london,  uk", tags=["golang", "Python"]),
+    dict(id=4, created_at=TODAY - timedelta(days=200), company="Initech", location=None, tags=["Python"]),
+]
+
+
+def _sketches(engine):
+    with engine.connect() as conn:
+        return {
+            (day, kind): load_sketch(kind, data)
+            for day, kind, data in conn.execute(select(JobDailySketch.day, JobDailySketch.kind, JobDailySketch.sketch))
+        }
+
+
+class SketchBehaviour:
+    """Shared cases for SqliteTestCase / PostgresTestCase."""
+
+    def seed(self):
+        add_jobs(self.engine, JOBS)
+
+    def test_flush_maintains_sketches(self):
+        sketches = _sketches(self.engine)
+        today = TODAY.date()
+        self.assertEqual(sketches[(today, "companies")].estimate(), 1)
+        self.assertEqual(sketches[(today, "locations")].estimate(), 2)
+        self.assertEqual(sketches[(today, "tags")].top(5), [("go", 1, 0), ("python", 1, 0)])
+
+    def test_ingestion_adds_to_existing_day(self):
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 99, "title": "Engineer 99", "company": "Hooli", "work_modality": "Remote",
+                "location": "Lisbon", "url": "https://example.com/99", "tags": "Python, SQL",
+                "created_at": TODAY.isoformat(),
+            }], db)
+        sketches = _sketches(self.engine)
+        self.assertEqual(sketches[(TODAY.date(), "companies")].estimate(), 2)
+        self.assertEqual(sketches[(TODAY.date(), "tags")].top(1), [("python", 2, 0)])
+
+    def test_ingestion_merges_each_day_once(self):
+        jobs = [{
+            "id": job_id, "title": f"Engineer {job_id}", "company": f"Company {job_id}", "work_modality": "Remote",
+            "url": f"https://example.com/{job_id}", "tags": ["Rust"], "created_at": TODAY.isoformat(),
+        } for job_id in (97, 98, 99)]
+        with capture_statements(self.engine) as statements, Session(self.engine) as db:
+            save_jobs_to_db(jobs, db)
+        reads = [statement for statement, _ in statements if "FROM job_daily_sketches" in statement]
+        self.assertEqual(len(reads), 1)
+        self.assertEqual(_sketches(self.engine)[(TODAY.date(), "companies")].estimate(), 4)
+
+    def test_rebuild_matches_incremental(self):
+        expected = _sketches(self.engine)
+        with self.engine.begin() as conn:
+            self.assertEqual(rebuild_sketches(conn, batch_size=2), 4)
+        rebuilt = _sketches(self.engine)
+        self.assertEqual(set(rebuilt), set(expected))
+        for key, sketch in expected.items():
+            self.assertEqual(rebuilt[key].to_bytes(), sketch.to_bytes(), key)
+
+    def test_estimates_endpoint(self):
+        estimates_cache.clear()
+        client = api_client(async_engine=self.async_engine)
+        try:
+            week = client.get("/api/v1/analytics/estimates?days=7").json()
+            year = client.get("/api/v1/analytics/estimates?days=365&limit=1").json()
+        finally:
+            app.dependency_overrides.clear()
+        self.assertEqual((week["distinct_companies"], week["distinct_locations"]), (2, 2))
+        # Ties rank by value.
+        self.assertEqual(week["top_tags"], [
+            {"value": "go", "jobs": 2, "error": 0},
+            {"value": "python", "jobs": 2, "error": 0},
+        ])
+        self.assertEqual(year["distinct_companies"], 3)
+        self.assertEqual(year["top_tags"], [{"value": "python", "jobs": 3, "error": 0}])
+
+
+class TestSketchesSqlite(SketchBehaviour, SqliteTestCase):
+    pass
+
+
+class TestSketchesPostgres(SketchBehaviour, PostgresTestCase):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.features.summaries.summary_service import SummaryService
+from app.models.job import Job
+from app.tests.postgres import (
+    capture_statements,
+    create_test_async_engine,
+    create_test_engine,
+    requires_postgres,
+    reset_schema,
+)
+from app.tests.sqlite import create_async_sqlite_engine, create_sqlite_engine
+
+
+def _seed(engine):
+    """
+    30 recent jobs (20 Remote at Acme tagged python, 10 Hybrid elsewhere),
+    2 from three days ago and 5 old ones.
+    """
+    now = datetime.now()
+    jobs = []
+    for job_id in range(1, 31):
+        remote = job_id <= 20
+        jobs.append(Job(
+            id=job_id,
+            title=f"Job {job_id}",
+            company="Acme" if remote else f"Company {job_id % 3}",
+            work_modality="Remote" if remote else "Hybrid",
+            tags=["Python", "Django"] if remote else ["Go", "C", "Python"],
+            url=f"https://example.com/{job_id}",
+            created_at=now - timedelta(minutes=job_id),
+        ))
+    for job_id in range(36, 38):
+        jobs.append(Job(id=job_id, title=f"Job {job_id}", company="Ferris", work_modality="Onsite",
+                        tags=["Rust"], url=f"https://example.com/{job_id}", created_at=now - timedelta(days=3)))
+    for job_id in range(31, 36):
+        jobs.append(Job(id=job_id, title=f"Job {job_id}", company="Legacy", work_modality="Onsite",
+                        tags=["Cobol"], url=f"https://example.com/{job_id}", created_at=now - timedelta(days=20)))
+    with Session(engine) as db:
+        db.add_all(jobs)
+        db.commit()
+
+
+class SummaryAggregatesBehaviour:
+    """Shared assertions, run against SQLite and Postgres."""
+
+    def _summary(self, **filters):
+        async def _run():
+            async with AsyncSession(self.async_engine) as db:
+                return await SummaryService(db).get_daily_summary(**filters)
+
+        data = asyncio.run(_run())
+        self.assertNotIn("error", data)
+        return data
+
+    def test_aggregates_cover_the_whole_window(self):
+        data = self._summary(limit=5)
+        summary = data["summary"]
+        self.assertEqual(len(data["jobs"]), 5)
+        self.assertEqual(summary["total_jobs"], 30)
+        self.assertEqual(summary["top_companies"][0], "Acme")
+        self.assertEqual(set(summary["top_companies"]), {"Acme", "Company 0", "Company 1", "Company 2"})
+        self.assertEqual(summary["work_modalities"], ["Remote", "Hybrid"])
+        self.assertEqual(summary["top_skills"], [
+            {"skill": "Python", "count": 30},
+            {"skill": "Django", "count": 20},
+            {"skill": "Go", "count": 10},
+        ])
+
+    def test_aggregates_follow_filters(self):
+        summary = self._summary(location="hybrid", tags=["go"], limit=1)["summary"]
+        self.assertEqual(summary["total_jobs"], 10)
+        self.assertEqual(summary["work_modalities"], ["Hybrid"])
+        self.assertEqual(summary["top_skills"][0], {"skill": "Go", "count": 10})
+
+    def test_longer_period_includes_older_jobs(self):
+        summary = self._summary(period_days=30)["summary"]
+        self.assertEqual(summary["total_jobs"], 37)
+        self.assertIn("Legacy", summary["top_companies"])
+
+    def test_requested_window_is_reported(self):
+        data = self._summary(limit=40)
+        self.assertEqual(len(data["jobs"]), 30)
+        self.assertEqual((data["summary"]["window"]["days"], data["summary"]["window"]["expanded"]), (1, False))
+
+    def test_empty_window_falls_back_to_seven_days(self):
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            data = self._summary(tags=["rust"])
+        summary = data["summary"]
+        self.assertEqual((summary["window"]["days"], summary["window"]["expanded"]), (7, True))
+        self.assertEqual(summary["total_jobs"], 2)
+        self.assertEqual([job["id"] for job in data["jobs"]], [36, 37])
+        self.assertEqual(summary["top_companies"], ["Ferris"])
+        # One list query decides the window; only the aggregates run again.
+        self.assertEqual(len(statements), 4 + 3)
+
+    def test_no_match_in_fallback_window(self):
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            data = self._summary(tags=["cobol"])
+        self.assertEqual(data["summary"]["total_jobs"], 0)
+        self.assertEqual(data["jobs"], [])
+        self.assertEqual(data["summary"]["window"]["days"], 1)
+        self.assertEqual(len(statements), 4)
+
+
+class TestSummaryAggregatesSqlite(SummaryAggregatesBehaviour, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_sqlite_engine()
+        cls.async_engine = create_async_sqlite_engine(cls.engine)
+        _seed(cls.engine)
+
+
+@requires_postgres
+class TestSummaryAggregatesPostgres(SummaryAggregatesBehaviour, unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+        cls.async_engine = create_test_async_engine()
+        reset_schema(cls.engine)
+        _seed(cls.engine)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
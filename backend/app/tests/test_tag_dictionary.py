@@ -0,0 +1,119 @@
+import unittest
+from datetime import datetime
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from app.models import Job, JobTag, Tag, TagAlias
+from app.services.tag_dictionary import backfill_job_tags, canonical_tag, normalize_tag, resolve_tag_ids
+from app.tests.postgres import create_test_engine, requires_postgres, reset_schema
+from app.tests.sqlite import create_sqlite_engine
+
+CREATED_AT = datetime(2026, 10, 1)
+
+
+def _job(job_id, tags):
+    return Job(id=job_id, title=f"Job {job_id}", company="Acme", work_modality="Remote",
+               tags=tags, url=f"https://example.com/{job_id}", created_at=CREATED_AT)
+
+
+def _linked_tags(conn):
+    rows = conn.execute(
+        select(JobTag.job_id, Tag.name).join(Tag, Tag.id == JobTag.tag_id).order_by(JobTag.job_id, Tag.name)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+class TestTagNormalization(unittest.TestCase):
+
+    def test_normalize_collapses_case_and_whitespace(self):
+        self.assertEqual(normalize_tag("  Node   JS "), "node js")
+
+    def test_canonical_resolves_curated_synonyms(self):
+        self.assertEqual(canonical_tag("Node JS"), "node.js")
+        self.assertEqual(canonical_tag("K8s"), "kubernetes")
+        self.assertEqual(canonical_tag("Rust"), "rust")
+
+
+class TestTagDictionarySqlite(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_resolve_creates_tag_and_aliases_once(self):
+        with self.engine.begin() as conn:
+            first = resolve_tag_ids(conn, ["JS", "JavaScript", "Rust"])
+            again = resolve_tag_ids(conn, ["js", "javascript"])
+            self.assertEqual(first["js"], first["javascript"])
+            self.assertEqual(again, {"js": first["js"], "javascript": first["js"]})
+            labels = dict(conn.execute(select(Tag.name, Tag.label)).all())
+        self.assertEqual(labels, {"javascript": "JavaScript", "rust": "Rust"})
+
+    def test_synonym_seen_alone_gets_canonical_tag(self):
+        with self.engine.begin() as conn:
+            tag_ids = resolve_tag_ids(conn, ["golang"])
+            name = conn.execute(select(Tag.name).where(Tag.id == tag_ids["golang"])).scalar()
+            aliases = conn.execute(select(TagAlias.alias).order_by(TagAlias.alias)).scalars().all()
+        self.assertEqual(name, "go")
+        self.assertEqual(aliases, ["go", "golang"])
+
+    def test_flush_links_inserted_retagged_and_deleted_jobs(self):
+        with Session(self.engine) as session:
+            session.add_all([_job(1, ["Python", "py", "Django"]), _job(2, ["Go"])])
+            session.commit()
+            with self.engine.connect() as conn:
+                self.assertEqual(_linked_tags(conn), [(1, "django"), (1, "python"), (2, "go")])
+
+            session.get(Job, 1).tags = ["Golang"]
+            session.delete(session.get(Job, 2))
+            session.commit()
+        with self.engine.connect() as conn:
+            self.assertEqual(_linked_tags(conn), [(1, "go")])
+
+    def test_backfill_links_only_untagged_jobs(self):
+        with self.engine.begin() as conn:
+            conn.execute(Job.__table__.insert(), [
+                {"id": i, "title": "Job", "company": "Acme", "work_modality": "Remote",
+                 "tags": ["k8s", "Python"] if i % 2 else [], "url": f"https://example.com/{i}",
+                 "created_at": CREATED_AT}
+                for i in range(1, 8)
+            ])
+            self.assertEqual(backfill_job_tags(conn, batch_size=2), 8)
+            self.assertEqual(backfill_job_tags(conn), 0)
+            self.assertIn((7, "kubernetes"), _linked_tags(conn))
+
+
+@requires_postgres
+class TestTagDictionaryPostgres(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_test_engine()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+
+    def setUp(self):
+        reset_schema(self.engine)
+
+    def tearDown(self):
+        reset_schema(self.engine)
+
+    def test_set_based_backfill(self):
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+                INSERT INTO jobs (id, title, company, work_modality, tags, url, created_at)
+                SELECT g, 'Job', 'Acme', 'Remote', ARRAY['JS', ' Node  JS ', 'tag' || (g % 3)],
+                       'https://example.com/' || g, timestamp '2026-10-01'
+                FROM generate_series(1, 30) AS g
+            """))
+            self.assertEqual(backfill_job_tags(conn), 90)
+            self.assertEqual(backfill_job_tags(conn), 0)
+            names = conn.execute(select(Tag.name).order_by(Tag.name)).scalars().all()
+        self.assertEqual(names, ["javascript", "node.js", "tag0", "tag1", "tag2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
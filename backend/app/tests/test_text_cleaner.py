@@ -1,6 +1,6 @@
 import unittest
 
-from app.services.text_cleaner import clean_job_description
+from app.services.text_cleaner import clean_job_description, make_excerpt
 
 
 class TestTextCleaner(unittest.TestCase):
@@ -18,6 +18,16 @@ class TestTextCleaner(unittest.TestCase):
         self.assertEqual(clean_job_description(""), "No description available")
         self.assertEqual(clean_job_description(None), "No description available")
 
+    def test_excerpt_flattens_short_text(self):
+        self.assertEqual(make_excerpt("Build APIs\n\nWork with  Python"), "Build APIs Work with Python")
+
+    def test_excerpt_cuts_at_word_boundary(self):
+        result = make_excerpt("alpha beta, gamma delta", max_length=12)
+        self.assertEqual(result, "alpha beta…")
+
+    def test_excerpt_of_empty_description(self):
+        self.assertIsNone(make_excerpt(""))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+import numpy as np
+from sqlalchemy.orm import Session
+from app.analytics.analytics_service import trends_cache
+from app.analytics.trend_analyzer import TrendAnalyzer
+from app.main import app
+from app.models.job import Job
+from app.services.remoteok_service import save_jobs_to_db
+from app.tests.postgres import capture_statements
+from app.tests.sqlite import api_client, create_async_sqlite_engine, create_sqlite_engine
+
+START = date(2026, 9, 1)
+
+
+def _analyzer(rows):
+    """TrendAnalyzer over 28 days from {value: [daily counts]}."""
+    return TrendAnalyzer(list(rows), START, np.array(list(rows.values()), dtype=float))
+
+
+class TestTrendAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = _analyzer({
+            "python": [5] * 14 + [5] * 7 + [9] * 7,   # rising
+            "java": [4] * 14 + [6] * 7 + [2] * 7,     # falling
+            "rust": [0] * 27 + [1],                   # too few jobs to rank
+            "go": [1, 2] * 13 + [2, 12],              # spikes on the last day
+        })
+
+    def test_from_rows_fills_missing_days_with_zero(self):
+        analyzer = TrendAnalyzer.from_rows(
+            [("go", START, 2), ("python", START + timedelta(days=2), 3), ("go", START - timedelta(days=1), 9)],
+            START, START + timedelta(days=3),
+        )
+        self.assertEqual(analyzer.values, ["go", "python"])
+        np.testing.assert_array_equal(analyzer.counts, [[2, 0, 0, 0], [0, 0, 3, 0]])
+        self.assertEqual(analyzer.end, START + timedelta(days=3))
+
+    def test_moving_average_matches_convolution(self):
+        expected = np.array([np.convolve(row, np.ones(7) / 7, mode="valid") for row in self.analyzer.counts])
+        np.testing.assert_allclose(self.analyzer.moving_average(7), expected)
+
+    def test_week_over_week(self):
+        growth = self.analyzer.week_over_week()
+        self.assertAlmostEqual(growth[0], 4 / 5)
+        self.assertAlmostEqual(growth[1], -4 / 6)
+        self.assertTrue(np.isnan(growth[2]))
+
+    def test_z_scores_flag_the_last_day(self):
+        scores = self.analyzer.z_scores()
+        self.assertGreater(scores[3], 3)
+        self.assertEqual(scores[2], 0)  # rust: flat baseline
+
+    def test_analyze_ranks_risers_fallers_and_spikes(self):
+        result = self.analyzer.analyze(limit=5, min_jobs=3)
+        self.assertEqual(result["as_of"], START + timedelta(days=27))
+        self.assertEqual([entry["value"] for entry in result["risers"]], ["python", "go"])
+        self.assertEqual(result["risers"][0]["change"], 28)
+        self.assertEqual(result["risers"][0]["moving_average"], 9)
+        self.assertEqual([entry["value"] for entry in result["fallers"]], ["java"])
+        self.assertEqual([entry["value"] for entry in result["spikes"]], ["go"])
+        self.assertNotIn("rust", [entry["value"] for entry in result["risers"]])
+
+    def test_limit_keeps_the_best(self):
+        counts = np.zeros((50, 14))
+        counts[:, 7:] = np.arange(50)[:, None]
+        result = TrendAnalyzer([f"tag{i}" for i in range(50)], START, counts).analyze(limit=3, min_jobs=1)
+        self.assertEqual([entry["value"] for entry in result["risers"]], ["tag49", "tag48", "tag47"])
+
+    def test_empty_window(self):
+        result = TrendAnalyzer.from_rows([], START, START + timedelta(days=13)).analyze()
+        self.assertEqual((result["values"], result["risers"], result["spikes"]), (0, [], []))
+
+
+class TestTrendsEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_sqlite_engine()
+        self.async_engine = create_async_sqlite_engine(self.engine)
+        today = datetime.combine(date.today(), time(12))
+        jobs = []
+        # Python: 1 job a day last week, 3 a day this week; Go the other way round.
+        for offset in range(14):
+            per_day = (3, 1) if offset < 7 else (1, 3)
+            for tag, count in zip(("Python", "Go"), per_day):
+                for _ in range(count):
+                    jobs.append(Job(
+                        id=len(jobs) + 1, title="Engineer", company=f"{tag} Corp", work_modality="Remote",
+                        tags=[tag], url=f"https://example.com/{len(jobs) + 1}",
+                        created_at=today - timedelta(days=offset),
+                    ))
+        with Session(self.engine) as db:
+            db.add_all(jobs)
+            db.commit()
+
+        trends_cache.clear()
+        self.client = api_client(async_engine=self.async_engine)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_skill_trends(self):
+        data = self.client.get("/api/v1/analytics/trends?days=30").json()
+        self.assertEqual(data["risers"][0]["value"], "python")
+        self.assertEqual(data["risers"][0]["this_week"], 21)
+        self.assertEqual(data["fallers"][0]["value"], "go")
+
+    def test_company_trends(self):
+        data = self.client.get("/api/v1/analytics/trends?dimension=company&days=30").json()
+        self.assertEqual(data["risers"][0]["value"], "Python Corp")
+
+    def test_unknown_dimension_is_rejected(self):
+        self.assertEqual(self.client.get("/api/v1/analytics/trends?dimension=source").status_code, 400)
+
+    def test_results_are_cached_until_ingestion(self):
+        self.client.get("/api/v1/analytics/trends?days=30")
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            cached = self.client.get("/api/v1/analytics/trends?days=30").json()
+        self.assertFalse(statements)
+        self.assertEqual(cached["risers"][0]["this_week"], 21)
+
+        with Session(self.engine) as db:
+            save_jobs_to_db([{
+                "id": 999, "title": "Engineer", "company": "Python Corp", "work_modality": "Remote",
+                "url": "https://example.com/999", "tags": ["python"],
+                "created_at": datetime.now().isoformat(),
+            }], db)
+        fresh = self.client.get("/api/v1/analytics/trends?days=30").json()
+        self.assertEqual(fresh["risers"][0]["this_week"], 22)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,11 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import logging
 import time
-from app.database import SessionLocal
+from app.database import SchedulerSessionLocal, scheduler_engine
+from app.services.data_version import bump_data_version
+from app.services.job_partitions import maintain_partitions
 from app.services.remoteok_service import fetch_remote_jobs, normalize_remote_jobs, save_jobs_to_db
+from app.services.response_cache import schedule_warming
 from app.services.adzuna_service import fetch_adzuna_jobs, normalize_adzuna_jobs
 from app.services.jsearch_service import fetch_jsearch_jobs, normalize_jsearch_jobs
 from app.config import (
@@ -43,7 +46,7 @@ def collect_remote_jobs() -> dict:
     db = None
     try:
         # Get a new database session
-        db = SessionLocal()
+        db = SchedulerSessionLocal()
         
         # Collect and process jobs
         logger.info("Collecting RemoteOK jobs...")
@@ -122,6 +125,8 @@ def collect_remote_jobs() -> dict:
                         time.sleep(COLLECT_SLEEP_SECONDS)
         
         logger.info("Scheduled job collection completed successfully")
+        # Ingestion invalidated the cached summary/jobs responses; refill the defaults.
+        summary["cache_warming"] = schedule_warming()
         logger.info(f"Collection summary: {summary}")
         return summary
     except Exception as e:
@@ -133,6 +138,21 @@ def collect_remote_jobs() -> dict:
         if db is not None:
             db.close()
 
+def maintain_job_partitions() -> dict:
+    """
+    Pre-creates next months' jobs partitions and archives expired ones.
+    Does nothing unless jobs has been partitioned (app/scripts/partition_jobs.py).
+    """
+    try:
+        with scheduler_engine.begin() as conn:
+            result = maintain_partitions(conn)
+        if result["archived"]:
+            bump_data_version()
+        return result
+    except Exception as e:
+        logger.error(f"Error during jobs partition maintenance: {e}")
+        return {"error": str(e)}
+
 def start_scheduler():
     """
     Starts the APScheduler to run the job collection daily at 9:00 AM.
@@ -147,6 +167,13 @@ def start_scheduler():
         name="Collect jobs from RemoteOK API",
         replace_existing=True
     )
+    scheduler.add_job(
+        maintain_job_partitions,
+        trigger=CronTrigger(hour=3, minute=30),
+        id="maintain_job_partitions_daily",
+        name="Create upcoming jobs partitions and archive old ones",
+        replace_existing=True
+    )
     
     scheduler.start()
     logger.info("Scheduler started. Jobs will be collected daily at 9:00 AM.")
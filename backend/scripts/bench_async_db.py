@@ -0,0 +1,113 @@
+"""
+Mixed-load latency benchmark: blocking sync Session vs AsyncSession in async routes.
+
+Fires concurrent requests at a small in-process app: most hit the summary query,
+the rest hit a DB-free ping route. With a sync Session inside `async def` every
+query blocks the event loop, so even the ping latency tail blows up.
+
+    DATABASE_URL=postgresql://... python scripts/bench_async_db.py --requests 2000 --rate 100 --db-latency 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal, SessionLocal
+from app.features.summaries.summary_service import SummaryService
+
+
+def build_app(db_latency: float) -> FastAPI:
+    app = FastAPI()
+    delay = text("SELECT pg_sleep(:seconds)").bindparams(seconds=db_latency / 1000)
+
+    @app.get("/blocking/summary")
+    async def blocking_summary():
+        # The pre-async pattern: sync DB I/O straight on the event loop.
+        with SessionLocal() as db:
+            if db_latency:
+                db.execute(delay)
+            query = SummaryService(db)._build_query(7, None, [], "any")
+            return {"jobs": len(db.execute(query.limit(50)).all())}
+
+    @app.get("/async/summary")
+    async def async_summary():
+        async with AsyncSessionLocal() as db:
+            if db_latency:
+                await db.execute(delay)
+            query = SummaryService(db)._build_query(7, None, [], "any")
+            return {"jobs": len((await db.execute(query.limit(50))).all())}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_mode(client, mode, total, rate, ping_ratio):
+    """
+    Open-loop load: request i is due at i / rate seconds and its latency is
+    measured from that due time, so event-loop stalls show up as queueing.
+    """
+    latencies = {"summary": [], "ping": []}
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def fire(index, kind):
+        due = started + index / rate
+        await asyncio.sleep(max(0, due - loop.time()))
+        path = "/ping" if kind == "ping" else f"/{mode}/summary"
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies[kind].append((loop.time() - due) * 1000)
+
+    kinds = ["ping" if random.random() < ping_ratio else "summary" for _ in range(total)]
+    await asyncio.gather(*(fire(index, kind) for index, kind in enumerate(kinds)))
+    return latencies, total / (loop.time() - started)
+
+
+async def main(args):
+    transport = httpx.ASGITransport(app=build_app(args.db_latency))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm both pools before measuring.
+        await client.get("/blocking/summary")
+        await client.get("/async/summary")
+
+        print(f"{'mode':<10}{'route':<9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+        for mode in ("blocking", "async"):
+            latencies, throughput = await run_mode(
+                client, mode, args.requests, args.rate, args.ping_ratio
+            )
+            for route, samples in latencies.items():
+                if not samples:
+                    continue
+                print(
+                    f"{mode:<10}{route:<9}"
+                    f"{statistics.median(samples):>9.1f}"
+                    f"{percentile(samples, 95):>9.1f}"
+                    f"{percentile(samples, 99):>9.1f}"
+                    f"{throughput:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=100, help="offered load in req/s")
+    parser.add_argument("--ping-ratio", type=float, default=0.2)
+    parser.add_argument("--db-latency", type=float, default=0, help="extra ms per query (Postgres only)")
+    asyncio.run(main(parser.parse_args()))
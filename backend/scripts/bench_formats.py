@@ -0,0 +1,76 @@
+"""
+Payload size and client decode time per export format (JSON lines vs
+MessagePack vs Arrow IPC), pulled through the real export endpoint.
+
+    DATABASE_URL=postgresql://... python scripts/bench_formats.py --view compact --repeat 5
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import msgpack
+import orjson
+import pyarrow as pa
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def decode_ndjson(body):
+    return [orjson.loads(line) for line in body.splitlines()]
+
+
+def decode_msgpack(body):
+    return list(msgpack.Unpacker(io.BytesIO(body)))
+
+
+def decode_arrow(body):
+    return pa.ipc.open_stream(body).read_all()
+
+
+DECODERS = {
+    "ndjson": decode_ndjson,
+    "msgpack": decode_msgpack,
+    "arrow": decode_arrow,
+}
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(args):
+    client = TestClient(app)
+    print(f"{'format':<9}{'rows':>9}{'MB':>9}{'server ms':>11}{'decode ms':>11}")
+    for export_format, decode in DECODERS.items():
+        url = f"/api/v1/jobs/export?format={export_format}&view={args.view}"
+        started = time.perf_counter()
+        body = client.get(url).content
+        server_ms = (time.perf_counter() - started) * 1000
+
+        decoded = decode(body)
+        if export_format == "arrow":
+            rows = decoded.num_rows
+        elif export_format == "msgpack":
+            rows = sum(len(batch["id"]) for batch in decoded)
+        else:
+            rows = len(decoded)
+        decode_ms = timed(lambda: decode(body), args.repeat)
+        print(f"{export_format:<9}{rows:>9}{len(body) / 1e6:>9.1f}{server_ms:>11.0f}{decode_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--view", default="compact", choices=("compact", "full"))
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,78 @@
+"""
+Serialization cost per 1,000 jobs: ORM objects + dicts + FastAPI's encoder
+(the old get_jobs path) vs Row tuples + job_row_encoder + orjson.
+
+Rows are fetched once up front, so only the encode/render step is timed.
+
+    DATABASE_URL=postgresql://... python scripts/bench_serialization.py --jobs 1000 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.database import SessionLocal
+from app.models.job import Job
+from app.services.job_projection import JOB_VIEWS, format_tags, job_columns, job_row_encoder
+
+
+def legacy_serialize(jobs, fields):
+    """The pre-orjson path: per-field dict build, str() dates, jsonable_encoder, json.dumps."""
+    payload = []
+    for job in jobs:
+        data = {}
+        for field in fields:
+            if field == "tags":
+                data["tags"] = format_tags(job.tags)
+            elif field == "created_at":
+                data["created_at"] = str(job.created_at)
+            else:
+                data[field] = getattr(job, field, None)
+        payload.append(data)
+    return JSONResponse(jsonable_encoder({"jobs": payload})).body
+
+
+def row_serialize(rows, fields):
+    encode = job_row_encoder(fields)
+    return ORJSONResponse({"jobs": [encode(row) for row in rows]}).body
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(args):
+    with SessionLocal() as db:
+        for view, fields in JOB_VIEWS.items():
+            fields = list(fields)
+            query = db.query(*job_columns(fields)).order_by(Job.created_at.desc()).limit(args.jobs)
+            rows = query.all()
+            objects = db.query(Job).order_by(Job.created_at.desc()).limit(args.jobs).all()
+            if not rows:
+                sys.exit("No jobs in the database; seed some first.")
+            per_thousand = 1000 / len(rows)
+
+            legacy = timed(lambda: legacy_serialize(objects, fields), args.repeat) * per_thousand
+            fast = timed(lambda: row_serialize(rows, fields), args.repeat) * per_thousand
+            print(
+                f"{view:<8} legacy {legacy:7.2f} ms/1k jobs   "
+                f"row+orjson {fast:7.2f} ms/1k jobs   ({legacy / fast:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,102 @@
+"""
+Summary statistics: Python aggregation over fetched rows vs SQL GROUP BY
+queries, run one after another and concurrently.
+
+"python" is the old approach made correct: fetch every row in the window and
+count companies, modalities and tags with Counter. The SQL modes run
+SummaryService's aggregate queries over the same filtered window.
+
+    DATABASE_URL=postgresql://... python scripts/bench_summary.py --seed 1000000 --repeat 5
+
+--seed TRUNCATEs jobs and job_tags and inserts synthetic rows; point
+DATABASE_URL at a throwaway database.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal, engine
+from app.features.summaries.summary_service import SUMMARY_TOP_N, SummaryService
+from app.models.job import Job
+from app.tests.postgres import seed_jobs
+
+
+async def python_stats(period_days, location):
+    async with AsyncSessionLocal() as db:
+        service = SummaryService(db)
+        since_date = datetime.now() - timedelta(days=period_days)
+        criteria = service._window_criteria(since_date, location, [], "any")
+        rows = (await db.execute(select(Job.company, Job.work_modality, Job.tags).where(*criteria))).all()
+        companies, modalities, skills = Counter(), Counter(), Counter()
+        for company, modality, tags in rows:
+            companies[company] += 1
+            modalities[modality] += 1
+            skills.update(service._parse_job_tags(tags))
+        return len(rows), companies.most_common(SUMMARY_TOP_N), skills.most_common(SUMMARY_TOP_N)
+
+
+async def sql_serial_stats(period_days, location):
+    async with AsyncSessionLocal() as db:
+        service = SummaryService(db)
+        since_date = datetime.now() - timedelta(days=period_days)
+        criteria = service._window_criteria(since_date, location, [], "any")
+        return [(await db.execute(query)).all() for query in service._aggregate_queries(since_date, criteria)]
+
+
+async def sql_concurrent_stats(period_days, location):
+    async with AsyncSessionLocal() as db:
+        service = SummaryService(db)
+        since_date = datetime.now() - timedelta(days=period_days)
+        criteria = service._window_criteria(since_date, location, [], "any")
+        return await service._execute_concurrently(service._aggregate_queries(since_date, criteria))
+
+
+async def full_summary(period_days, location):
+    async with AsyncSessionLocal() as db:
+        return await SummaryService(db).get_daily_summary(location=location, period_days=period_days)
+
+
+MODES = {
+    "python": python_stats,
+    "sql-serial": sql_serial_stats,
+    "sql-concurrent": sql_concurrent_stats,
+    "summary": full_summary,
+}
+
+
+async def timed(fn, repeat, *args):
+    await fn(*args)  # warm caches and the pool
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main(args):
+    print(f"{'period':<8}{'location':<10}" + "".join(f"{mode + ' ms':>18}" for mode in MODES))
+    for period_days in args.periods:
+        for location in (None, "remote"):
+            timings = [await timed(fn, args.repeat, period_days, location) for fn in MODES.values()]
+            print(f"{period_days:<8}{location or '-':<10}" + "".join(f"{ms:>18.1f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="truncate and insert this many synthetic jobs first")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--periods", type=int, nargs="+", default=[1, 7, 30])
+    args = parser.parse_args()
+    if args.seed:
+        seed_jobs(engine, args.seed)
+    asyncio.run(main(args))
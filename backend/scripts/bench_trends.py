@@ -0,0 +1,96 @@
+"""
+TrendAnalyzer (whole-matrix NumPy) vs the same statistics computed with
+per-tag Python loops, on a synthetic tags x days matrix of daily job counts.
+
+    python scripts/bench_trends.py --tags 10000 --days 365 --repeat 5
+
+No database needed. "build" is TrendAnalyzer.from_rows() over the sparse
+(tag, day, jobs) rows a rollup query would return.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.analytics.trend_analyzer import WEEK, TrendAnalyzer
+
+
+def synthetic_counts(tags, days, seed=7):
+    """Poisson daily counts with a per-tag base rate and linear drift; most tags are rare."""
+    rng = np.random.default_rng(seed)
+    base = rng.pareto(1.5, size=(tags, 1)) + 0.05
+    drift = rng.normal(0, 0.002, size=(tags, 1))
+    rate = np.clip(base * (1 + drift * np.arange(days)), 0, None)
+    return rng.poisson(rate).astype(np.float64)
+
+
+def python_analyze(values, counts, limit=10, min_jobs=3, window=WEEK, z_threshold=3.0):
+    """The per-tag loop version of TrendAnalyzer.analyze()."""
+    rows = counts.tolist()
+    entries = []
+    for value, row in zip(values, rows):
+        this_week = sum(row[-WEEK:])
+        last_week = sum(row[-2 * WEEK:-WEEK])
+        average = sum(row[-window:]) / window
+        baseline = row[:-1]
+        mean = sum(baseline) / len(baseline)
+        std = (sum((x - mean) ** 2 for x in baseline) / len(baseline)) ** 0.5
+        z_score = (row[-1] - mean) / std if std else 0.0
+        entries.append((value, this_week, last_week, this_week - last_week, average, z_score, row[-1]))
+
+    supported = [entry for entry in entries if max(entry[1], entry[2]) >= min_jobs]
+    risers = sorted((entry for entry in supported if entry[3] > 0), key=lambda entry: -entry[3])[:limit]
+    fallers = sorted((entry for entry in supported if entry[3] < 0), key=lambda entry: entry[3])[:limit]
+    spikes = sorted(
+        (entry for entry in entries if entry[5] >= z_threshold and entry[6] >= min_jobs),
+        key=lambda entry: -entry[5],
+    )[:limit]
+    return risers, fallers, spikes
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main(args):
+    counts = synthetic_counts(args.tags, args.days)
+    values = [f"tag{i}" for i in range(args.tags)]
+    end = date.today()
+    start = end - timedelta(days=args.days - 1)
+
+    tag_index, day_index = np.nonzero(counts)
+    rows = [
+        (values[t], start + timedelta(days=int(d)), int(counts[t, d]))
+        for t, d in zip(tag_index.tolist(), day_index.tolist())
+    ]
+    analyzer = TrendAnalyzer(values, start, counts)
+
+    vectorized = analyzer.analyze(limit=10)
+    looped = python_analyze(values, counts, limit=10)
+    for key, entries in zip(("risers", "fallers", "spikes"), looped):
+        assert [entry["value"] for entry in vectorized[key]] == [entry[0] for entry in entries], key
+
+    print(f"{args.tags} tags x {args.days} days, {len(rows)} non-zero (tag, day) rows")
+    print(f"{'step':<22}{'median ms':>12}")
+    print(f"{'build (from_rows)':<22}{timed(lambda: TrendAnalyzer.from_rows(rows, start, end), args.repeat):>12.1f}")
+    print(f"{'analyze (numpy)':<22}{timed(lambda: analyzer.analyze(limit=10), args.repeat):>12.1f}")
+    print(f"{'analyze (python loops)':<22}{timed(lambda: python_analyze(values, counts, limit=10), args.repeat):>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tags", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { JobsResponse, DailySummaryResponse, Job, AIAnalysisResponse } from '../types/job';
+import type { JobsResponse, JobsBatchResponse, DailySummaryResponse, Job, AIAnalysisResponse } from '../types/job';
 
 const normalizeBaseUrl = (url: string): string => {
     const trimmed = url.replace(/\/$/, '');
@@ -29,8 +29,11 @@ export const jobsApi = {
         page_size?: number;
         search?: string;
         remote?: boolean;
+        view?: 'compact' | 'full';
+        facets?: string;
     }): Promise<JobsResponse> => {
-        const {data} = await api.get('/jobs', { params });
+        // Cards only need the excerpt, so skip full descriptions by default.
+        const {data} = await api.get('/jobs', { params: { view: 'compact', ...params } });
         return data;
     },
 
@@ -39,6 +42,12 @@ export const jobsApi = {
         return data;
     },
 
+    // One request for many jobs (max 200 ids); results keep the order of `ids`.
+    getJobsByIds: async (ids: number[], view: 'compact' | 'full' = 'compact'): Promise<JobsBatchResponse> => {
+        const { data } = await api.get('/jobs/batch', { params: { ids: ids.join(','), view } });
+        return data;
+    },
+
     analyzeJob: async (id: number): Promise<AIAnalysisResponse> => {
         const { data } = await api.get(`/ai/analyze-job/${id}`);
         return data;
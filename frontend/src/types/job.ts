@@ -7,6 +7,7 @@ export interface Job {
   salary_min?: number;
   salary_max?: number;
   description?: string;
+  excerpt?: string;
   url: string;
   remote?: boolean;
   contract_type?: string;
@@ -15,11 +16,22 @@ export interface Job {
   source?: string;
 }
 
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
 export interface JobsResponse {
   jobs: Job[];
   total: number;
   page: number;
   page_size: number;
+  facets?: Partial<Record<'source' | 'work_modality' | 'location' | 'tags', FacetCount[]>>;
+}
+
+export interface JobsBatchResponse {
+  jobs: Job[];
+  missing: number[];
 }
 
 export interface DailySummaryResponse {